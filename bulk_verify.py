@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+"""
+Verifikasi ulang arsip tanda tangan yang besar dengan checkpoint
+
+Arsip adalah file teks dengan satu tanda tangan per baris ("M S1 S2",
+format yang sama dengan output/input cli.py bulk-*). File dibagi menjadi
+range byte yang selaras dengan batas baris; setiap range diverifikasi
+oleh worker dan hasilnya dicatat di file checkpoint JSON yang ditulis
+secara atomik (tulis file sementara lalu os.replace). Jika job berhenti
+di tengah jalan, menjalankan ulang perintah yang sama melanjutkan dari
+range yang belum selesai tanpa menghitung ulang range yang sudah ada.
+
+Range dibuat jauh lebih banyak daripada jumlah worker dan dibagikan lewat
+antrean bersama (imap_unordered), sehingga worker yang selesai lebih cepat
+langsung mengambil range berikutnya dan beban tetap seimbang.
+
+Contoh:
+    python bulk_verify.py archive.txt --key pub.json --checkpoint job.ckpt --jobs 8
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+from typing import List, NamedTuple, Optional, Tuple
+
+from ong_schnorr_shamir import Verifier
+
+CHECKPOINT_VERSION = 1
+MAX_RECORDED_FAILURES = 1000
+
+# Verifier per proses worker, diisi oleh _init_worker
+_verifier = None
+
+
+class RangeResult(NamedTuple):
+    """Hasil verifikasi satu range byte arsip"""
+    start: int
+    end: int
+    ok: int
+    failed: int
+    failures: List[Tuple[int, str]]  # (offset baris, isi baris)
+
+
+def plan_ranges(path: str, range_size: int) -> List[Tuple[int, int]]:
+    """
+    Bagi file menjadi range [start, end) yang dimulai di awal baris
+    """
+    if range_size < 1:
+        raise ValueError("range_size harus >= 1")
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f:
+        position = range_size
+        while position < size:
+            f.seek(position)
+            f.readline()
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+            position = boundary + range_size
+    boundaries.append(size)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)
+            if boundaries[i] < boundaries[i + 1]]
+
+
+def _init_worker(key_path: str) -> None:
+    global _verifier
+    _verifier = Verifier.from_key_file(key_path)
+
+
+def verify_range(path: str, start: int, end: int, verifier: Verifier,
+                 chunk_size: int = 1024) -> RangeResult:
+    """
+    Verifikasi semua baris yang dimulai di dalam [start, end)
+    """
+    ok = failed = 0
+    failures = []
+
+    def flush(batch):
+        nonlocal ok, failed
+        results = verifier.verify_batch([item for _, _, item in batch])
+        for (offset, line, _), valid in zip(batch, results):
+            if valid:
+                ok += 1
+            else:
+                failed += 1
+                failures.append((offset, line))
+
+    batch = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        while offset < end:
+            raw = f.readline()
+            if not raw:
+                break
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                try:
+                    message, s1, s2 = (int(field) for field in line.split())
+                except ValueError:
+                    failed += 1
+                    failures.append((offset, line))
+                else:
+                    batch.append((offset, line, (message, s1, s2)))
+                    if len(batch) >= chunk_size:
+                        flush(batch)
+                        batch = []
+            offset += len(raw)
+    if batch:
+        flush(batch)
+    return RangeResult(start, end, ok, failed, failures)
+
+
+def _verify_range_task(task: Tuple[str, int, int]) -> RangeResult:
+    path, start, end = task
+    return verify_range(path, start, end, _verifier)
+
+
+class BulkVerifyJob:
+    """
+    Job verifikasi arsip yang bisa dilanjutkan dari checkpoint
+    """
+
+    def __init__(self, archive: str, key_path: str, checkpoint_path: str,
+                 range_size: int = 8 << 20, jobs: int = 1, checkpoint_interval: float = 5.0):
+        """
+        Args:
+            archive: File arsip "M S1 S2" per baris
+            key_path: File kunci (publik cukup)
+            checkpoint_path: File checkpoint JSON
+            range_size: Ukuran target satu range dalam byte
+            jobs: Jumlah proses worker
+            checkpoint_interval: Jarak minimum antar penulisan checkpoint (detik)
+        """
+        self.archive = archive
+        self.key_path = key_path
+        self.checkpoint_path = checkpoint_path
+        self.range_size = range_size
+        self.jobs = jobs
+        self.checkpoint_interval = checkpoint_interval
+        self.state = self._load_checkpoint()
+
+    def _new_state(self) -> dict:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "archive": os.path.abspath(self.archive),
+            "archive_size": os.path.getsize(self.archive),
+            "range_size": self.range_size,
+            "done": [],
+            "offset": 0,
+            "ok": 0,
+            "failed": 0,
+            "failures": [],
+        }
+
+    def _load_checkpoint(self) -> dict:
+        if not os.path.exists(self.checkpoint_path):
+            return self._new_state()
+        with open(self.checkpoint_path) as f:
+            state = json.load(f)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError("Versi checkpoint tidak dikenal")
+        if (state["archive_size"] != os.path.getsize(self.archive)
+                or state["range_size"] != self.range_size):
+            raise ValueError("Checkpoint tidak cocok dengan arsip atau range_size ini")
+        return state
+
+    def write_checkpoint(self) -> None:
+        """Tulis checkpoint secara atomik"""
+        done = sorted(tuple(r) for r in self.state["done"])
+        offset = 0
+        for start, end in done:
+            if start != offset:
+                break
+            offset = end
+        self.state["done"] = [list(r) for r in done]
+        self.state["offset"] = offset
+
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def pending_ranges(self) -> List[Tuple[int, int]]:
+        """Range yang belum tercatat selesai di checkpoint"""
+        done = {tuple(r) for r in self.state["done"]}
+        return [r for r in plan_ranges(self.archive, self.range_size) if r not in done]
+
+    def _record(self, result: RangeResult) -> None:
+        self.state["done"].append([result.start, result.end])
+        self.state["ok"] += result.ok
+        self.state["failed"] += result.failed
+        room = MAX_RECORDED_FAILURES - len(self.state["failures"])
+        if room > 0:
+            self.state["failures"].extend([list(f) for f in result.failures[:room]])
+
+    def run(self, max_ranges: Optional[int] = None) -> dict:
+        """
+        Proses range yang tersisa
+
+        Args:
+            max_ranges: Berhenti setelah sejumlah range (None = sampai selesai)
+
+        Returns:
+            Ringkasan: ok, failed, ranges_done, ranges_total, complete
+        """
+        pending = self.pending_ranges()
+        total = len(self.state["done"]) + len(pending)
+        if max_ranges is not None:
+            pending = pending[:max_ranges]
+        tasks = [(self.archive, start, end) for start, end in pending]
+
+        if self.jobs <= 1:
+            _init_worker(self.key_path)
+            results = map(_verify_range_task, tasks)
+            pool = None
+        else:
+            import multiprocessing
+
+            pool = multiprocessing.Pool(self.jobs, _init_worker, (self.key_path,))
+            results = pool.imap_unordered(_verify_range_task, tasks)
+
+        last_checkpoint = time.monotonic()
+        try:
+            for result in results:
+                self._record(result)
+                if time.monotonic() - last_checkpoint >= self.checkpoint_interval:
+                    self.write_checkpoint()
+                    last_checkpoint = time.monotonic()
+        finally:
+            self.write_checkpoint()
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        return {
+            "ok": self.state["ok"],
+            "failed": self.state["failed"],
+            "ranges_done": len(self.state["done"]),
+            "ranges_total": total,
+            "complete": len(self.state["done"]) == total,
+        }
+
+
+def main(argv=None) -> int:
+    """Entry point; exit code 1 jika ada tanda tangan gagal, 3 jika belum selesai"""
+    parser = argparse.ArgumentParser(description="Verifikasi arsip tanda tangan dengan checkpoint")
+    parser.add_argument("archive")
+    parser.add_argument("--key", required=True, help="file kunci (publik cukup)")
+    parser.add_argument("--checkpoint", required=True, help="file checkpoint JSON")
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--range-size", type=int, default=8 << 20, help="ukuran range (byte)")
+    parser.add_argument("--max-ranges", type=int, help="berhenti setelah N range")
+    args = parser.parse_args(argv)
+
+    job = BulkVerifyJob(args.archive, args.key, args.checkpoint,
+                        range_size=args.range_size, jobs=args.jobs)
+    summary = job.run(args.max_ranges)
+    print(json.dumps(summary))
+    if not summary["complete"]:
+        return 3
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+Kalibrasi otomatis ukuran batch dan backend untuk mesin ini
+
+Untuk setiap panjang kunci, routine ini mengukur:
+    sign_chunk_size     ukuran chunk sign_iter (sign_batch per chunk)
+    verify_chunk_size   ukuran chunk verify_iter
+    receive_chunk_size  ukuran chunk receive_iter (saluran subliminal)
+    sieve_backend       "numpy" atau "bytearray" untuk saringan prima
+
+Pemenang setiap pengukuran ditulis ke cache JSON (default
+~/.cache/ong_schnorr_shamir/tuning.json, atau $OSS_TUNING_FILE) yang dibaca
+ong_schnorr_shamir saat parameter tersebut pertama kali dibutuhkan. Panggilan
+dengan chunk_size/use_numpy eksplisit tidak terpengaruh.
+
+Contoh:
+    python calibrate.py --bits 1024 2048 4096
+    python calibrate.py --bits 512 --dry-run
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import timeit
+import platform
+import argparse
+from typing import Callable, Dict, Optional, Sequence
+
+from ong_schnorr_shamir import (
+    DigitalSignature, SubliminalChannel, TUNING_VERSION, default_tuning_path,
+    generate_keys, set_tuning, np,
+)
+from keygen_benchmark import benchmark_primes
+
+DEFAULT_BITS = (1024, 2048, 4096)
+DEFAULT_BATCH_SIZES = (16, 64, 256, 1024)
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _fastest(timings: Dict) -> object:
+    return min(timings, key=timings.get)
+
+
+def calibrate_bits(bits: int, batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+                   items: int = 2048, repeat: int = 3, seed: int = 0,
+                   prime_count: int = 2) -> dict:
+    """
+    Ukur semua kandidat untuk satu panjang kunci
+
+    Returns:
+        Profil berisi parameter pemenang dan waktu per item (detik) untuk
+        setiap kandidat di bawah "timings"
+    """
+    rng = random.Random(seed)
+    n, k, _ = generate_keys(bits, rng=rng)
+    ds = DigitalSignature(n=n, k=k, rng=rng)
+    sc = SubliminalChannel(n=n, k=k, rng=rng)
+
+    messages = [rng.randrange(2, n) for _ in range(items)]
+    signed = [(m, s1, s2) for m, (s1, s2, _) in zip(messages, ds.sign_batch(messages))]
+    covers = [(m, *sc.create_subliminal_message(rng.randrange(2, n), m)[:2]) for m in messages]
+
+    paths = {
+        "sign_chunk_size": lambda size: list(ds.sign_iter(messages, size)),
+        "verify_chunk_size": lambda size: list(ds.verify_iter(signed, size)),
+        "receive_chunk_size": lambda size: list(sc.receive_iter(covers, size)),
+    }
+    profile = {"timings": {}}
+    for name, run in paths.items():
+        timings = {size: _best(lambda: run(size), repeat) / items for size in batch_sizes}
+        profile[name] = _fastest(timings)
+        profile["timings"][name] = {str(size): t for size, t in timings.items()}
+
+    backends = ("bytearray", "numpy") if np is not None else ("bytearray",)
+    primes = benchmark_primes([bits], count=prime_count, seed=seed, backends=backends)
+    timings = {row["backend"]: row["seconds_per_prime"] for row in primes}
+    profile["sieve_backend"] = _fastest(timings)
+    profile["timings"]["sieve_backend"] = timings
+    return profile
+
+
+def calibrate(bits_list: Sequence[int] = DEFAULT_BITS,
+              batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+              items: int = 2048, repeat: int = 3, seed: int = 0,
+              prime_count: int = 2, progress: Optional[Callable[[int], None]] = None) -> dict:
+    """
+    Kalibrasi semua panjang kunci dan kembalikan isi cache tuning
+
+    Args:
+        bits_list: Panjang kunci yang dikalibrasi
+        batch_sizes: Kandidat ukuran chunk
+        items: Jumlah item per pengukuran jalur sign/verify/receive
+        repeat: Pengulangan per kandidat (diambil yang tercepat)
+        seed: Seed untuk kunci dan pesan uji
+        prime_count: Jumlah prima per backend saringan
+        progress: Callback opsional, dipanggil dengan bits sebelum diukur
+    """
+    profiles = {}
+    for bits in bits_list:
+        if progress is not None:
+            progress(bits)
+        profiles[str(bits)] = calibrate_bits(bits, batch_sizes, items, repeat, seed, prime_count)
+    return {
+        "version": TUNING_VERSION,
+        "created": time.time(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+        "profiles": profiles,
+    }
+
+
+def save_tuning(data: dict, path: Optional[str] = None) -> str:
+    """
+    Tulis hasil calibrate() ke cache secara atomik dan aktifkan di proses ini
+
+    Returns:
+        Path file yang ditulis
+    """
+    path = path or default_tuning_path()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+    set_tuning({int(bits): profile for bits, profile in data["profiles"].items()})
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Kalibrasi ukuran batch dan backend")
+    parser.add_argument("--bits", type=int, nargs="+", default=list(DEFAULT_BITS))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--items", type=int, default=2048, help="item per pengukuran")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file cache (default: lokasi cache tuning)")
+    parser.add_argument("--dry-run", action="store_true", help="tampilkan hasil tanpa menyimpan")
+    args = parser.parse_args(argv)
+
+    data = calibrate(args.bits, args.batch_sizes, args.items, args.repeat, args.seed,
+                     progress=lambda bits: print(f"⏳ Kalibrasi {bits}-bit..."))
+    print(f"{'bits':>6}  {'sign':>6} {'verify':>7} {'receive':>8}  sieve")
+    for bits, profile in data["profiles"].items():
+        print(f"{bits:>6}  {profile['sign_chunk_size']:>6} {profile['verify_chunk_size']:>7} "
+              f"{profile['receive_chunk_size']:>8}  {profile['sieve_backend']}")
+    if not args.dry_run:
+        print(f"💾 Disimpan ke {save_tuning(data, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+"""
+Command-line interface untuk algoritma Ong-Schnorr-Shamir
+
+Berbeda dengan demo.py yang interaktif, script ini dirancang untuk
+dipanggil dari shell script. Library hanya di-import ketika subcommand
+benar-benar dijalankan, dan kunci dibaca dari file (bukan dibuat ulang),
+sehingga startup tetap cepat.
+
+Contoh:
+    python cli.py keygen --bits 512 --out keys.json --public-out pub.json
+    python cli.py sign --key keys.json 12345
+    python cli.py verify --key pub.json 12345 <S1> <S2>
+    python cli.py encode --key keys.json 9876 5432
+    python cli.py decode --key keys.json <S1> <S2>
+    cat messages.txt | python cli.py bulk-sign --key keys.json --jobs 4
+    python cli.py bulk-verify --key pub.json signed.tsv
+    python cli.py profile --key keys.json --ops sign verify --output-dir prof/
+
+Subcommand tunggal menulis satu baris JSON ke stdout. Subcommand bulk-*
+membaca satu item per baris (dari file atau stdin) dan menulis hasil
+per baris dalam format TSV secara streaming.
+"""
+
+import argparse
+import collections
+import fileinput
+import itertools
+import json
+import sys
+
+import workload_profile
+
+
+# State per proses worker untuk bulk-*, diisi oleh _init_worker
+_worker = None
+
+
+def _emit(result: dict) -> None:
+    """Tulis hasil sebagai satu baris JSON"""
+    sys.stdout.write(json.dumps(result) + "\n")
+
+
+def cmd_keygen(args) -> int:
+    """Generate kunci baru dan simpan ke file"""
+    from ong_schnorr_shamir import OngSchnorrShamir, save_keys
+
+    oss = OngSchnorrShamir(composite=args.composite, bits=args.bits, prime_kind=args.prime_kind)
+    save_keys(args.out, oss)
+    if args.public_out:
+        save_keys(args.public_out, oss, include_private=False)
+    _emit({"n_bits": oss.n.bit_length(), "composite": oss.is_composite, "out": args.out})
+    return 0
+
+
+def cmd_sign(args) -> int:
+    """Tanda tangani pesan dengan kunci privat"""
+    from ong_schnorr_shamir import DigitalSignature
+
+    ds = DigitalSignature.from_key_file(args.key)
+    s1, s2, _ = ds.sign_message(args.message)
+    _emit({"message": args.message, "s1": s1, "s2": s2})
+    return 0
+
+
+def cmd_verify(args) -> int:
+    """Verifikasi tanda tangan; exit code 0 jika valid, 1 jika tidak"""
+    from ong_schnorr_shamir import Verifier
+
+    verifier = Verifier.from_key_file(args.key)
+    is_valid = verifier.verify(args.message, args.s1, args.s2)
+    _emit({"message": args.message, "valid": is_valid})
+    return 0 if is_valid else 1
+
+
+def cmd_encode(args) -> int:
+    """Sembunyikan pesan asli di dalam pesan samaran"""
+    from ong_schnorr_shamir import SubliminalChannel
+
+    sc = SubliminalChannel.from_key_file(args.key)
+    s1, s2, cover = sc.create_subliminal_message(args.original, args.cover)
+    _emit({"cover": cover, "s1": s1, "s2": s2})
+    return 0
+
+
+def cmd_decode(args) -> int:
+    """Dekripsi pesan asli dari tanda tangan subliminal"""
+    from ong_schnorr_shamir import SubliminalChannel
+
+    sc = SubliminalChannel.from_key_file(args.key)
+    _emit({"original": sc.decrypt_original_message(args.s1, args.s2)})
+    return 0
+
+
+def _init_worker(key_path: str, mode: str) -> None:
+    """Muat kunci sekali per proses worker"""
+    global _worker
+    if mode == "sign":
+        from ong_schnorr_shamir import DigitalSignature
+
+        _worker = DigitalSignature.from_key_file(key_path)
+    else:
+        from ong_schnorr_shamir import Verifier
+
+        _worker = Verifier.from_key_file(key_path)
+
+
+def _sign_chunk(lines: list) -> str:
+    """
+    Tanda tangani satu chunk (nomor baris, baris pesan)
+
+    Returns:
+        Baris TSV "M<TAB>S1<TAB>S2" yang sudah digabung
+    """
+    messages = []
+    for lineno, line in lines:
+        try:
+            messages.append(int(line))
+        except ValueError:
+            raise ValueError(f"Baris pesan {lineno} tidak valid: {line!r}")
+    signatures = _worker.sign_batch(messages)
+    return "".join(
+        f"{message}\t{s1}\t{s2}\n" for message, (s1, s2, _) in zip(messages, signatures)
+    )
+
+
+def _verify_chunk(lines: list) -> str:
+    """
+    Verifikasi satu chunk (nomor baris, baris "M S1 S2")
+
+    Baris rusak tidak menghentikan stream: baris itu dihitung gagal dan
+    ditulis sebagai "baris N: '<isi>'<TAB>FAIL", sama seperti bulk_verify.py
+    mencatatnya sebagai kegagalan.
+
+    Returns:
+        Baris TSV "M<TAB>OK" atau "M<TAB>FAIL" yang sudah digabung
+    """
+    labels = []
+    items = []
+    for lineno, line in lines:
+        try:
+            message, s1, s2 = (int(field) for field in line.split())
+        except ValueError:
+            labels.append(f"baris {lineno}: {line!r}")
+            continue
+        labels.append(None)
+        items.append((message, s1, s2))
+    results = iter(zip(items, _worker.verify_batch(items)))
+    output = []
+    for label in labels:
+        if label is not None:
+            output.append(f"{label}\tFAIL\n")
+        else:
+            (message, _, _), valid = next(results)
+            output.append(f"{message}\t{'OK' if valid else 'FAIL'}\n")
+    return "".join(output)
+
+
+def _read_chunks(files: list, chunk_size: int):
+    """
+    Baca baris non-kosong dari file/stdin dalam chunk berukuran tetap
+
+    Setiap elemen chunk berupa (nomor baris, baris); nomor baris dihitung
+    dari 1 melintasi semua file input.
+    """
+    lines = enumerate((line.strip() for line in fileinput.input(files or ["-"])), 1)
+    lines = ((lineno, line) for lineno, line in lines if line)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _bounded_imap(pool, func, chunks, max_pending: int):
+    """
+    Seperti pool.imap, tetapi paling banyak max_pending chunk yang sedang
+    diproses sehingga input tak terbatas tidak menumpuk di memori
+    """
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(func, (chunk,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _run_bulk(args, mode: str, func) -> int:
+    """Jalankan bulk-sign/bulk-verify secara streaming"""
+    chunks = _read_chunks(args.files, args.chunk_size)
+    failures = 0
+
+    if args.jobs <= 1:
+        _init_worker(args.key, mode)
+        outputs = map(func, chunks)
+        pool = None
+    else:
+        import multiprocessing
+
+        pool = multiprocessing.Pool(args.jobs, _init_worker, (args.key, mode))
+        outputs = _bounded_imap(pool, func, chunks, args.jobs * 2)
+
+    try:
+        for output in outputs:
+            sys.stdout.write(output)
+            if mode == "verify":
+                failures += output.count("\tFAIL\n")
+        sys.stdout.flush()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return 1 if failures else 0
+
+
+def cmd_bulk_sign(args) -> int:
+    """Tanda tangani pesan per baris dari file/stdin"""
+    return _run_bulk(args, "sign", _sign_chunk)
+
+
+def cmd_bulk_verify(args) -> int:
+    """Verifikasi baris "M S1 S2" dari file/stdin; exit code 1 jika ada yang gagal"""
+    return _run_bulk(args, "verify", _verify_chunk)
+
+
+def cmd_profile(args) -> int:
+    """Jalankan workload di bawah cProfile/tracemalloc (lihat workload_profile.py)"""
+    return workload_profile.run(args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Bangun parser argumen untuk semua subcommand"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Ong-Schnorr-Shamir command-line tools"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    keygen = subparsers.add_parser("keygen", help="generate kunci baru")
+    keygen.add_argument("--bits", type=int, default=512)
+    keygen.add_argument("--composite", action="store_true", help="n = p * q dengan CRT")
+    keygen.add_argument("--prime-kind", choices=("plain", "safe", "strong"), default="plain",
+                        help="jenis prima untuk n atau faktornya")
+    keygen.add_argument("--out", required=True, help="file kunci privat")
+    keygen.add_argument("--public-out", help="file kunci publik (n, h)")
+    keygen.set_defaults(func=cmd_keygen)
+
+    sign = subparsers.add_parser("sign", help="tanda tangani pesan")
+    sign.add_argument("--key", required=True)
+    sign.add_argument("message", type=int)
+    sign.set_defaults(func=cmd_sign)
+
+    verify = subparsers.add_parser("verify", help="verifikasi tanda tangan")
+    verify.add_argument("--key", required=True)
+    verify.add_argument("message", type=int)
+    verify.add_argument("s1", type=int)
+    verify.add_argument("s2", type=int)
+    verify.set_defaults(func=cmd_verify)
+
+    encode = subparsers.add_parser("encode", help="buat pesan subliminal")
+    encode.add_argument("--key", required=True)
+    encode.add_argument("original", type=int)
+    encode.add_argument("cover", type=int)
+    encode.set_defaults(func=cmd_encode)
+
+    decode = subparsers.add_parser("decode", help="dekripsi pesan subliminal")
+    decode.add_argument("--key", required=True)
+    decode.add_argument("s1", type=int)
+    decode.add_argument("s2", type=int)
+    decode.set_defaults(func=cmd_decode)
+
+    for name, func, help_text in (
+        ("bulk-sign", cmd_bulk_sign, "tanda tangani pesan per baris"),
+        ("bulk-verify", cmd_bulk_verify, "verifikasi baris 'M S1 S2'"),
+    ):
+        bulk = subparsers.add_parser(name, help=help_text)
+        bulk.add_argument("--key", required=True)
+        bulk.add_argument("--jobs", type=int, default=1, help="jumlah proses worker")
+        bulk.add_argument("--chunk-size", type=int, default=1000)
+        bulk.add_argument("files", nargs="*", help="file input (default: stdin)")
+        bulk.set_defaults(func=func)
+
+    profile = subparsers.add_parser("profile", help="profil waktu dan memori workload")
+    workload_profile.add_arguments(profile)
+    profile.set_defaults(func=cmd_profile)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Entry point CLI"""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
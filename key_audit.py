@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""
+Audit faktor bersama antar modulus n (Bernstein batch GCD)
+
+Modulus yang dibuat dengan RNG lemah bisa berulang atau berbagi faktor
+prima. Membandingkan semua pasangan dengan math.gcd butuh O(N^2) operasi;
+batch GCD memakai product tree dan remainder tree sehingga semua modulus
+yang berbagi faktor dengan modulus lain ditemukan dalam waktu kuasi-linear:
+
+    P   = n_1 * n_2 * ... * n_N            (product tree)
+    z_i = P mod n_i^2                      (remainder tree)
+    g_i = gcd(n_i, z_i / n_i)              (g_i > 1  =>  n_i bermasalah)
+
+Contoh:
+    python key_audit.py --jobs 4 keys/ moduli.txt
+"""
+
+import sys
+import os
+import math
+import argparse
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+
+class AuditFinding(NamedTuple):
+    """Modulus yang berbagi faktor dengan modulus lain"""
+    index: int      # Posisi modulus dalam input
+    source: str     # Asal modulus (file:baris)
+    n: int          # Modulus
+    divisor: int    # gcd(n, produk modulus lain); == n jika duplikat/semua faktor bocor
+
+
+def product_tree(values: List[int]) -> List[List[int]]:
+    """
+    Bangun product tree; level 0 adalah input, level terakhir berisi produk total
+    """
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        parent = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parent.append(level[-1])
+        tree.append(parent)
+    return tree
+
+
+def remainder_tree(tree: List[List[int]], root_remainder: int) -> List[int]:
+    """
+    Turunkan root_remainder ke daun: hasilnya root_remainder mod x^2 untuk
+    setiap daun x (cukup karena x^2 membagi kuadrat semua leluhurnya)
+    """
+    remainders = [root_remainder]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % (x * x) for i, x in enumerate(level)]
+    return remainders
+
+
+def _leaf_gcds(moduli: List[int], remainders: List[int]) -> List[int]:
+    """g_i = gcd(n_i, (P mod n_i^2) / n_i)"""
+    return [math.gcd(n, z // n) for n, z in zip(moduli, remainders)]
+
+
+def _chunk_product(chunk: List[int]) -> int:
+    """Worker: produk satu chunk modulus"""
+    return product_tree(chunk)[-1][0]
+
+
+def _chunk_gcds(args: Tuple[List[int], int]) -> List[int]:
+    """Worker: remainder tree satu chunk mulai dari P mod (produk chunk)^2"""
+    chunk, root_remainder = args
+    return _leaf_gcds(chunk, remainder_tree(product_tree(chunk), root_remainder))
+
+
+def batch_gcd(moduli: List[int], jobs: int = 1) -> List[int]:
+    """
+    Hitung gcd(n_i, produk semua modulus lain) untuk setiap modulus
+
+    Args:
+        moduli: Daftar modulus (bilangan bulat > 1)
+        jobs: Jumlah proses; > 1 membagi input menjadi chunk yang
+            product/remainder tree-nya dihitung paralel. Tree di atas
+            produk chunk tetap dihitung di proses induk, termasuk
+            perkalian tingkat teratas (P) dan reduksi pertama P mod X^2
+            yang merupakan langkah termahal; karena itu percepatan
+            dengan jobs > 1 jauh di bawah linear
+
+    Returns:
+        List g_i dengan urutan yang sama seperti input (1 = aman)
+    """
+    if any(n < 2 for n in moduli):
+        raise ValueError("Semua modulus harus > 1")
+    if len(moduli) < 2:
+        return [1] * len(moduli)
+
+    if jobs <= 1 or len(moduli) < 2 * jobs:
+        tree = product_tree(moduli)
+        return _leaf_gcds(moduli, remainder_tree(tree, tree[-1][0]))
+
+    import multiprocessing
+
+    size = -(-len(moduli) // jobs)
+    chunks = [moduli[i:i + size] for i in range(0, len(moduli), size)]
+    with multiprocessing.Pool(jobs) as pool:
+        chunk_products = pool.map(_chunk_product, chunks)
+        # Tingkat teratas (perkalian terbesar dan P mod X^2 pertama) serial di induk
+        top = product_tree(chunk_products)
+        chunk_remainders = remainder_tree(top, top[-1][0])
+        results = pool.map(_chunk_gcds, list(zip(chunks, chunk_remainders)))
+    return [g for chunk_result in results for g in chunk_result]
+
+
+def read_moduli(paths: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Baca modulus dari file secara streaming
+
+    File .json dibaca sebagai file kunci (save_keys); file lain berisi satu
+    modulus per baris (desimal, atau heksadesimal dengan awalan 0x).
+    Direktori dibaca rekursif.
+
+    Yields:
+        (source, n)
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                yield from read_moduli(os.path.join(root, name) for name in sorted(files))
+        elif path.endswith(".json"):
+            from ong_schnorr_shamir import load_keys
+
+            yield path, load_keys(path)["n"]
+        else:
+            with open(path) as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        yield f"{path}:{line_no}", int(line, 0)
+
+
+def audit_moduli(entries: Iterable[Tuple[str, int]], jobs: int = 1) -> List[AuditFinding]:
+    """
+    Jalankan batch GCD atas (source, n) dan kembalikan modulus yang bermasalah
+    """
+    sources, moduli = [], []
+    for source, n in entries:
+        sources.append(source)
+        moduli.append(n)
+
+    return [
+        AuditFinding(i, sources[i], moduli[i], g)
+        for i, g in enumerate(batch_gcd(moduli, jobs))
+        if g != 1
+    ]
+
+
+def main(argv=None) -> int:
+    """Entry point; exit code 1 jika ada modulus yang berbagi faktor"""
+    parser = argparse.ArgumentParser(description="Audit faktor bersama antar modulus (batch GCD)")
+    parser.add_argument("paths", nargs="+", help="file kunci .json, file daftar modulus, atau direktori")
+    parser.add_argument("--jobs", type=int, default=1, help="jumlah proses worker")
+    args = parser.parse_args(argv)
+
+    findings = audit_moduli(read_moduli(args.paths), args.jobs)
+    for finding in findings:
+        # WHOLE: seluruh n terbagi (duplikat, atau kedua faktornya bocor)
+        kind = "WHOLE" if finding.divisor == finding.n else "SHARED"
+        print(f"{kind}\t{finding.source}\t{finding.divisor}")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
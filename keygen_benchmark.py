@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark pembangkitan prima untuk key generation
+
+Membandingkan tiga cara mencari prima `bits` bit:
+    naive      kandidat acak ganjil, Miller-Rabin pada setiap kandidat
+    bytearray  saringan bersegmen terhadap tabel prima kecil (tanpa NumPy)
+    numpy      saringan bersegmen dengan residu dan penandaan vektor
+
+Contoh:
+    python keygen_benchmark.py --bits 1024 2048 4096 --count 3
+"""
+
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Sequence
+
+from ong_schnorr_shamir import _miller_rabin, _sieve_table, _sieved_prime, np
+
+BACKENDS = ("naive", "bytearray", "numpy")
+
+
+def _naive_prime(bits: int, rng: random.Random) -> int:
+    top = 1 << (bits - 1)
+    while True:
+        candidate = rng.getrandbits(bits) | top | 1
+        if _miller_rabin(candidate, 5, rng):
+            return candidate
+
+
+def benchmark_primes(bits_list: Sequence[int], count: int = 3, seed: int = 0,
+                     backends: Sequence[str] = BACKENDS) -> List[Dict]:
+    """
+    Ukur waktu rata-rata per prima untuk setiap (bits, backend)
+
+    Backend numpy dilewati jika NumPy tidak terpasang.
+
+    Returns:
+        List dict berisi bits, backend, seconds_per_prime, speedup (relatif naive)
+    """
+    results = []
+    for bits in bits_list:
+        baseline = None
+        for backend in backends:
+            if backend == "numpy" and np is None:
+                continue
+            rng = random.Random(seed)
+            if backend == "naive":
+                generate = lambda: _naive_prime(bits, rng)
+            else:
+                table = _sieve_table(bits, use_numpy=backend == "numpy")
+                generate = lambda: _sieved_prime(bits, rng, 5, table)
+
+            start = time.perf_counter()
+            for _ in range(count):
+                generate()
+            elapsed = (time.perf_counter() - start) / count
+            if backend == "naive":
+                baseline = elapsed
+            results.append({
+                "bits": bits,
+                "backend": backend,
+                "seconds_per_prime": elapsed,
+                "speedup": baseline / elapsed if baseline and elapsed > 0 else None,
+            })
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pembangkitan prima")
+    parser.add_argument("--bits", type=int, nargs="+", default=[1024, 2048, 4096])
+    parser.add_argument("--count", type=int, default=3, help="prima per konfigurasi")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=BACKENDS, nargs="+", default=list(BACKENDS))
+    args = parser.parse_args(argv)
+
+    if np is None and "numpy" in args.backend:
+        print("ℹ️  NumPy tidak terpasang; backend numpy dilewati")
+    print(f"{'bits':>6}  {'backend':<10} {'detik/prima':>12}  {'speedup':>8}")
+    for row in benchmark_primes(args.bits, args.count, args.seed, args.backend):
+        speedup = f"{row['speedup']:.1f}x" if row["speedup"] else "-"
+        print(f"{row['bits']:>6}  {row['backend']:<10} {row['seconds_per_prime']:>12.4f}  {speedup:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
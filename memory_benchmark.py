@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark memori per tanda tangan untuk jalur sign single, batch, streaming
+dan kolumnar
+
+    single     [sign_message(m) for m in messages]       hasil disimpan
+    batch      sign_batch per chunk, semua hasil disimpan
+    streaming  sign_iter dikonsumsi tanpa menyimpan hasil
+    columnar   SignatureArray.from_signatures(sign_iter(...))
+
+Setiap jalur diukur dua kali: sekali dengan sampling RSS (/proc/self/statm)
+dan sekali di bawah tracemalloc, karena tracemalloc sendiri menambah RSS.
+Angka tracemalloc deterministik dan dipakai untuk budget di test_memory.py;
+RSS hanya informatif karena allocator tidak selalu mengembalikan memori ke
+OS.
+
+Satuan:
+    retained_per_item  byte yang masih dipegang hasil, per tanda tangan
+    peak_per_item      puncak alokasi per item "hidup": per tanda tangan
+                       untuk jalur yang menyimpan hasil, per item chunk
+                       untuk streaming (memori harus dibatasi chunk)
+
+Contoh:
+    python memory_benchmark.py --bits 1024 2048 --batch-sizes 64 1024
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ong_schnorr_shamir import DigitalSignature, generate_keys
+from signature_array import SignatureArray
+from workload_profile import profile_memory
+
+PATHS = ("single", "batch", "streaming", "columnar")
+
+
+def _read_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RssSampler:
+    """
+    Sampling RSS proses di thread latar selama blok `with`
+
+    peak_delta berisi kenaikan RSS tertinggi terhadap awal blok, atau None
+    jika RSS tidak bisa dibaca (mis. bukan Linux).
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.peak_delta: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self, start: int) -> None:
+        peak = start
+        while True:
+            rss = _read_rss()
+            if rss is not None:
+                peak = max(peak, rss)
+            if self._stop.wait(self.interval):
+                break
+        self.peak_delta = peak - start
+
+    def __enter__(self) -> "RssSampler":
+        start = _read_rss()
+        if start is not None:
+            self._thread = threading.Thread(target=self._sample, args=(start,), daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def path_runner(path: str, ds: DigitalSignature, messages: Sequence[int],
+                batch_size: int) -> Callable[[], object]:
+    """Callable yang menjalankan satu jalur sign terhadap semua pesan"""
+    if path == "single":
+        return lambda: [ds.sign_message(m) for m in messages]
+    if path == "batch":
+        def run():
+            signatures = []
+            for start in range(0, len(messages), batch_size):
+                signatures.extend(ds.sign_batch(messages[start:start + batch_size]))
+            return signatures
+        return run
+    if path == "streaming":
+        return lambda: sum(1 for _ in ds.sign_iter(messages, batch_size))
+    if path == "columnar":
+        return lambda: SignatureArray.from_signatures(ds.n, ds.sign_iter(messages, batch_size))
+    raise ValueError(f"Jalur tidak dikenal: {path}")
+
+
+def measure_path(path: str, ds: DigitalSignature, messages: Sequence[int],
+                 batch_size: int) -> dict:
+    """
+    Ukur satu jalur
+
+    Returns:
+        Dict path, bits, batch_size, items, retained_per_item, peak_per_item,
+        rss_peak_bytes (None jika tidak tersedia)
+    """
+    run = path_runner(path, ds, messages, batch_size)
+    with RssSampler() as sampler:
+        run()
+    report = profile_memory(run, top=0)
+
+    count = len(messages)
+    live = min(batch_size, count) if path == "streaming" else count
+    return {
+        "path": path,
+        "bits": ds.n.bit_length(),
+        "batch_size": batch_size,
+        "items": count,
+        "retained_per_item": report["net_bytes"] / count,
+        "peak_per_item": report["peak_bytes"] / live,
+        "rss_peak_bytes": sampler.peak_delta,
+    }
+
+
+def benchmark_memory(bits_list: Sequence[int], batch_sizes: Sequence[int] = (64, 256, 1024),
+                     count: int = 2048, paths: Sequence[str] = PATHS,
+                     seed: int = 0) -> List[Dict]:
+    """
+    Ukur semua kombinasi (bits, batch_size, jalur)
+
+    Jalur single tidak bergantung pada batch_size dan hanya diukur sekali
+    per ukuran kunci (dengan batch_size pertama).
+    """
+    results = []
+    for bits in bits_list:
+        rng = random.Random(seed)
+        n, k, _ = generate_keys(bits, rng=rng)
+        ds = DigitalSignature(n=n, k=k, rng=rng)
+        messages = [rng.randrange(2, n) for _ in range(count)]
+        for index, batch_size in enumerate(batch_sizes):
+            for path in paths:
+                if path == "single" and index:
+                    continue
+                results.append(measure_path(path, ds, messages, batch_size))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark memori per tanda tangan")
+    parser.add_argument("--bits", type=int, nargs="+", default=[512, 1024, 2048])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--count", type=int, default=2048, help="tanda tangan per jalur")
+    parser.add_argument("--paths", choices=PATHS, nargs="+", default=list(PATHS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'bits':>6} {'batch':>6}  {'jalur':<10} {'retained/item':>14} {'peak/item':>10} {'RSS peak':>10}")
+    start = time.perf_counter()
+    for row in benchmark_memory(args.bits, args.batch_sizes, args.count, args.paths, args.seed):
+        rss = f"{row['rss_peak_bytes'] / 1024:.0f} KiB" if row["rss_peak_bytes"] is not None else "-"
+        print(f"{row['bits']:>6} {row['batch_size']:>6}  {row['path']:<10} "
+              f"{row['retained_per_item']:>12.0f} B {row['peak_per_item']:>8.0f} B {rss:>10}")
+    print(f"⏱️  {time.perf_counter() - start:.1f} detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
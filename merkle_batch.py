@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""
+Merkle-batched signing: satu tanda tangan OSS untuk banyak pesan
+
+Alih-alih menandatangani setiap pesan, sebuah Merkle tree (SHA-256)
+dibangun atas seluruh batch dan hanya root-nya yang ditandatangani dengan
+DigitalSignature. Setiap pesan mendapat inclusion proof berukuran
+ceil(log2 N) hash; verifier cukup memeriksa proof tersebut ditambah satu
+verifikasi root yang di-cache untuk seluruh batch.
+
+Hash daun dan node diberi prefix berbeda (0x00 / 0x01) agar node internal
+tidak bisa dipalsukan sebagai daun. Node tanpa pasangan dinaikkan apa
+adanya (tidak diduplikasi).
+"""
+
+import hashlib
+from typing import List, NamedTuple, Sequence, Tuple, Union
+
+from ong_schnorr_shamir import DigitalSignature, Verifier, VerificationCache
+
+Message = Union[bytes, int]
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+DIGEST_BITS = 256
+
+
+class BatchSignature(NamedTuple):
+    """Tanda tangan OSS atas root Merkle satu batch"""
+    root: bytes
+    s1: int
+    s2: int
+    size: int
+
+
+class InclusionProof(NamedTuple):
+    """
+    Hash saudara dari daun ke root; arah tiap langkah diturunkan dari index
+    dan ukuran batch, sehingga proof terikat pada posisi pesan
+    """
+    index: int
+    siblings: Tuple[bytes, ...]
+
+
+def encode_message(message: Message) -> bytes:
+    """
+    Encoding pesan yang tidak ambigu antara bytes dan int
+    """
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return b"b" + bytes(message)
+    if isinstance(message, int):
+        length = (message.bit_length() + 8) // 8
+        return b"i" + message.to_bytes(length, "big", signed=True)
+    raise TypeError("Pesan harus bytes atau int")
+
+
+def leaf_hash(message: Message) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + encode_message(message)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def build_tree(leaves: List[bytes]) -> List[List[bytes]]:
+    """
+    Bangun semua level Merkle tree; level 0 = daun, level terakhir = [root]
+    """
+    if not leaves:
+        raise ValueError("Batch tidak boleh kosong")
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parent = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parent.append(level[-1])
+        levels.append(parent)
+    return levels
+
+
+def _proof_for(levels: List[List[bytes]], index: int) -> InclusionProof:
+    siblings = []
+    position = index
+    for level in levels[:-1]:
+        sibling = position ^ 1
+        if sibling < len(level):
+            siblings.append(level[sibling])
+        position //= 2
+    return InclusionProof(index, tuple(siblings))
+
+
+def root_from_proof(message: Message, proof: InclusionProof, size: int) -> bytes:
+    """
+    Hitung ulang root dari pesan dan inclusion proof-nya
+
+    Args:
+        size: Jumlah pesan dalam batch (menentukan bentuk tree)
+    """
+    digest = leaf_hash(message)
+    siblings = iter(proof.siblings)
+    position, width = proof.index, size
+    while width > 1:
+        sibling = position ^ 1
+        if sibling < width:
+            sibling_hash = next(siblings)
+            if sibling < position:
+                digest = node_hash(sibling_hash, digest)
+            else:
+                digest = node_hash(digest, sibling_hash)
+        position //= 2
+        width = (width + 1) // 2
+    if next(siblings, None) is not None:
+        raise ValueError("Proof berisi hash berlebih")
+    return digest
+
+
+def sign_merkle_batch(signer: DigitalSignature,
+                      messages: Sequence[Message]) -> Tuple[BatchSignature, List[InclusionProof]]:
+    """
+    Tanda tangani satu batch pesan dengan satu tanda tangan OSS
+
+    Args:
+        signer: DigitalSignature dengan n lebih dari 256 bit
+        messages: Pesan (bytes atau int)
+
+    Returns:
+        Tuple (BatchSignature, list InclusionProof per pesan sesuai urutan input)
+    """
+    if signer.n.bit_length() <= DIGEST_BITS:
+        raise ValueError("n harus lebih dari 256 bit untuk menandatangani root SHA-256")
+
+    levels = build_tree([leaf_hash(message) for message in messages])
+    root = levels[-1][0]
+    s1, s2, _ = signer.sign_message(int.from_bytes(root, "big"))
+    proofs = [_proof_for(levels, i) for i in range(len(messages))]
+    return BatchSignature(root, s1, s2, len(messages)), proofs
+
+
+class MerkleVerifier:
+    """
+    Verifikasi pesan individual dari batch Merkle
+
+    Verifikasi OSS atas root di-cache, sehingga memeriksa N pesan dari batch
+    yang sama hanya butuh satu verifikasi tanda tangan ditambah N proof hash.
+    """
+
+    def __init__(self, n: int, h: int, cache_size: int = 1024):
+        """
+        Args:
+            n, h: Kunci publik penanda tangan
+            cache_size: Jumlah root terverifikasi yang diingat
+        """
+        self.verifier = Verifier(n, h)
+        self.root_cache = VerificationCache(maxsize=cache_size)
+
+    def verify_root(self, batch: BatchSignature) -> bool:
+        """Verifikasi tanda tangan OSS atas root (hasil positif di-cache)"""
+        return self.root_cache.get_or_verify(
+            self.verifier.n, self.verifier.h, int.from_bytes(batch.root, "big"), batch.s1, batch.s2,
+            self.verifier.verify
+        )
+
+    def verify(self, message: Message, proof: InclusionProof, batch: BatchSignature) -> bool:
+        """
+        Verifikasi bahwa pesan termasuk dalam batch yang ditandatangani
+
+        Returns:
+            True jika proof valid dan root ditandatangani oleh kunci ini
+        """
+        if not 0 <= proof.index < batch.size:
+            return False
+        try:
+            if root_from_proof(message, proof, batch.size) != batch.root:
+                return False
+        except (TypeError, ValueError, StopIteration):
+            return False
+        return self.verify_root(batch)
@@ -1,6 +1,866 @@
+import os
 import random
 import math
-from typing import Tuple, Optional
+import json
+import time
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
+import itertools
+from itertools import islice
+from typing import Tuple, Optional, List, Sequence, Iterable, Iterator, Callable, Any, Dict, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: saringan kandidat memakai bytearray
+    np = None
+
+
+def _batch_inverse(values: Sequence[int], modulus: int) -> List[int]:
+    """
+    Hitung invers modular dari banyak nilai dengan satu kali pow(x, -1, n)
+    (Montgomery batch inversion: 3(m-1) perkalian + 1 invers)
+    """
+    count = len(values)
+    if count == 0:
+        return []
+    
+    prefix = [0] * count
+    acc = 1
+    for i, value in enumerate(values):
+        acc = (acc * value) % modulus
+        prefix[i] = acc
+    
+    inv_acc = pow(acc, -1, modulus)
+    inverses = [0] * count
+    for i in range(count - 1, 0, -1):
+        inverses[i] = (inv_acc * prefix[i - 1]) % modulus
+        inv_acc = (inv_acc * values[i]) % modulus
+    inverses[0] = inv_acc
+    return inverses
+
+
+def _chunked(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Potong iterable menjadi list berukuran paling banyak chunk_size secara lazy
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size harus >= 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _verify_batch(n: int, h: int, items: Iterable[Tuple[int, int, int]]) -> List[bool]:
+    """
+    Periksa S1^2 + h * S2^2 ≡ M (mod n) untuk setiap item (M, S1, S2)
+
+    Item dengan M, S1 atau S2 yang bukan int menghasilkan False, sama seperti
+    verify_signature, bukan TypeError yang menggagalkan seluruh batch.
+    """
+    results = []
+    for message, s1, s2 in items:
+        if isinstance(message, int) and isinstance(s1, int) and isinstance(s2, int):
+            results.append((s1 * s1 + h * s2 * s2 - message) % n == 0)
+        else:
+            results.append(False)
+    return results
+
+
+TUNING_FILE_ENV = "OSS_TUNING_FILE"
+TUNING_VERSION = 1
+# Nilai bawaan jika tidak ada hasil kalibrasi (lihat calibrate.py)
+DEFAULT_TUNING = {
+    "sign_chunk_size": 256,
+    "verify_chunk_size": 256,
+    "receive_chunk_size": 256,
+    "sieve_backend": "auto",
+}
+
+SIEVE_BACKENDS = ("auto", "numpy", "bytearray")
+
+_tuning_profiles: Optional[Dict[int, dict]] = None
+
+
+def _valid_tuning_value(name: str, value: Any) -> bool:
+    """True jika nilai parameter tuning bisa dipakai apa adanya"""
+    if name == "sieve_backend":
+        return value in SIEVE_BACKENDS
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+
+
+def _clean_tuning(profiles: Dict[int, dict]) -> Dict[int, dict]:
+    """Buang parameter yang tidak dikenal atau tidak valid dari setiap profil"""
+    return {
+        bits: {name: value for name, value in profile.items()
+               if name in DEFAULT_TUNING and _valid_tuning_value(name, value)}
+        for bits, profile in profiles.items()
+    }
+
+
+def default_tuning_path() -> str:
+    """
+    Lokasi cache tuning: $OSS_TUNING_FILE, atau
+    $XDG_CACHE_HOME/ong_schnorr_shamir/tuning.json (default ~/.cache)
+    """
+    path = os.environ.get(TUNING_FILE_ENV)
+    if path is not None:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ong_schnorr_shamir", "tuning.json")
+
+
+def load_tuning(path: Optional[str] = None) -> Dict[int, dict]:
+    """
+    Baca profil tuning per panjang bit dari cache JSON
+    
+    File yang tidak ada, rusak, atau berversi lain diabaikan (hasilnya
+    dict kosong) agar proses tetap jalan dengan nilai bawaan. Parameter
+    yang tidak dikenal atau nilainya tidak valid (mis. chunk size 0 atau
+    backend yang tidak ada) dibuang, sehingga DEFAULT_TUNING yang dipakai.
+    
+    Returns:
+        Dict bits -> {nama parameter: nilai}
+    """
+    path = default_tuning_path() if path is None else path
+    if not path:
+        return {}
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != TUNING_VERSION:
+            return {}
+        profiles = {int(bits): dict(profile) for bits, profile in data["profiles"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+    return _clean_tuning(profiles)
+
+
+def set_tuning(profiles: Optional[Dict[int, dict]]) -> None:
+    """
+    Ganti profil tuning aktif di proses ini (None = baca ulang dari cache)
+    
+    Nilai yang tidak valid dibuang seperti pada load_tuning.
+    """
+    global _tuning_profiles
+    _tuning_profiles = None if profiles is None else _clean_tuning(profiles)
+
+
+def tuned_value(bits: int, name: str) -> Any:
+    """
+    Nilai parameter `name` untuk kunci `bits` bit
+    
+    Cache tuning dibaca sekali saat pertama kali dibutuhkan. Profil dengan
+    panjang bit terdekat yang dipakai; tanpa profil, DEFAULT_TUNING.
+    """
+    global _tuning_profiles
+    if _tuning_profiles is None:
+        _tuning_profiles = load_tuning()
+    if _tuning_profiles:
+        nearest = min(_tuning_profiles, key=lambda size: (abs(size - bits), size))
+        value = _tuning_profiles[nearest].get(name)
+        if value is not None:
+            return value
+    return DEFAULT_TUNING[name]
+
+
+class VerificationCache:
+    """
+    Cache hasil verifikasi tanda tangan dengan batas ukuran (LRU) dan TTL
+    
+    Kunci cache adalah digest BLAKE2b 16 byte dari kunci publik (n, h) dan
+    (M, S1, S2) yang sudah direduksi mod n. Secara default hanya hasil positif yang disimpan, sehingga
+    tanda tangan palsu tidak bisa dipakai untuk mengisi cache.
+    
+    Satu instance boleh dipakai bersama oleh beberapa objek dan thread.
+    """
+    
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None,
+                 cache_negative: bool = False):
+        """
+        Args:
+            maxsize: Jumlah entri maksimum sebelum entri terlama dibuang
+            ttl: Umur entri dalam detik (None = tidak kedaluwarsa)
+            cache_negative: Jika True, hasil verifikasi gagal juga disimpan
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize harus >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_negative = cache_negative
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(n: int, h: int, message: int, s1: int, s2: int) -> bytes:
+        """
+        Buat digest ringkas dari (n, h, M, S1, S2)
+        
+        h ikut di-hash karena kunci berbeda bisa memakai n yang sama; tanpa h
+        hasil positif milik satu kunci akan diterima untuk kunci lain.
+        """
+        width = (n.bit_length() + 7) // 8
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(n.to_bytes(width, "big"))
+        for value in (h, message, s1, s2):
+            digest.update((value % n).to_bytes(width, "big"))
+        return digest.digest()
+    
+    def get(self, key: bytes) -> Optional[bool]:
+        """
+        Ambil hasil dari cache
+        
+        Returns:
+            Hasil verifikasi yang tersimpan, atau None jika tidak ada/kedaluwarsa
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key: bytes, result: bool) -> None:
+        """
+        Simpan hasil verifikasi (hasil negatif diabaikan kecuali cache_negative)
+        """
+        if not result and not self.cache_negative:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (result, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def get_or_verify(self, n: int, h: int, message: int, s1: int, s2: int,
+                      verify: Callable[[int, int, int], bool]) -> bool:
+        """
+        Kembalikan hasil dari cache, atau jalankan verify lalu simpan hasilnya
+        
+        Args:
+            n, h: Kunci publik
+            message, s1, s2: Pesan dan tanda tangan
+            verify: Fungsi verifikasi tanpa cache verify(message, s1, s2)
+        """
+        try:
+            key = self.make_key(n, h, message, s1, s2)
+        except (TypeError, AttributeError, OverflowError):
+            return verify(message, s1, s2)
+        
+        result = self.get(key)
+        if result is None:
+            result = verify(message, s1, s2)
+            self.put(key, result)
+        return result
+    
+    @property
+    def hit_rate(self) -> float:
+        """Rasio hit terhadap total lookup (0.0 jika belum ada lookup)"""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+    
+    def stats(self) -> dict:
+        """Statistik cache: hits, misses, evictions, size, hit_rate"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
+    
+    def clear(self) -> None:
+        """Hapus semua entri dan reset statistik"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class SignatureFault(RuntimeError):
+    """Tanda tangan yang baru dibuat gagal self-check (indikasi fault)"""
+
+
+class SelfCheck:
+    """
+    Verifikasi sampel tanda tangan segera setelah dibuat (proteksi fault)
+    
+    Tanda tangan yang salah karena fault (mis. bit flip di salah satu
+    setengah CRT) bisa membocorkan faktor n lewat gcd, sehingga sebaiknya
+    tidak pernah dikeluarkan. Pemeriksaan memakai nilai antara yang sudah
+    ada (r dan k^-1): S1 - k^-1 * S2 = r dan (S1 + k^-1 * S2) * r = M
+    (mod n), yang bersama-sama setara dengan S1^2 + h * S2^2 = M.
+    
+    Satu instance boleh dipakai bersama oleh beberapa signer dan thread.
+    """
+    
+    def __init__(self, rate: float = 1.0, raise_on_failure: bool = True, rng: Any = None):
+        """
+        Args:
+            rate: Fraksi tanda tangan yang diperiksa (0.0 - 1.0; 1.0 = semua)
+            raise_on_failure: Jika True, kegagalan melempar SignatureFault
+                sehingga tanda tangan yang salah tidak dikeluarkan
+            rng: Sumber acak untuk sampling (default: random.Random dengan
+                seed dari os.urandom, agar pola sampel tidak bisa ditebak)
+        """
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("rate harus di antara 0.0 dan 1.0")
+        self.rate = rate
+        self.raise_on_failure = raise_on_failure
+        self._rng = rng if rng is not None else random.Random(os.urandom(16))
+        self._lock = threading.Lock()
+        self.signed = 0
+        self.checked = 0
+        self.failures = 0
+    
+    def should_check(self) -> bool:
+        """Putuskan apakah tanda tangan berikutnya diperiksa (dan hitung sebagai signed)"""
+        with self._lock:
+            self.signed += 1
+            return self.rate >= 1.0 or (self.rate > 0.0 and self._rng.random() < self.rate)
+    
+    def record(self, ok: bool) -> None:
+        """Catat hasil satu pemeriksaan"""
+        with self._lock:
+            self.checked += 1
+            if not ok:
+                self.failures += 1
+        if not ok and self.raise_on_failure:
+            raise SignatureFault("Tanda tangan gagal self-check; tidak dikeluarkan")
+    
+    def stats(self) -> dict:
+        """Ringkasan metrik self-check"""
+        with self._lock:
+            return {
+                "signed": self.signed,
+                "checked": self.checked,
+                "failures": self.failures,
+                "rate": self.rate,
+            }
+
+
+class ThreadLocalRandom:
+    """
+    Generator acak dengan state terpisah untuk setiap thread
+    
+    Setiap thread mendapat instance random.Random sendiri saat pertama kali
+    dipakai, sehingga signer bisa dipanggil dari ThreadPoolExecutor tanpa
+    berbagi state generator global. Tanpa seed, setiap generator di-seed
+    dari os.urandom; dengan seed, generator ke-i di-seed dari (seed, i).
+    
+    Indeks i adalah urutan thread yang pertama kali memakai generator, bukan
+    identitas thread. Himpunan stream untuk seed yang sama selalu sama, tetapi
+    stream mana yang didapat suatu thread bergantung pada penjadwalan; hasil
+    per thread hanya dapat direproduksi jika urutan pemakaian pertama
+    ditentukan (mis. satu thread, atau thread yang disinkronkan).
+    """
+    
+    def __init__(self, seed: Optional[int] = None, factory: Callable[..., Any] = random.Random):
+        """
+        Args:
+            seed: Seed dasar opsional
+            factory: Kelas generator per thread (mis. random.Random)
+        """
+        self._seed = seed
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads = 0
+    
+    def _generator(self):
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            with self._lock:
+                index = self._threads
+                self._threads += 1
+            if self._seed is None:
+                seed = int.from_bytes(os.urandom(32), "big")
+            else:
+                seed = f"{self._seed}:{index}"
+            generator = self._factory(seed)
+            self._local.generator = generator
+        return generator
+    
+    def getrandbits(self, k: int) -> int:
+        return self._generator().getrandbits(k)
+    
+    def randrange(self, start: int, stop: Optional[int] = None) -> int:
+        return self._generator().randrange(start, stop)
+    
+    def randint(self, a: int, b: int) -> int:
+        return self._generator().randint(a, b)
+
+
+class KeygenTimeout(TimeoutError):
+    """Key generation melewati deadline"""
+
+
+class KeygenCancelled(KeygenTimeout):
+    """Key generation dihentikan lewat cancel token"""
+
+
+class KeygenControl:
+    """
+    Deadline, cancel token dan progress untuk key generation
+    
+    Setiap loop pencarian (kandidat prima, kandidat coprime) memanggil
+    candidate() sekali per kandidat: penghitung diperbarui, callback
+    progress dipanggil, lalu deadline dan cancel token diperiksa. Dengan
+    begitu thread yang meminta kunci bisa gagal cepat (mis. untuk memakai
+    kunci dari pool) alih-alih menunggu undian yang sial.
+    """
+    
+    def __init__(self, timeout: Optional[float] = None, cancel: Any = None,
+                 progress: Optional[Callable[["KeygenControl"], None]] = None):
+        """
+        Args:
+            timeout: Batas waktu dalam detik sejak objek dibuat (None = tanpa batas)
+            cancel: Objek dengan is_set(), mis. threading.Event
+            progress: Callback yang menerima objek ini setiap ada kandidat baru
+        """
+        self.started = time.monotonic()
+        self.deadline = None if timeout is None else self.started + timeout
+        self.cancel = cancel
+        self.progress = progress
+        self.candidates = 0
+        self.mr_rounds = 0
+    
+    @property
+    def elapsed(self) -> float:
+        """Detik sejak objek dibuat"""
+        return time.monotonic() - self.started
+    
+    def check(self) -> None:
+        """
+        Raises:
+            KeygenCancelled: Jika cancel token sudah diset
+            KeygenTimeout: Jika deadline sudah lewat
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            raise KeygenCancelled(f"Key generation dibatalkan setelah {self.candidates} kandidat")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise KeygenTimeout(
+                f"Key generation melewati batas waktu setelah {self.candidates} kandidat"
+            )
+    
+    def candidate(self) -> None:
+        """Catat satu kandidat, laporkan progress, lalu periksa deadline"""
+        self.candidates += 1
+        if self.progress is not None:
+            self.progress(self)
+        self.check()
+
+
+# Batas tabel prima kecil untuk penyaringan kandidat (backend bytearray / NumPy)
+SIEVE_PRIME_LIMIT = 1 << 14
+NUMPY_SIEVE_PRIME_LIMIT = 1 << 17
+# Jumlah kandidat ganjil per segmen saringan
+SIEVE_SEGMENT_SIZE = 2048
+
+_small_prime_tables: Dict[int, List[int]] = {}
+
+
+def small_primes(limit: int = SIEVE_PRIME_LIMIT) -> List[int]:
+    """
+    Bilangan prima ganjil di bawah limit (Eratosthenes, di-cache per limit)
+    """
+    table = _small_prime_tables.get(limit)
+    if table is None:
+        sieve = bytearray([1]) * limit
+        sieve[:2] = b"\x00\x00"
+        for i in range(2, math.isqrt(limit - 1) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+        table = [i for i in range(3, limit, 2) if sieve[i]]
+        _small_prime_tables[limit] = table
+    return table
+
+
+def _miller_rabin(n: int, rounds: int, rng: Any, control: Optional[KeygenControl] = None) -> bool:
+    """
+    Miller-Rabin dengan `rounds` saksi acak dari rng; putaran yang benar-benar
+    dijalankan dicatat di control.mr_rounds
+    """
+    if n < 2:
+        return False
+    if n == 2 or n == 3:
+        return True
+    if n % 2 == 0:
+        return False
+    
+    # Tulis n-1 sebagai d * 2^r
+    r = 0
+    d = n - 1
+    while d % 2 == 0:
+        r += 1
+        d //= 2
+    
+    for _ in range(rounds):
+        if control is not None:
+            control.mr_rounds += 1
+        a = rng.randrange(2, n - 1)
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _sieve_segment(size: int, primes: Sequence[int], residues: Sequence[int],
+                   safe: bool = False) -> bytearray:
+    """
+    Saring kandidat base + 2i (0 <= i < size, base ganjil); byte ke-i
+    bernilai 1 jika kandidat tidak habis dibagi prima mana pun di `primes`
+    
+    Args:
+        residues: base % p untuk setiap p di primes
+        safe: Saring juga 2 * kandidat + 1 (pencarian safe prime)
+    """
+    marks = bytearray([1]) * size
+    for p, r in zip(primes, residues):
+        inv_2 = (p + 1) >> 1
+        # base + 2i = 0 (mod p)  <=>  i = -r * 2^-1 (mod p)
+        start = (-r * inv_2) % p
+        if start < size:
+            marks[start::p] = bytes((size - 1 - start) // p + 1)
+        if safe:
+            # 2(base + 2i) + 1 = 0 (mod p)  <=>  base + 2i = (p - 1) / 2 (mod p)
+            start = ((((p - 1) >> 1) - r) * inv_2) % p
+            if start < size:
+                marks[start::p] = bytes((size - 1 - start) // p + 1)
+    return marks
+
+
+class _SieveTable:
+    """
+    Tabel prima kecil untuk kandidat `bits` bit, dengan backend bytearray
+    atau NumPy
+    
+    Backend NumPy menghitung residu titik awal terhadap semua prima sekaligus
+    (base dipecah menjadi limb 16 bit, lalu dikalikan dengan tabel
+    2^(16i) mod p) dan menandai semua kelipatan dalam satu segmen dengan
+    satu operasi indeks vektor.
+    """
+    
+    def __init__(self, bits: int, use_numpy: bool):
+        self.use_numpy = use_numpy and np is not None
+        limit = NUMPY_SIEVE_PRIME_LIMIT if self.use_numpy else SIEVE_PRIME_LIMIT
+        # Hanya prima di bawah kandidat terkecil, agar prima kecil tidak menyaring dirinya sendiri
+        minimum = 1 << (bits - 1)
+        self.primes = [p for p in small_primes(limit) if p < minimum]
+        if self.use_numpy:
+            self._limbs = (bits + 15) // 16
+            self._p = np.array(self.primes, dtype=np.int64)
+            self._inv2 = (self._p + 1) // 2
+            powers = [np.ones_like(self._p)]
+            for _ in range(self._limbs - 1):
+                powers.append((powers[-1] << 16) % self._p)
+            self._limb_powers = np.stack(powers)
+    
+    def residues(self, base: int):
+        """base % p untuk setiap prima di tabel"""
+        if not self.use_numpy:
+            return [base % p for p in self.primes]
+        limbs = np.frombuffer(base.to_bytes(2 * self._limbs, "little"), dtype="<u2").astype(np.int64)
+        return (limbs[:, None] * self._limb_powers).sum(axis=0) % self._p
+    
+    def shift(self, residues, step: int):
+        """Residu untuk base + step"""
+        if not self.use_numpy:
+            return [(r + step) % p for r, p in zip(residues, self.primes)]
+        return (residues + step) % self._p
+    
+    def survivors(self, size: int, residues, safe: bool = False) -> List[int]:
+        """Offset i (0 <= i < size) dengan base + 2i (dan 2(base + 2i) + 1 jika safe) lolos saringan"""
+        if not self.use_numpy:
+            marks = _sieve_segment(size, self.primes, residues, safe)
+            return [i for i, mark in enumerate(marks) if mark]
+        starts = (-residues * self._inv2) % self._p
+        primes = self._p
+        if safe:
+            starts = np.concatenate([starts, (((primes - 1) >> 1) - residues) * self._inv2 % primes])
+            primes = np.concatenate([primes, primes])
+        inside = starts < size
+        starts, primes = starts[inside], primes[inside]
+        counts = (size - 1 - starts) // primes + 1
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        multiples = (np.repeat(starts, counts)
+                     + np.repeat(primes, counts) * (np.arange(int(counts.sum())) - first))
+        marks = np.ones(size, dtype=bool)
+        marks[multiples] = False
+        return np.flatnonzero(marks).tolist()
+
+
+_sieve_tables: Dict[Tuple[int, bool], _SieveTable] = {}
+
+
+def _sieve_table(bits: int, use_numpy: Optional[bool] = None) -> _SieveTable:
+    """
+    Tabel saringan yang di-cache per (bits, backend); None = backend hasil
+    kalibrasi ("sieve_backend"), atau NumPy jika tersedia
+    """
+    if use_numpy is None:
+        backend = tuned_value(bits, "sieve_backend")
+        use_numpy = backend == "numpy" if backend != "auto" else True
+    use_numpy = use_numpy and np is not None
+    table = _sieve_tables.get((bits, use_numpy))
+    if table is None:
+        table = _sieve_tables[(bits, use_numpy)] = _SieveTable(bits, use_numpy)
+    return table
+
+
+def _sieved_candidates(bits: int, rng: Any, table: _SieveTable,
+                       segment_size: int = SIEVE_SEGMENT_SIZE, top_bits: int = 1,
+                       safe: bool = False) -> Iterator[int]:
+    """
+    Kandidat `bits` bit yang lolos saringan, dari titik awal acak (tanpa akhir)
+    
+    Residu titik awal terhadap tabel prima dihitung sekali lalu digeser per
+    segmen. `top_bits` bit teratas selalu diset; jika interval mencapai
+    2^bits, titik awal baru diambil.
+    """
+    high = 1 << bits
+    top = ((1 << top_bits) - 1) << (bits - top_bits)
+    while True:
+        base = rng.getrandbits(bits) | top | 1
+        residues = table.residues(base)
+        while base < high:
+            size = min(segment_size, (high - base + 1) // 2)
+            for i in table.survivors(size, residues, safe):
+                yield base + 2 * i
+            step = 2 * size
+            base += step
+            residues = table.shift(residues, step)
+
+
+def _sieved_prime(bits: int, rng: Any, rounds: int, table: _SieveTable,
+                  segment_size: int = SIEVE_SEGMENT_SIZE, top_bits: int = 1,
+                  control: Optional[KeygenControl] = None) -> int:
+    """
+    Cari satu prima `bits` bit; Miller-Rabin hanya untuk kandidat yang lolos saringan
+    """
+    for candidate in _sieved_candidates(bits, rng, table, segment_size, top_bits):
+        if control is not None:
+            control.candidate()
+        if _miller_rabin(candidate, rounds, rng, control):
+            return candidate
+
+
+def generate_primes(bits: int, count: int, rng: Any = None, rounds: int = 5,
+                    segment_size: int = SIEVE_SEGMENT_SIZE,
+                    use_numpy: Optional[bool] = None,
+                    control: Optional[KeygenControl] = None) -> Iterator[int]:
+    """
+    Generate `count` bilangan prima acak tepat `bits` bit secara lazy
+    
+    Setiap prima dicari dari titik awal acaknya sendiri: kandidat ganjil
+    disaring per segmen terhadap tabel prima kecil yang di-cache, dan hanya
+    yang lolos diuji Miller-Rabin. Hanya satu prima diambil per interval,
+    karena dua prima yang berdekatan membuat n = p * q mudah difaktorkan
+    (metode Fermat).
+    
+    Args:
+        bits: Panjang bit setiap prima (>= 16)
+        count: Jumlah prima
+        rng: Sumber acak opsional (default: modul random global)
+        rounds: Jumlah putaran Miller-Rabin per kandidat
+        segment_size: Jumlah kandidat ganjil per segmen saringan
+        use_numpy: Backend saringan; None = NumPy jika terpasang
+        control: KeygenControl opsional untuk deadline, cancel dan progress
+        
+    Yields:
+        Bilangan prima dengan bit teratas diset
+    """
+    if bits < 16:
+        raise ValueError("bits harus >= 16")
+    if count < 0:
+        raise ValueError("count tidak boleh negatif")
+    if segment_size < 1:
+        raise ValueError("segment_size harus >= 1")
+    if rng is None:
+        rng = random
+    
+    table = _sieve_table(bits, use_numpy)
+    for _ in range(count):
+        yield _sieved_prime(bits, rng, rounds, table, segment_size, control=control)
+
+
+# Jenis prima untuk key generation
+PRIME_KINDS = ("plain", "safe", "strong")
+# Konstanta bilangan prima kembar (Hardy-Littlewood), untuk estimasi kepadatan safe prime
+TWIN_PRIME_CONSTANT = 0.6601618158468696
+
+
+class PrimeSearchReport(NamedTuple):
+    """Hasil pencarian prima beserta jumlah kandidat yang benar-benar diuji"""
+    primes: List[int]
+    candidates: int              # Kandidat lolos saringan yang diuji Miller-Rabin
+    expected_candidates: float   # Perkiraan heuristik untuk jumlah yang sama
+    mr_rounds: int               # Total putaran Miller-Rabin
+
+
+def _expected_safe_candidates(bits: int, table: _SieveTable) -> float:
+    """
+    Perkiraan jumlah kandidat q lolos saringan ganda per safe prime `bits` bit
+    
+    Kepadatan q dengan q dan 2q + 1 prima ~ 2C / (ln q * ln 2q)
+    (Hardy-Littlewood); saringan ganda menyisakan fraksi
+    (1/2) * prod(1 - 2/s) dari semua bilangan bulat.
+    """
+    survive = 0.5
+    for s in table.primes:
+        survive *= 1 - 2 / s
+    ln_q = (bits - 2) * math.log(2) + math.log(1.5)
+    return survive * ln_q * (ln_q + math.log(2)) / (2 * TWIN_PRIME_CONSTANT)
+
+
+def _safe_prime_search(bits: int, rng: Any, rounds: int, table: _SieveTable,
+                       top_bits: int = 1,
+                       control: Optional[KeygenControl] = None) -> Tuple[int, int, int]:
+    """
+    Cari satu safe prime p = 2q + 1 dengan saringan ganda atas q dan 2q + 1
+    (`top_bits` bit teratas p diset)
+    
+    Returns:
+        (p, kandidat diuji, putaran Miller-Rabin) untuk pencarian ini
+    """
+    if control is None:
+        control = KeygenControl()
+    candidates, mr_rounds = control.candidates, control.mr_rounds
+    for q in _sieved_candidates(bits - 1, rng, table, top_bits=top_bits, safe=True):
+        p = 2 * q + 1
+        control.candidate()
+        # Satu putaran murah untuk q lalu p sebelum pengujian penuh
+        if not _miller_rabin(q, 1, rng, control) or not _miller_rabin(p, 1, rng, control):
+            continue
+        if _miller_rabin(q, rounds, rng, control) and _miller_rabin(p, rounds, rng, control):
+            return p, control.candidates - candidates, control.mr_rounds - mr_rounds
+
+
+def _safe_prime_task(args: Tuple[int, int, int, Optional[bool]]) -> Tuple[int, int, int]:
+    """Worker: satu safe prime dengan generator acak dari seed sendiri"""
+    bits, seed, rounds, use_numpy = args
+    return _safe_prime_search(bits, random.Random(seed), rounds, _sieve_table(bits - 1, use_numpy))
+
+
+def generate_safe_primes(bits: int, count: int = 1, jobs: int = 1, rng: Any = None,
+                         rounds: int = 5, use_numpy: Optional[bool] = None) -> PrimeSearchReport:
+    """
+    Generate safe prime p = 2q + 1 (q juga prima) tepat `bits` bit
+    
+    Kandidat q disaring bersama 2q + 1 terhadap tabel prima kecil, sehingga
+    hanya pasangan tanpa faktor kecil di kedua sisi yang diuji Miller-Rabin.
+    Setiap prima dicari dengan generator acak dari seed yang diambil dari
+    rng, sehingga hasilnya sama untuk jobs berapa pun.
+    
+    Args:
+        bits: Panjang bit p (>= 17)
+        count: Jumlah safe prime
+        jobs: Jumlah proses; > 1 membagi pencarian ke process pool
+        rng: Sumber acak untuk seed (default: modul random global)
+        rounds: Putaran Miller-Rabin penuh untuk q dan p
+        use_numpy: Backend saringan; None = NumPy jika terpasang
+        
+    Returns:
+        PrimeSearchReport dengan kandidat diuji vs perkiraan
+    """
+    if bits < 17:
+        raise ValueError("bits harus >= 17")
+    if count < 0:
+        raise ValueError("count tidak boleh negatif")
+    if rng is None:
+        rng = random
+    
+    tasks = [(bits, rng.getrandbits(64), rounds, use_numpy) for _ in range(count)]
+    if jobs <= 1 or count < 2:
+        results = [_safe_prime_task(task) for task in tasks]
+    else:
+        import multiprocessing
+        
+        with multiprocessing.Pool(min(jobs, count)) as pool:
+            results = pool.map(_safe_prime_task, tasks)
+    
+    expected = _expected_safe_candidates(bits, _sieve_table(bits - 1, use_numpy))
+    return PrimeSearchReport(
+        primes=[p for p, _, _ in results],
+        candidates=sum(c for _, c, _ in results),
+        expected_candidates=expected * count,
+        mr_rounds=sum(m for _, _, m in results),
+    )
+
+
+def _gordon_strong_prime(bits: int, rng: Any, rounds: int = 5, top_bits: int = 1,
+                         control: Optional[KeygenControl] = None) -> Tuple[int, int, int, int]:
+    """
+    Algoritma Gordon: prima p dengan r | p - 1, s | p + 1 dan t | r - 1
+    untuk prima besar r, s, t (`top_bits` bit teratas p diset)
+    
+    Returns:
+        (p, r, s, t)
+    """
+    half = bits // 2
+    while True:
+        s = next(generate_primes(half - 8, 1, rng, control=control))
+        t = next(generate_primes(half - 16, 1, rng, control=control))
+        # r = 2it + 1 prima, mulai dari i acak
+        i = rng.getrandbits(8) | 1 << 8
+        while True:
+            if control is not None:
+                control.candidate()
+            if _miller_rabin(2 * i * t + 1, rounds, rng, control):
+                break
+            i += 1
+        r = 2 * i * t + 1
+        
+        # p0 = 1 (mod r) dan p0 = -1 (mod s); p = p0 + 2jrs mempertahankan keduanya
+        p0 = 2 * pow(s, r - 2, r) * s - 1
+        step = 2 * r * s
+        minimum = ((1 << top_bits) - 1) << (bits - top_bits)
+        low = max(1, -(-(minimum - p0) // step))
+        high = ((1 << bits) - 1 - p0) // step
+        if high < low:
+            continue
+        start = low + rng.randrange(high - low + 1)
+        for j in itertools.chain(range(start, high + 1), range(low, start)):
+            p = p0 + j * step
+            if control is not None:
+                control.candidate()
+            if _miller_rabin(p, rounds, rng, control):
+                return p, r, s, t
+
+
+def generate_strong_prime(bits: int, rng: Any = None, rounds: int = 5,
+                          control: Optional[KeygenControl] = None) -> int:
+    """
+    Generate strong prime `bits` bit (Gordon): p - 1, p + 1 dan r - 1
+    masing-masing punya faktor prima besar
+    
+    Args:
+        bits: Panjang bit p (>= 64)
+        rng: Sumber acak opsional (default: modul random global)
+        control: KeygenControl opsional untuk deadline, cancel dan progress
+    """
+    if bits < 64:
+        raise ValueError("bits harus >= 64")
+    return _gordon_strong_prime(bits, rng or random, rounds, control=control)[0]
 
 
 class OngSchnorrShamir:
@@ -11,20 +871,69 @@ class OngSchnorrShamir:
     
     FIXED VERSION - Memperbaiki bug matematis fundamental
     CLEANED - Removed demo code, pure library now
+    
+    Thread safety: setelah konstruksi, kunci dan konstanta CRT hanya dibaca,
+    sehingga satu instance aman dipakai bersamaan dari banyak thread tanpa
+    lock. Semua bilangan acak (kunci, nonce r, saksi Miller-Rabin) diambil
+    dari `rng`; gunakan ThreadLocalRandom atau satu random.Random per
+    instance untuk menghindari state generator global.
     """
     
-    def __init__(self, n: int = None, k: int = None):
+    def __init__(self, n: int = None, k: int = None, composite: bool = False,
+                 factors: Optional[Tuple[int, int]] = None, bits: int = 512,
+                 verification_cache: Optional[VerificationCache] = None,
+                 rng: Any = None, prime_kind: str = "plain",
+                 keygen: Optional[KeygenControl] = None,
+                 self_check: Optional[SelfCheck] = None):
         """
         Inisialisasi dengan parameter n dan k
         
         Args:
             n: Bilangan integer besar (kunci publik)
             k: Bilangan integer (kunci privat)
+            composite: Jika True dan n tidak diberikan, n dibuat sebagai p * q
+            factors: Faktor (p, q) dari n yang disimpan secara privat untuk CRT
+            bits: Panjang bit n yang dibuat otomatis
+            verification_cache: Cache opsional untuk hasil verifikasi
+            rng: Sumber acak dengan getrandbits/randrange/randint, mis.
+                random.Random(seed), random.SystemRandom() atau
+                ThreadLocalRandom() (default: modul random global)
+            prime_kind: Jenis prima untuk kunci yang dibuat otomatis:
+                "plain", "safe" (p = 2q + 1) atau "strong" (Gordon)
+            keygen: KeygenControl opsional (deadline, cancel token, progress)
+                untuk pembuatan kunci; KeygenTimeout dilempar jika terlewati
+            self_check: SelfCheck opsional untuk memverifikasi sampel
+                tanda tangan yang baru dibuat
         """
-        if n is None:
-            n = self._generate_large_prime()
-        if k is None:
-            k = self._generate_coprime(n)
+        if prime_kind not in PRIME_KINDS:
+            raise ValueError(f"prime_kind harus salah satu dari {PRIME_KINDS}")
+        self._rng = rng if rng is not None else random
+        self.prime_kind = prime_kind
+        self.verification_cache = verification_cache
+        self.self_check = self_check
+        self._p = None
+        self._q = None
+        self._keygen = keygen
+        
+        try:
+            if factors is not None:
+                p, q = factors
+                if n is not None and n != p * q:
+                    raise ValueError("n harus sama dengan p * q")
+                n = p * q
+                self._set_factors(p, q)
+            elif n is None:
+                if composite:
+                    p, q = self._generate_composite_factors(bits)
+                    n = p * q
+                    self._set_factors(p, q)
+                else:
+                    n = self._generate_large_prime(bits)
+            if k is None:
+                k = self._generate_coprime(n)
+        finally:
+            # Kontrol hanya berlaku untuk pembuatan kunci di konstruktor
+            self._keygen = None
             
         self.n = n  # Kunci publik
         self.k = k  # Kunci privat
@@ -33,15 +942,59 @@ class OngSchnorrShamir:
         if math.gcd(n, k) != 1:
             raise ValueError("n dan k harus relatif prima (GCD(n,k) = 1)")
         
-        # Hitung nilai h
+        # Hitung nilai h (k^-1 disimpan untuk self-check dan dekripsi)
+        self._k_inv = pow(k, -1, n)
         self.h = self._calculate_h()
+        
+        if self.is_composite:
+            self._precompute_crt()
+    
+    @property
+    def is_composite(self) -> bool:
+        """True jika faktor n diketahui dan operasi privat memakai CRT"""
+        return self._p is not None
+    
+    @classmethod
+    def from_key_file(cls, path: str, **kwargs):
+        """
+        Buat objek dari file kunci JSON tanpa membuat kunci baru
+        
+        Args:
+            path: Path file kunci yang ditulis oleh save_keys
+            **kwargs: Argumen tambahan untuk konstruktor (mis. verification_cache)
+            
+        Returns:
+            Instance kelas ini dengan kunci dari file
+        """
+        keys = load_keys(path)
+        if "k" not in keys:
+            raise ValueError("File kunci tidak berisi kunci privat k")
+        factors = (keys["p"], keys["q"]) if "p" in keys else None
+        return cls(n=keys["n"], k=keys["k"], factors=factors, **kwargs)
+    
+    def _check_signature(self, message: int, s1: int, s2: int) -> bool:
+        """
+        Verifikasi persamaan S1^2 + h * S2^2 ≡ M (mod n) tanpa cache
+        """
+        try:
+            left_side = (pow(s1, 2, self.n) + (self.h * pow(s2, 2, self.n))) % self.n
+            return left_side == message % self.n
+            
+        except Exception:
+            return False
     
     def _generate_large_prime(self, bits: int = 512) -> int:
         """
-        Generate bilangan prima besar
+        Generate bilangan prima besar (tersaring, bit teratas diset)
         """
+        if self.prime_kind != "plain":
+            return self._hardened_prime(bits, top_bits=1)
+        if bits >= 16:
+            return _sieved_prime(bits, self._rng, 5, _sieve_table(bits), control=self._keygen)
         while True:
-            num = random.getrandbits(bits)
+            num = self._rng.getrandbits(bits)
+            if self._keygen is not None:
+                self._keygen.candidate()
             if self._is_prime(num):
                 return num
     
@@ -49,40 +1002,16 @@ class OngSchnorrShamir:
         """
         Miller-Rabin primality test
         """
-        if n < 2:
-            return False
-        if n == 2 or n == 3:
-            return True
-        if n % 2 == 0:
-            return False
-        
-        # Tulis n-1 sebagai d * 2^r
-        r = 0
-        d = n - 1
-        while d % 2 == 0:
-            r += 1
-            d //= 2
-        
-        # Miller-Rabin test
-        for _ in range(k):
-            a = random.randrange(2, n - 1)
-            x = pow(a, d, n)
-            if x == 1 or x == n - 1:
-                continue
-            for _ in range(r - 1):
-                x = pow(x, 2, n)
-                if x == n - 1:
-                    break
-            else:
-                return False
-        return True
+        return _miller_rabin(n, k, self._rng, self._keygen)
     
     def _generate_coprime(self, n: int) -> int:
         """
         Generate bilangan yang relatif prima dengan n
         """
         while True:
-            k = random.randint(2, n - 1)
+            if self._keygen is not None:
+                self._keygen.candidate()
+            k = self._rng.randint(2, n - 1)
             if math.gcd(n, k) == 1:
                 return k
     
@@ -90,16 +1019,135 @@ class OngSchnorrShamir:
         """
         Hitung nilai h = -(k^-1)^2 mod n
         """
-        k_inv = pow(self.k, -1, self.n)  # Modular inverse of k
+        k_inv = self._k_inv  # Modular inverse of k
         h = (-(k_inv ** 2)) % self.n
         return h
     
+    def _generate_composite_factors(self, bits: int) -> Tuple[int, int]:
+        """
+        Generate dua bilangan prima berbeda p, q dengan p * q tepat `bits` bit
+        """
+        half = bits // 2
+        p = self._generate_factor_prime(bits - half)
+        while True:
+            q = self._generate_factor_prime(half)
+            if q != p:
+                return p, q
+    
+    def _generate_factor_prime(self, bits: int) -> int:
+        """
+        Generate bilangan prima dengan dua bit teratas diset, sehingga
+        hasil kali dua faktor selalu memiliki panjang bit penuh
+        """
+        if self.prime_kind != "plain":
+            return self._hardened_prime(bits, top_bits=2)
+        if bits >= 16:
+            return _sieved_prime(bits, self._rng, 5, _sieve_table(bits), top_bits=2,
+                                 control=self._keygen)
+        top = 3 << (bits - 2)
+        while True:
+            num = self._rng.getrandbits(bits) | top | 1
+            if self._keygen is not None:
+                self._keygen.candidate()
+            if self._is_prime(num):
+                return num
+    
+    def _hardened_prime(self, bits: int, top_bits: int) -> int:
+        """
+        Generate safe prime atau strong prime sesuai prime_kind
+        """
+        if self.prime_kind == "safe":
+            if bits < 17:
+                raise ValueError("Safe prime membutuhkan minimal 17 bit")
+            return _safe_prime_search(bits, self._rng, 5, _sieve_table(bits - 1), top_bits,
+                                      self._keygen)[0]
+        if bits < 64:
+            raise ValueError("Strong prime membutuhkan minimal 64 bit")
+        return _gordon_strong_prime(bits, self._rng, 5, top_bits, self._keygen)[0]
+    
+    def _set_factors(self, p: int, q: int) -> None:
+        """
+        Validasi dan simpan faktor privat n
+        """
+        if p < 3 or q < 3 or p % 2 == 0 or q % 2 == 0:
+            raise ValueError("Faktor p dan q harus bilangan ganjil > 2")
+        if math.gcd(p, q) != 1:
+            raise ValueError("Faktor p dan q harus relatif prima")
+        self._p = p
+        self._q = q
+    
+    def _precompute_crt(self) -> None:
+        """
+        Hitung konstanta CRT: q^-1 mod p, 2^-1, k dan k^-1 modulo tiap faktor
+        """
+        p, q = self._p, self._q
+        self._q_inv_p = pow(q, -1, p)
+        self._inv_2_p = (p + 1) // 2
+        self._inv_2_q = (q + 1) // 2
+        self._k_p = self.k % p
+        self._k_q = self.k % q
+        self._k_inv_p = pow(self._k_p, -1, p)
+        self._k_inv_q = pow(self._k_q, -1, q)
+        self._k_half_p = self._k_p * self._inv_2_p % p
+        self._k_half_q = self._k_q * self._inv_2_q % q
+    
+    def _crt_combine(self, x_p: int, x_q: int) -> int:
+        """
+        Gabungkan residu mod p dan mod q menjadi residu mod n (Garner)
+        """
+        t = ((x_p - x_q) * self._q_inv_p) % self._p
+        return x_q + t * self._q
+    
+    def _crt_sign(self, message: int, r: int) -> Tuple[int, int]:
+        """
+        Hitung S1 = (1/2)(M/r + r) dan S2 = (k/2)(M/r - r) modulo p dan q
+        secara terpisah, lalu gabungkan dengan CRT
+        """
+        return self._crt_sign_residues(message, r % self._p, r % self._q)
+    
+    def _crt_sign_residues(self, message: int, r_p: int, r_q: int) -> Tuple[int, int]:
+        """
+        Seperti _crt_sign, tetapi r diberikan sebagai residu (r mod p, r mod q)
+        """
+        p, q = self._p, self._q
+        
+        t_p = (message % p) * pow(r_p, -1, p) % p
+        s1_p = self._inv_2_p * (t_p + r_p) % p
+        s2_p = self._k_half_p * (t_p - r_p) % p
+        
+        t_q = (message % q) * pow(r_q, -1, q) % q
+        s1_q = self._inv_2_q * (t_q + r_q) % q
+        s2_q = self._k_half_q * (t_q - r_q) % q
+        
+        return self._crt_combine(s1_p, s1_q), self._crt_combine(s2_p, s2_q)
+    
+    def _random_crt_residues(self) -> Tuple[int, int]:
+        """
+        Generate r acak sebagai residu (r mod p, r mod q)
+        
+        r_p dan r_q diambil seragam dari Z_p* dan Z_q*, sehingga r hasil
+        rekombinasi seragam di Z_n* tanpa gcd penuh terhadap n. Untuk faktor
+        prima gcd setengah ukuran selalu 1 dan hanya menjaga faktor yang
+        diberikan pengguna.
+        """
+        p, q = self._p, self._q
+        randint = self._rng.randint
+        while True:
+            r_p = randint(1, p - 1)
+            if math.gcd(r_p, p) == 1:
+                break
+        while True:
+            r_q = randint(1, q - 1)
+            if math.gcd(r_q, q) == 1:
+                break
+        return r_p, r_q
+    
     def _generate_random_coprime(self, n: int) -> int:
         """
         Generate bilangan acak yang relatif prima dengan n
         """
         while True:
-            r = random.randint(2, n - 1)
+            r = self._rng.randint(2, n - 1)
             if math.gcd(n, r) == 1:
                 return r
 
@@ -121,6 +1169,13 @@ class DigitalSignature(OngSchnorrShamir):
         Returns:
             Tuple berisi (S1, S2, r)
         """
+        # Mode komposit: r diambil per faktor, dua perhitungan setengah
+        # ukuran + rekombinasi CRT
+        if self.is_composite:
+            r_p, r_q = self._random_crt_residues()
+            s1, s2 = self._crt_sign_residues(message, r_p, r_q)
+            return self._self_checked(message, s1, s2, self._crt_combine(r_p, r_q))
+        
         # Generate bilangan acak r
         r = self._generate_random_coprime(self.n)
         
@@ -136,10 +1191,32 @@ class DigitalSignature(OngSchnorrShamir):
             term = ((message * inv_r) - r) % self.n
             s2 = (self.k * inv_2 * term) % self.n
             
-            return s1, s2, r
-            
         except ValueError as e:
             raise ValueError(f"Error dalam perhitungan tanda tangan: {e}")
+        
+        return self._self_checked(message, s1, s2, r)
+    
+    def _fused_check(self, message: int, s1: int, s2: int, r: int) -> bool:
+        """
+        Periksa tanda tangan yang baru dibuat memakai r dan k^-1
+        
+        Dengan u = k^-1 * S2: S1 - u = r dan (S1 + u) * r = M (mod n).
+        Kedua kondisi ini menyiratkan S1^2 + h * S2^2 = (S1 - u)(S1 + u) = M,
+        tanpa perlu mengkuadratkan S1 dan S2.
+        """
+        n = self.n
+        u = self._k_inv * s2
+        return (s1 - u - r) % n == 0 and ((s1 + u) * r - message) % n == 0
+    
+    def _self_checked(self, message: int, s1: int, s2: int, r: int) -> Tuple[int, int, int]:
+        """
+        Jalankan self-check (jika aktif dan terpilih sampel) sebelum tanda
+        tangan dikembalikan
+        """
+        check = self.self_check
+        if check is not None and check.should_check():
+            check.record(self._fused_check(message, s1, s2, r))
+        return s1, s2, r
     
     def verify_signature(self, message: int, s1: int, s2: int) -> bool:
         """
@@ -153,13 +1230,107 @@ class DigitalSignature(OngSchnorrShamir):
         Returns:
             True jika verifikasi berhasil, False sebaliknya
         """
+        if self.verification_cache is not None:
+            return self.verification_cache.get_or_verify(
+                self.n, self.h, message, s1, s2, self._check_signature
+            )
+        
+        # Verifikasi: S1^2 + h * S2^2 ≡ M (mod n)
+        return self._check_signature(message, s1, s2)
+    
+    @property
+    def key_id(self) -> bytes:
+        """ID kunci pendek yang diturunkan dari n"""
+        return key_fingerprint(self.n)
+    
+    def sign_packed(self, message: int) -> bytes:
+        """
+        Tanda tangani pesan dan kembalikan tanda tangan terkemas (lihat pack_signature)
+        """
+        s1, s2, _ = self.sign_message(message)
+        return pack_signature(s1, s2, self.n)
+    
+    def sign_batch(self, messages: Sequence[int]) -> List[Tuple[int, int, int]]:
+        """
+        Tanda tangani banyak pesan sekaligus
+        
+        Invers r untuk seluruh batch dihitung dengan satu kali invers modular,
+        sehingga biaya per pesan hanya beberapa perkalian.
+        
+        Args:
+            messages: Daftar pesan (M)
+            
+        Returns:
+            List berisi (S1, S2, r) dengan urutan yang sama seperti input
+        """
+        n = self.n
+        rs = [self._generate_random_coprime(n) for _ in messages]
         try:
-            # Verifikasi: S1^2 + h * S2^2 ≡ M (mod n)
-            left_side = (pow(s1, 2, self.n) + (self.h * pow(s2, 2, self.n))) % self.n
-            return left_side == message % self.n
+            inv_rs = _batch_inverse(rs, n)
+            inv_2 = pow(2, -1, n)
+        except ValueError as e:
+            raise ValueError(f"Error dalam perhitungan tanda tangan: {e}")
+        k_half = (self.k * inv_2) % n
+        
+        signatures = []
+        for message, r, inv_r in zip(messages, rs, inv_rs):
+            t = message * inv_r
+            s1 = (inv_2 * (t + r)) % n
+            s2 = (k_half * (t - r)) % n
+            signatures.append((s1, s2, r))
+        
+        if self.self_check is not None:
+            for message, (s1, s2, r) in zip(messages, signatures):
+                self._self_checked(message, s1, s2, r)
+        return signatures
+    
+    def verify_batch(self, items: Iterable[Tuple[int, int, int]]) -> List[bool]:
+        """
+        Verifikasi banyak tanda tangan sekaligus
+        
+        Args:
+            items: Iterable berisi (M, S1, S2)
             
-        except Exception:
-            return False
+        Returns:
+            List hasil verifikasi dengan urutan yang sama seperti input;
+            item yang bukan int bernilai False
+        """
+        return _verify_batch(self.n, self.h, items)
+
+    
+    def sign_iter(self, messages: Iterable[int],
+                  chunk_size: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        """
+        Tanda tangani iterable (boleh tak terbatas) secara lazy
+        
+        Pesan diambil per chunk dan diproses lewat sign_batch, sehingga
+        memori dibatasi oleh chunk_size, bukan oleh panjang input.
+        
+        Args:
+            messages: Iterable pesan (M)
+            chunk_size: Jumlah pesan per batch (None = hasil kalibrasi)
+            
+        Yields:
+            (S1, S2, r) untuk setiap pesan, sesuai urutan input
+        """
+        if chunk_size is None:
+            chunk_size = tuned_value(self.n.bit_length(), "sign_chunk_size")
+        for chunk in _chunked(messages, chunk_size):
+            yield from self.sign_batch(chunk)
+    
+    def verify_iter(self, items: Iterable[Tuple[int, int, int]],
+                    chunk_size: Optional[int] = None) -> Iterator[bool]:
+        """
+        Verifikasi iterable (M, S1, S2) secara lazy per chunk
+        (chunk_size None = hasil kalibrasi)
+        
+        Yields:
+            Hasil verifikasi untuk setiap item, sesuai urutan input
+        """
+        if chunk_size is None:
+            chunk_size = tuned_value(self.n.bit_length(), "verify_chunk_size")
+        for chunk in _chunked(items, chunk_size):
+            yield from self.verify_batch(chunk)
 
 
 class SubliminalChannel(OngSchnorrShamir):
@@ -186,6 +1357,10 @@ class SubliminalChannel(OngSchnorrShamir):
         if math.gcd(cover_message, self.n) != 1:
             raise ValueError("Pesan samaran harus relatif prima dengan n")
         
+        if self.is_composite:
+            s1, s2 = self._crt_sign(cover_message, original_message)
+            return s1, s2, cover_message
+        
         try:
             # S1 = (1/2) * (w'/w + w) mod n
             inv_2 = pow(2, -1, self.n)
@@ -214,13 +1389,13 @@ class SubliminalChannel(OngSchnorrShamir):
         Returns:
             True jika verifikasi berhasil, False sebaliknya
         """
-        try:
-            # Verifikasi: S1^2 + h * S2^2 ≡ w' (mod n)
-            left_side = (pow(s1, 2, self.n) + (self.h * pow(s2, 2, self.n))) % self.n
-            return left_side == cover_message % self.n
-            
-        except Exception:
-            return False
+        if self.verification_cache is not None:
+            return self.verification_cache.get_or_verify(
+                self.n, self.h, cover_message, s1, s2, self._check_signature
+            )
+        
+        # Verifikasi: S1^2 + h * S2^2 ≡ w' (mod n)
+        return self._check_signature(cover_message, s1, s2)
     
     def decrypt_original_message(self, s1: int, s2: int) -> int:
         """
@@ -237,23 +1412,297 @@ class SubliminalChannel(OngSchnorrShamir):
         Returns:
             Pesan asli (w)
         """
-        try:
-            # w = S1 - k^-1 * S2  [FIXED: minus, bukan plus!]
-            k_inv = pow(self.k, -1, self.n)
-            original_message = (s1 - (k_inv * s2)) % self.n
+        if self.is_composite:
+            w_p = (s1 - self._k_inv_p * s2) % self._p
+            w_q = (s1 - self._k_inv_q * s2) % self._q
+            return self._crt_combine(w_p, w_q)
+        
+        # w = S1 - k^-1 * S2  [FIXED: minus, bukan plus!]
+        return (s1 - (self._k_inv * s2)) % self.n
+    
+    def receive(self, cover_message: int, s1: int, s2: int) -> "ReceiveResult":
+        """
+        Verifikasi pesan samaran dan ekstrak pesan asli dalam satu langkah
+        
+        Dengan u = k^-1 * S2 berlaku S1^2 + h * S2^2 = (S1 - u)(S1 + u)
+        dan w = S1 - u, sehingga verifikasi cukup memeriksa
+        w * (S1 + u) = w' (mod n) tanpa mengkuadratkan S1 dan S2.
+        
+        Args:
+            cover_message: Pesan samaran (w')
+            s1: Tanda tangan S1
+            s2: Tanda tangan S2
             
-            return original_message
+        Returns:
+            ReceiveResult; original_message None jika tanda tangan tidak valid
+        """
+        n = self.n
+        u = (self._k_inv * s2) % n
+        original_message = (s1 - u) % n
+        if (original_message * (s1 + u) - cover_message) % n:
+            return ReceiveResult(False, None)
+        return ReceiveResult(True, original_message)
+    
+    def receive_batch(self, items: Iterable[Tuple[int, int, int]]) -> List["ReceiveResult"]:
+        """
+        Versi batch dari receive()
+        
+        Args:
+            items: Iterable berisi (w', S1, S2)
             
-        except ValueError as e:
-            raise ValueError(f"Error dalam dekripsi pesan asli: {e}")
+        Returns:
+            List ReceiveResult dengan urutan yang sama seperti input
+        """
+        n, k_inv = self.n, self._k_inv
+        results = []
+        for cover_message, s1, s2 in items:
+            u = (k_inv * s2) % n
+            original_message = (s1 - u) % n
+            if (original_message * (s1 + u) - cover_message) % n:
+                results.append(ReceiveResult(False, None))
+            else:
+                results.append(ReceiveResult(True, original_message))
+        return results
+    
+    def receive_iter(self, items: Iterable[Tuple[int, int, int]],
+                     chunk_size: Optional[int] = None) -> Iterator["ReceiveResult"]:
+        """
+        receive() untuk iterable (w', S1, S2) secara lazy per chunk
+        (chunk_size None = hasil kalibrasi)
+        """
+        if chunk_size is None:
+            chunk_size = tuned_value(self.n.bit_length(), "receive_chunk_size")
+        for chunk in _chunked(items, chunk_size):
+            yield from self.receive_batch(chunk)
+
+
+class ReceiveResult:
+    """
+    Hasil SubliminalChannel.receive: status verifikasi dan pesan asli
+    """
+    
+    __slots__ = ("valid", "original_message")
+    
+    def __init__(self, valid: bool, original_message: Optional[int]):
+        self.valid = valid
+        self.original_message = original_message
+    
+    def __bool__(self) -> bool:
+        return self.valid
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ReceiveResult):
+            return NotImplemented
+        return (self.valid, self.original_message) == (other.valid, other.original_message)
+    
+    def __repr__(self) -> str:
+        return f"ReceiveResult(valid={self.valid}, original_message={self.original_message})"
 
 
-def generate_keys(bits: int = 512) -> Tuple[int, int, int]:
+class Verifier:
+    """
+    Verifikasi tanda tangan hanya dengan kunci publik (n, h)
+    
+    Berguna untuk pihak ketiga yang tidak memegang kunci privat k.
+    """
+    
+    def __init__(self, n: int, h: int,
+                 verification_cache: Optional[VerificationCache] = None):
+        """
+        Args:
+            n: Kunci publik
+            h: Nilai h = -(k^-1)^2 mod n
+            verification_cache: Cache opsional untuk hasil verifikasi
+        """
+        self.n = n
+        self.h = h % n
+        self.verification_cache = verification_cache
+    
+    @classmethod
+    def from_key_file(cls, path: str, **kwargs) -> "Verifier":
+        """
+        Buat verifier dari file kunci (publik maupun privat)
+        """
+        keys = load_keys(path)
+        return cls(keys["n"], keys["h"], **kwargs)
+    
+    @property
+    def key_id(self) -> bytes:
+        """ID kunci pendek yang diturunkan dari n"""
+        return key_fingerprint(self.n)
+    
+    def verify(self, message: int, s1: int, s2: int) -> bool:
+        """
+        Verifikasi: S1^2 + h * S2^2 ≡ M (mod n)
+        
+        Returns:
+            True jika verifikasi berhasil, False sebaliknya
+        """
+        if self.verification_cache is not None:
+            return self.verification_cache.get_or_verify(
+                self.n, self.h, message, s1, s2, self._check_signature
+            )
+        return self._check_signature(message, s1, s2)
+    
+    def _check_signature(self, message: int, s1: int, s2: int) -> bool:
+        """
+        Verifikasi persamaan tanpa cache
+        """
+        try:
+            left_side = (pow(s1, 2, self.n) + (self.h * pow(s2, 2, self.n))) % self.n
+            return left_side == message % self.n
+        except Exception:
+            return False
+    
+    def verify_batch(self, items: Iterable[Tuple[int, int, int]]) -> List[bool]:
+        """
+        Verifikasi banyak tanda tangan (M, S1, S2) sekaligus
+        """
+        return _verify_batch(self.n, self.h, items)
+    
+    def verify_iter(self, items: Iterable[Tuple[int, int, int]],
+                    chunk_size: Optional[int] = None) -> Iterator[bool]:
+        """
+        Verifikasi iterable (M, S1, S2) secara lazy per chunk
+        (chunk_size None = hasil kalibrasi)
+        """
+        if chunk_size is None:
+            chunk_size = tuned_value(self.n.bit_length(), "verify_chunk_size")
+        for chunk in _chunked(items, chunk_size):
+            yield from self.verify_batch(chunk)
+
+
+def verify_mixed(items: Iterable[Tuple[int, int, int, int, int]],
+                 verifiers: Optional[Dict[Tuple[int, int], "Verifier"]] = None) -> List[bool]:
+    """
+    Verifikasi tanda tangan dari banyak kunci yang tercampur
+    
+    Item dikelompokkan per kunci (n, h); setiap kelompok diverifikasi lewat
+    Verifier.verify_batch milik kunci tersebut, lalu hasilnya dikembalikan
+    sesuai urutan input.
+    
+    Args:
+        items: Iterable berisi (n, h, M, S1, S2)
+        verifiers: Dict opsional (n, h) -> Verifier yang dipakai ulang antar
+            panggilan; verifier baru ditambahkan ke dict ini
+            
+    Returns:
+        List hasil verifikasi dengan urutan yang sama seperti input
+    """
+    if verifiers is None:
+        verifiers = {}
+    
+    groups: Dict[Tuple[int, int], List[int]] = {}
+    signatures = []
+    for index, (n, h, message, s1, s2) in enumerate(items):
+        signatures.append((message, s1, s2))
+        # Kunci tidak valid (n atau h bukan int, n < 2) tetap False
+        if isinstance(n, int) and isinstance(h, int) and n >= 2:
+            groups.setdefault((n, h), []).append(index)
+    
+    results = [False] * len(signatures)
+    for key, indices in groups.items():
+        n, h = key
+        verifier = verifiers.get(key)
+        if verifier is None:
+            verifier = verifiers[key] = Verifier(n, h)
+        try:
+            group_results = verifier.verify_batch([signatures[i] for i in indices])
+        except TypeError:
+            group_results = [verifier.verify(*signatures[i]) for i in indices]
+        for index, result in zip(indices, group_results):
+            results[index] = result
+    return results
+
+
+SIGNATURE_VERSION = 1
+KEY_ID_SIZE = 8
+# Header tanda tangan terkemas: versi (1 byte), key ID (8 byte), lebar S1/S2 (2 byte)
+_SIGNATURE_HEADER = struct.Struct(">B8sH")
+
+
+def key_fingerprint(n: int) -> bytes:
+    """
+    ID kunci pendek (8 byte) yang diturunkan dari kunci publik n
+    """
+    width = (n.bit_length() + 7) // 8
+    return hashlib.blake2b(n.to_bytes(width, "big"), digest_size=KEY_ID_SIZE,
+                           person=b"oss-key-id").digest()
+
+
+def public_key_id(n: int, h: int) -> bytes:
+    """
+    ID 8 byte dari kunci publik lengkap (n, h)
+    
+    Berbeda dengan key_fingerprint(n), ID ini membedakan kunci yang memakai
+    n yang sama dengan k (dan h) berbeda; dipakai untuk indeks yang harus
+    memisahkan hasil verifikasi per kunci.
+    """
+    width = (n.bit_length() + 7) // 8
+    return hashlib.blake2b(n.to_bytes(width, "big") + (h % n).to_bytes(width, "big"),
+                           digest_size=KEY_ID_SIZE, person=b"oss-pubkey-id").digest()
+
+
+def packed_signature_size(n: int) -> int:
+    """Ukuran tanda tangan terkemas (byte) untuk modulus n"""
+    return _SIGNATURE_HEADER.size + 2 * ((n.bit_length() + 7) // 8)
+
+
+def pack_signature(s1: int, s2: int, n: int, key_id: Optional[bytes] = None) -> bytes:
+    """
+    Kemas (S1, S2) menjadi bytes lebar tetap dengan header berisi key ID
+    
+    Args:
+        s1, s2: Tanda tangan
+        n: Kunci publik (menentukan lebar S1/S2)
+        key_id: ID kunci; default key_fingerprint(n)
+        
+    Returns:
+        header || S1 || S2, dengan S1 dan S2 big-endian selebar n
+    """
+    if key_id is None:
+        key_id = key_fingerprint(n)
+    if len(key_id) != KEY_ID_SIZE:
+        raise ValueError(f"key_id harus {KEY_ID_SIZE} byte")
+    width = (n.bit_length() + 7) // 8
+    if not (0 <= s1 < n and 0 <= s2 < n):
+        raise ValueError("S1 dan S2 harus berada di rentang [0, n)")
+    return (_SIGNATURE_HEADER.pack(SIGNATURE_VERSION, key_id, width)
+            + s1.to_bytes(width, "big") + s2.to_bytes(width, "big"))
+
+
+def unpack_signature(data: bytes) -> Tuple[bytes, int, int]:
+    """
+    Buka tanda tangan terkemas
+    
+    Returns:
+        Tuple (key_id, S1, S2)
+    """
+    if len(data) < _SIGNATURE_HEADER.size:
+        raise ValueError("Tanda tangan terkemas terlalu pendek")
+    version, key_id, width = _SIGNATURE_HEADER.unpack_from(data)
+    if version != SIGNATURE_VERSION:
+        raise ValueError(f"Versi tanda tangan tidak dikenal: {version}")
+    body = memoryview(data)[_SIGNATURE_HEADER.size:]
+    if len(body) != 2 * width:
+        raise ValueError("Panjang tanda tangan terkemas tidak sesuai header")
+    s1 = int.from_bytes(body[:width], "big")
+    s2 = int.from_bytes(body[width:], "big")
+    return key_id, s1, s2
+
+
+def generate_keys(bits: int = 512, composite: bool = False, rng: Any = None,
+                  prime_kind: str = "plain",
+                  keygen: Optional[KeygenControl] = None) -> Tuple[int, int, int]:
     """
     Generate kunci untuk algoritma Ong-Schnorr-Shamir
     
     Args:
         bits: Panjang bit untuk kunci
+        composite: Jika True, n dibuat sebagai p * q (faktor tidak dikembalikan)
+        rng: Sumber acak opsional (default: modul random global)
+        prime_kind: "plain", "safe" atau "strong"
+        keygen: KeygenControl opsional (deadline, cancel token, progress)
         
     Returns:
         Tuple berisi (n, k, h) dimana:
@@ -261,9 +1710,53 @@ def generate_keys(bits: int = 512) -> Tuple[int, int, int]:
         - k: kunci privat
         - h: nilai h yang dihitung
     """
-    oss = OngSchnorrShamir()
+    oss = OngSchnorrShamir(composite=composite, bits=bits, rng=rng, prime_kind=prime_kind,
+                           keygen=keygen)
     return oss.n, oss.k, oss.h
 
 
+def save_keys(path: str, oss: OngSchnorrShamir, include_private: bool = True) -> None:
+    """
+    Simpan kunci ke file JSON
+    
+    File berisi kunci privat dibuat dengan mode 0600 (hanya pemilik), dan
+    mode file lama yang ditimpa juga dipersempit.
+    
+    Args:
+        path: Path file tujuan
+        oss: Objek yang kuncinya akan disimpan
+        include_private: Jika False, hanya n dan h (kunci publik) yang ditulis
+    """
+    keys = {"n": oss.n, "h": oss.h}
+    if not include_private:
+        with open(path, "w") as f:
+            json.dump(keys, f)
+        return
+    
+    keys["k"] = oss.k
+    if oss.is_composite:
+        keys["p"] = oss._p
+        keys["q"] = oss._q
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(keys, f)
+
+
+def load_keys(path: str) -> dict:
+    """
+    Baca kunci dari file JSON yang ditulis oleh save_keys
+    
+    Returns:
+        Dict dengan kunci "n", "h" dan opsional "k", "p", "q"
+    """
+    with open(path) as f:
+        keys = json.load(f)
+    if "n" not in keys or "h" not in keys:
+        raise ValueError("File kunci harus berisi n dan h")
+    return {name: int(value) for name, value in keys.items()}
+
+
 # CLEANED: Removed if __name__ == "__main__" block
 # This is now a pure library file - demo code moved to demo.py and examples.py
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+
+"""
+Arsip tanda tangan append-only dengan indeks digest untuk lookup acak
+
+File arsip (.ossarc) berisi record lebar tetap untuk satu kunci:
+
+    header  ">4sBH8s"   magic b"OSAR", versi, lebar, key_fingerprint(n)
+    record  M || pack_signature(S1, S2, n)    (M big-endian selebar n)
+
+File indeks (.idx) dibangun offline oleh build_index() (external sort,
+memori dibatasi per run) dan berisi entri (digest pesan, nomor record)
+yang diurutkan menurut digest:
+
+    header  ">4sBQ"     magic b"OSAI", versi, jumlah record yang diindeks
+    entri   ">16sQ"     digest 16 byte, nomor record
+
+Lookup satu tanda tangan historis adalah binary search di atas indeks
+yang di-mmap, lalu satu baca record; scan range membaca record berurutan
+dan meneruskannya ke verify_batch.
+
+Contoh:
+    python signature_archive.py index sigs.ossarc
+    python signature_archive.py lookup sigs.ossarc --key pub.json 12345
+    python signature_archive.py verify sigs.ossarc --key pub.json --start 0 --stop 100000
+"""
+
+import sys
+import os
+import mmap
+import struct
+import heapq
+import hashlib
+import argparse
+import tempfile
+from typing import Iterator, List, Optional, Tuple
+
+from ong_schnorr_shamir import (
+    Verifier, key_fingerprint, load_keys, pack_signature, unpack_signature,
+    _SIGNATURE_HEADER, _chunked,
+)
+
+ARCHIVE_MAGIC = b"OSAR"
+INDEX_MAGIC = b"OSAI"
+ARCHIVE_VERSION = 1
+DIGEST_SIZE = 16
+_ARCHIVE_HEADER = struct.Struct(">4sBH8s")
+_INDEX_HEADER = struct.Struct(">4sBQ")
+_INDEX_ENTRY = struct.Struct(">16sQ")
+# Entri per run external sort (~24 MiB terkemas) dan jumlah run per merge
+INDEX_RUN_ENTRIES = 1 << 20
+INDEX_MERGE_FAN_IN = 64
+
+
+def message_digest(message: int, width: int) -> bytes:
+    """Digest 16 byte dari pesan (big-endian selebar n) untuk kunci indeks"""
+    return hashlib.blake2b(message.to_bytes(width, "big"), digest_size=DIGEST_SIZE,
+                           person=b"oss-archive").digest()
+
+
+def _record_size(width: int) -> int:
+    """Ukuran satu record: M ditambah tanda tangan terkemas"""
+    return width + _SIGNATURE_HEADER.size + 2 * width
+
+
+def default_index_path(archive_path: str) -> str:
+    return archive_path + ".idx"
+
+
+def _read_archive_header(f) -> Tuple[int, bytes]:
+    header = f.read(_ARCHIVE_HEADER.size)
+    if len(header) != _ARCHIVE_HEADER.size:
+        raise ValueError("File arsip terpotong")
+    magic, version, width, key_id = _ARCHIVE_HEADER.unpack(header)
+    if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+        raise ValueError("Bukan file arsip tanda tangan yang didukung")
+    return width, key_id
+
+
+class ArchiveWriter:
+    """
+    Penulis append-only untuk arsip satu kunci
+
+    Membuka arsip yang sudah ada (header harus cocok dengan n) atau
+    membuat arsip baru.
+    """
+
+    def __init__(self, path: str, n: int):
+        self.n = n
+        self.width = (n.bit_length() + 7) // 8
+        self.key_id = key_fingerprint(n)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as f:
+                width, key_id = _read_archive_header(f)
+            if key_id != self.key_id or width != self.width:
+                raise ValueError("Arsip dibuat untuk kunci lain")
+        self._file = open(path, "ab")
+        if not exists:
+            self._file.write(_ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION,
+                                                  self.width, self.key_id))
+
+    def append(self, message: int, s1: int, s2: int) -> None:
+        """Tambahkan satu record (M, S1, S2)"""
+        if not 0 <= message < self.n:
+            raise ValueError("Pesan harus berada di rentang [0, n)")
+        self._file.write(message.to_bytes(self.width, "big")
+                         + pack_signature(s1, s2, self.n, self.key_id))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _write_run(entries: List[bytes], directory: str) -> str:
+    """Urutkan satu run entri terkemas dan tulis ke file sementara"""
+    entries.sort()
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(b"".join(entries))
+    return path
+
+
+def _read_entries(f, batch: int = 4096) -> Iterator[bytes]:
+    """Yield entri terkemas berurutan dari file run"""
+    size = _INDEX_ENTRY.size
+    while True:
+        chunk = f.read(size * batch)
+        if not chunk:
+            return
+        for offset in range(0, len(chunk), size):
+            yield chunk[offset:offset + size]
+
+
+def _merge_runs(paths: List[str], out) -> None:
+    """Gabungkan run terurut (k-way merge) ke file yang sudah terbuka"""
+    files = [open(path, "rb") for path in paths]
+    try:
+        for entry in heapq.merge(*(_read_entries(f) for f in files)):
+            out.write(entry)
+    finally:
+        for f in files:
+            f.close()
+
+
+def build_index(archive_path: str, index_path: Optional[str] = None,
+                run_size: int = INDEX_RUN_ENTRIES, fan_in: int = INDEX_MERGE_FAN_IN) -> int:
+    """
+    Bangun indeks digest terurut untuk seluruh arsip (offline)
+
+    Memakai external sort agar memori tetap terbatas untuk arsip yang jauh
+    lebih besar dari RAM: entri ">16sQ" terkemas dikumpulkan per run
+    (run_size entri), setiap run diurutkan dan ditulis ke file sementara di
+    direktori indeks, lalu run digabung dengan k-way merge (paling banyak
+    fan_in file terbuka sekaligus; lebih dari itu digabung bertahap).
+    Urutan byte entri terkemas sama dengan urutan (digest, nomor record).
+
+    Indeks ditulis ke file sementara lalu diganti secara atomik, sehingga
+    pembaca tidak pernah melihat indeks setengah jadi.
+
+    Returns:
+        Jumlah record yang diindeks
+    """
+    if run_size < 1 or fan_in < 2:
+        raise ValueError("run_size harus >= 1 dan fan_in >= 2")
+    index_path = index_path or default_index_path(archive_path)
+    directory = os.path.dirname(os.path.abspath(index_path))
+    runs: List[str] = []
+    try:
+        with open(archive_path, "rb") as f:
+            width, _ = _read_archive_header(f)
+            record_size = _record_size(width)
+            entries: List[bytes] = []
+            count = 0
+            while True:
+                record = f.read(record_size)
+                if len(record) < record_size:
+                    break
+                digest = message_digest(int.from_bytes(record[:width], "big"), width)
+                entries.append(_INDEX_ENTRY.pack(digest, count))
+                count += 1
+                if len(entries) >= run_size:
+                    runs.append(_write_run(entries, directory))
+                    entries = []
+            if entries or not runs:
+                runs.append(_write_run(entries, directory))
+
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+                with os.fdopen(fd, "wb") as out:
+                    _merge_runs(group, out)
+                merged.append(path)
+                for run in group:
+                    os.remove(run)
+            runs = merged
+
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(_INDEX_HEADER.pack(INDEX_MAGIC, ARCHIVE_VERSION, count))
+            _merge_runs(runs, out)
+        os.replace(tmp_path, index_path)
+    finally:
+        for run in runs:
+            if os.path.exists(run):
+                os.remove(run)
+    return count
+
+
+class SignatureArchive:
+    """
+    Pembaca arsip dengan lookup acak lewat indeks yang di-mmap
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        """
+        Args:
+            path: File arsip
+            index_path: File indeks (default: path + ".idx"); lookup() butuh
+                indeks, scan tidak
+        """
+        with open(path, "rb") as f:
+            self.width, self.key_id = _read_archive_header(f)
+            self.record_size = _record_size(self.width)
+            size = f.seek(0, 2)
+            self._archive = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                             if size > _ARCHIVE_HEADER.size else None)
+        self._length = (size - _ARCHIVE_HEADER.size) // self.record_size
+
+        self._index = None
+        self.indexed = 0
+        index_path = index_path or default_index_path(path)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) == _INDEX_HEADER.size:
+                    magic, version, count = _INDEX_HEADER.unpack(header)
+                    if magic != INDEX_MAGIC or version != ARCHIVE_VERSION:
+                        raise ValueError("Bukan file indeks arsip yang didukung")
+                    self.indexed = count
+                    if count:
+                        self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def stale(self) -> bool:
+        """True jika ada record yang ditambahkan setelah indeks dibangun"""
+        return self.indexed != self._length
+
+    def record(self, number: int) -> Tuple[int, int, int]:
+        """Baca record ke-number sebagai (M, S1, S2)"""
+        if not 0 <= number < self._length:
+            raise IndexError("Nomor record di luar rentang")
+        offset = _ARCHIVE_HEADER.size + number * self.record_size
+        data = self._archive[offset:offset + self.record_size]
+        _, s1, s2 = unpack_signature(data[self.width:])
+        return int.from_bytes(data[:self.width], "big"), s1, s2
+
+    def _index_digest(self, position: int) -> bytes:
+        offset = _INDEX_HEADER.size + position * _INDEX_ENTRY.size
+        return self._index[offset:offset + DIGEST_SIZE]
+
+    def _index_record(self, position: int) -> int:
+        offset = _INDEX_HEADER.size + position * _INDEX_ENTRY.size
+        return _INDEX_ENTRY.unpack_from(self._index, offset)[1]
+
+    def lookup(self, message: int) -> Optional[Tuple[int, int]]:
+        """
+        Cari tanda tangan untuk pesan lewat binary search di indeks
+
+        Returns:
+            (S1, S2) dari record pertama dengan pesan tersebut, atau None
+        """
+        if self._index is None or not 0 <= message < 1 << (8 * self.width):
+            return None
+        digest = message_digest(message, self.width)
+        low, high = 0, self.indexed
+        while low < high:
+            mid = (low + high) // 2
+            if self._index_digest(mid) < digest:
+                low = mid + 1
+            else:
+                high = mid
+        while low < self.indexed and self._index_digest(low) == digest:
+            stored, s1, s2 = self.record(self._index_record(low))
+            if stored == message:
+                return s1, s2
+            low += 1
+        return None
+
+    def verify(self, verifier: Verifier, message: int) -> bool:
+        """Lookup lalu verifikasi satu tanda tangan historis"""
+        self._check_verifier(verifier)
+        signature = self.lookup(message)
+        return signature is not None and verifier.verify(message, *signature)
+
+    def scan(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        """Yield (M, S1, S2) untuk record [start, stop) secara berurutan"""
+        stop = self._length if stop is None else min(stop, self._length)
+        for number in range(max(start, 0), stop):
+            yield self.record(number)
+
+    def verify_range(self, verifier: Verifier, start: int = 0, stop: Optional[int] = None,
+                     chunk_size: int = 1024) -> List[bool]:
+        """Verifikasi record [start, stop) per chunk lewat verify_batch"""
+        self._check_verifier(verifier)
+        results = []
+        for chunk in _chunked(self.scan(start, stop), chunk_size):
+            results.extend(verifier.verify_batch(chunk))
+        return results
+
+    def _check_verifier(self, verifier: Verifier) -> None:
+        if key_fingerprint(verifier.n) != self.key_id:
+            raise ValueError("Verifier tidak cocok dengan kunci arsip")
+
+    def close(self) -> None:
+        for mapped in (self._archive, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._archive = self._index = None
+
+    def __enter__(self) -> "SignatureArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main(argv=None) -> int:
+    """Entry point; exit code 1 jika tanda tangan tidak ditemukan atau tidak valid"""
+    parser = argparse.ArgumentParser(description="Arsip tanda tangan dengan indeks digest")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index = subparsers.add_parser("index", help="bangun indeks digest")
+    index.add_argument("archive")
+
+    lookup = subparsers.add_parser("lookup", help="cari dan verifikasi satu pesan")
+    lookup.add_argument("archive")
+    lookup.add_argument("--key", required=True, help="file kunci (publik cukup)")
+    lookup.add_argument("message", type=int)
+
+    verify = subparsers.add_parser("verify", help="verifikasi range record")
+    verify.add_argument("archive")
+    verify.add_argument("--key", required=True, help="file kunci (publik cukup)")
+    verify.add_argument("--start", type=int, default=0)
+    verify.add_argument("--stop", type=int)
+
+    args = parser.parse_args(argv)
+    if args.command == "index":
+        count = build_index(args.archive)
+        print(f"📇 {count} record diindeks")
+        return 0
+
+    keys = load_keys(args.key)
+    verifier = Verifier(keys["n"], keys["h"])
+    with SignatureArchive(args.archive) as archive:
+        if args.command == "lookup":
+            signature = archive.lookup(args.message)
+            if signature is None:
+                print("❌ Tidak ditemukan")
+                return 1
+            valid = verifier.verify(args.message, *signature)
+            print(f"{'✅' if valid else '❌'} S1={signature[0]} S2={signature[1]}")
+            return 0 if valid else 1
+
+        results = archive.verify_range(verifier, args.start, args.stop)
+    failed = results.count(False)
+    print(f"🔍 {len(results) - failed} valid, {failed} tidak valid")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+"""
+Penyimpanan kolumnar untuk banyak tanda tangan (S1, S2)
+
+Satu tuple (S1, S2) berisi int Python memakan ratusan byte (header objek
+int dan tuple ditambah pointer list). SignatureArray menyimpan setiap
+tanda tangan sebagai dua bilangan big-endian dengan lebar tetap
+(byte_length(n)) di satu bytearray yang bersambung, atau langsung dari
+file lewat mmap, sehingga biayanya hanya 2 * byte_length(n) per item.
+Int baru dibuat saat item dibaca atau diverifikasi.
+
+Format file:
+    header  ">4sBH8s"  magic b"OSSA", versi, lebar, key_fingerprint(n)
+    record  S1 || S2   masing-masing `lebar` byte, big-endian
+"""
+
+import mmap
+import struct
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from ong_schnorr_shamir import key_fingerprint
+
+ARRAY_MAGIC = b"OSSA"
+ARRAY_VERSION = 1
+_ARRAY_HEADER = struct.Struct(">4sBH8s")
+
+
+class SignatureArray:
+    """
+    Array tanda tangan dengan record lebar tetap di satu buffer
+
+    Mendukung len(), indexing (mengembalikan (S1, S2)), slicing
+    (mengembalikan SignatureArray baru), iterasi, append/extend, dan
+    akses memoryview ke buffer mentah.
+    """
+
+    def __init__(self, n: int, buffer: Union[bytearray, memoryview, None] = None):
+        """
+        Args:
+            n: Modulus kunci; menentukan lebar record
+            buffer: Buffer record yang sudah ada (default: bytearray kosong)
+        """
+        if n < 2:
+            raise ValueError("n harus > 1")
+        self.n = n
+        self.width = (n.bit_length() + 7) // 8
+        self.record_size = 2 * self.width
+        self._buffer = bytearray() if buffer is None else buffer
+        self._mmap: Optional[mmap.mmap] = None
+        if len(self._buffer) % self.record_size:
+            raise ValueError("Panjang buffer bukan kelipatan ukuran record")
+
+    @classmethod
+    def from_signatures(cls, n: int, signatures: Iterable[Tuple[int, int]]) -> "SignatureArray":
+        """Buat array dari iterable (S1, S2) (atau (S1, S2, r) dari sign_batch)"""
+        array = cls(n)
+        array.extend(signatures)
+        return array
+
+    def _encode(self, value: int) -> bytes:
+        if not 0 <= value < self.n:
+            raise ValueError("Komponen tanda tangan harus dalam rentang [0, n)")
+        return value.to_bytes(self.width, "big")
+
+    def append(self, s1: int, s2: int) -> None:
+        """Tambahkan satu tanda tangan di akhir array"""
+        if not isinstance(self._buffer, bytearray):
+            raise TypeError("SignatureArray hasil mmap bersifat read-only")
+        self._buffer += self._encode(s1) + self._encode(s2)
+
+    def extend(self, signatures: Iterable[Tuple[int, ...]]) -> None:
+        """Tambahkan banyak tanda tangan; elemen ekstra (mis. r) diabaikan"""
+        for signature in signatures:
+            self.append(signature[0], signature[1])
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self.record_size
+
+    def _decode(self, offset: int) -> Tuple[int, int]:
+        width = self.width
+        buffer = self._buffer
+        return (int.from_bytes(buffer[offset:offset + width], "big"),
+                int.from_bytes(buffer[offset + width:offset + 2 * width], "big"))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, int], "SignatureArray"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            size = self.record_size
+            if step == 1:
+                data = bytearray(self._buffer[start * size:max(start, stop) * size])
+            else:
+                data = bytearray()
+                for i in range(start, stop, step):
+                    data += self._buffer[i * size:(i + 1) * size]
+            return SignatureArray(self.n, data)
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Index SignatureArray di luar rentang")
+        return self._decode(index * self.record_size)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for offset in range(0, len(self) * self.record_size, self.record_size):
+            yield self._decode(offset)
+
+    def record(self, index: int) -> memoryview:
+        """memoryview ke byte mentah satu record (S1 || S2) tanpa salinan"""
+        if not 0 <= index < len(self):
+            raise IndexError("Index SignatureArray di luar rentang")
+        offset = index * self.record_size
+        return memoryview(self._buffer)[offset:offset + self.record_size]
+
+    def memoryview(self) -> memoryview:
+        """memoryview ke seluruh buffer record tanpa salinan"""
+        return memoryview(self._buffer)
+
+    def items(self, messages: Iterable[int]) -> Iterator[Tuple[int, int, int]]:
+        """Pasangkan pesan dengan tanda tangan: yield (M, S1, S2) secara lazy"""
+        for message, (s1, s2) in zip(messages, self):
+            yield message, s1, s2
+
+    def verify(self, verifier, messages: Iterable[int]) -> list:
+        """
+        Verifikasi semua tanda tangan terhadap pesan yang bersesuaian
+
+        Item didekode satu per satu saat diverifikasi, sehingga tidak ada
+        list tuple (M, S1, S2) yang dibangun di memori.
+
+        Args:
+            verifier: Verifier atau DigitalSignature dengan n yang sama
+            messages: Pesan sesuai urutan array
+
+        Returns:
+            List hasil verifikasi
+        """
+        if verifier.n != self.n:
+            raise ValueError("Verifier memakai modulus yang berbeda")
+        return verifier.verify_batch(self.items(messages))
+
+    def save(self, path: str) -> None:
+        """Tulis header dan semua record ke file"""
+        with open(path, "wb") as f:
+            f.write(_ARRAY_HEADER.pack(ARRAY_MAGIC, ARRAY_VERSION, self.width,
+                                       key_fingerprint(self.n)))
+            f.write(self._buffer)
+
+    @classmethod
+    def load(cls, path: str, n: int, use_mmap: bool = True) -> "SignatureArray":
+        """
+        Buka file SignatureArray
+
+        Args:
+            path: File hasil save()
+            n: Modulus kunci; harus cocok dengan fingerprint di header
+            use_mmap: True = petakan file read-only (tanpa membaca semuanya
+                ke memori), False = salin ke bytearray yang bisa di-append
+        """
+        with open(path, "rb") as f:
+            header = f.read(_ARRAY_HEADER.size)
+            if len(header) != _ARRAY_HEADER.size:
+                raise ValueError("File SignatureArray terpotong")
+            magic, version, width, key_id = _ARRAY_HEADER.unpack(header)
+            if magic != ARRAY_MAGIC or version != ARRAY_VERSION:
+                raise ValueError("Bukan file SignatureArray yang didukung")
+            if key_id != key_fingerprint(n) or width != (n.bit_length() + 7) // 8:
+                raise ValueError("File SignatureArray dibuat untuk kunci lain")
+
+            if not use_mmap:
+                return cls(n, bytearray(f.read()))
+            if f.seek(0, 2) == _ARRAY_HEADER.size:
+                return cls(n, memoryview(b""))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        array = cls(n, memoryview(mapped)[_ARRAY_HEADER.size:])
+        array._mmap = mapped
+        return array
+
+    def close(self) -> None:
+        """Lepaskan mmap (jika ada); memoryview dari record()/memoryview() harus dilepas dulu"""
+        if self._mmap is not None:
+            self._buffer.release()
+            self._buffer = memoryview(b"")
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "SignatureArray":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Keyring dengan key ID di dalam tanda tangan terkemas
+
+Setiap kunci diidentifikasi oleh key_fingerprint(n) (8 byte) yang ikut
+ditulis di header tanda tangan terkemas. Saat verifikasi, key ID dibaca
+dari header dan verifier yang tepat diambil langsung dari dict, sehingga
+biaya verifikasi tidak bertambah dengan jumlah kunci aktif selama rotasi.
+
+Penambahan dan penghapusan kunci mengganti dict secara atomik
+(copy-on-write), sehingga verifikasi dari banyak thread tidak perlu lock
+dan kunci bisa dirotasi tanpa restart.
+"""
+
+import threading
+from typing import Dict, List, Optional, Union
+
+from ong_schnorr_shamir import (
+    DigitalSignature,
+    Verifier,
+    VerificationCache,
+    key_fingerprint,
+    pack_signature,
+    unpack_signature,
+)
+
+
+class KeyRing:
+    """
+    Kumpulan kunci aktif yang diindeks berdasarkan key ID
+    """
+
+    def __init__(self, verification_cache: Optional[VerificationCache] = None):
+        """
+        Args:
+            verification_cache: Cache opsional yang dipakai bersama oleh semua verifier
+        """
+        self.verification_cache = verification_cache
+        self._verifiers: Dict[bytes, Verifier] = {}
+        self._signers: Dict[bytes, DigitalSignature] = {}
+        self._active: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def add(self, key: Union[DigitalSignature, Verifier], activate: bool = False) -> bytes:
+        """
+        Tambahkan kunci ke keyring
+
+        Args:
+            key: DigitalSignature (bisa menandatangani) atau Verifier (hanya verifikasi)
+            activate: Jadikan kunci ini kunci default untuk sign()
+
+        Returns:
+            Key ID kunci tersebut
+
+        Raises:
+            ValueError: Jika key ID sudah dipakai kunci lain (termasuk kunci
+                dengan n sama tetapi h berbeda), atau activate=True untuk
+                Verifier; keyring tidak berubah
+        """
+        signer = isinstance(key, DigitalSignature)
+        if activate and not signer:
+            raise ValueError("Kunci publik tidak bisa dijadikan kunci penanda tangan")
+        key_id = key_fingerprint(key.n)
+        verifier = Verifier(key.n, key.h, verification_cache=self.verification_cache)
+        with self._lock:
+            existing = self._verifiers.get(key_id)
+            if existing is not None and (existing.n, existing.h) != (key.n, key.h % key.n):
+                # Key ID hanya diturunkan dari n; kunci lain dengan n sama
+                # (k berbeda) tidak boleh menggantikan verifier yang ada
+                raise ValueError("Tabrakan key ID dengan kunci lain")
+            self._verifiers = {**self._verifiers, key_id: verifier}
+            if signer:
+                self._signers = {**self._signers, key_id: key}
+                if activate or self._active is None:
+                    self._active = key_id
+        return key_id
+
+    def retire(self, key_id: bytes) -> None:
+        """
+        Hapus kunci; tanda tangan dengan key ID ini tidak lagi lolos verifikasi
+        """
+        with self._lock:
+            if key_id not in self._verifiers:
+                raise KeyError(key_id)
+            self._verifiers = {k: v for k, v in self._verifiers.items() if k != key_id}
+            self._signers = {k: v for k, v in self._signers.items() if k != key_id}
+            if self._active == key_id:
+                self._active = next(iter(self._signers), None)
+
+    def activate(self, key_id: bytes) -> None:
+        """Jadikan kunci tertentu kunci default untuk sign()"""
+        with self._lock:
+            if key_id not in self._signers:
+                raise KeyError(key_id)
+            self._active = key_id
+
+    @property
+    def active_key_id(self) -> Optional[bytes]:
+        return self._active
+
+    def key_ids(self) -> List[bytes]:
+        return list(self._verifiers)
+
+    def __contains__(self, key_id: bytes) -> bool:
+        return key_id in self._verifiers
+
+    def __len__(self) -> int:
+        return len(self._verifiers)
+
+    def sign(self, message: int, key_id: Optional[bytes] = None) -> bytes:
+        """
+        Tanda tangani pesan dan kembalikan tanda tangan terkemas berisi key ID
+
+        Args:
+            message: Pesan (M)
+            key_id: Kunci yang dipakai; default kunci aktif
+        """
+        key_id = key_id if key_id is not None else self._active
+        signer = self._signers.get(key_id) if key_id is not None else None
+        if signer is None:
+            raise KeyError("Tidak ada kunci penanda tangan untuk key ID ini")
+        s1, s2, _ = signer.sign_message(message)
+        return pack_signature(s1, s2, signer.n, key_id)
+
+    def verify(self, message: int, packed: bytes) -> bool:
+        """
+        Verifikasi tanda tangan terkemas dengan verifier yang dipilih dari header
+
+        Returns:
+            True jika key ID dikenal dan tanda tangan valid, False sebaliknya
+        """
+        try:
+            key_id, s1, s2 = unpack_signature(packed)
+        except (ValueError, TypeError):
+            return False
+        verifier = self._verifiers.get(key_id)
+        if verifier is None:
+            return False
+        return verifier.verify(message, s1, s2)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk job verifikasi arsip dengan checkpoint (bulk_verify.py)
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, save_keys
+from bulk_verify import BulkVerifyJob, plan_ranges, main
+from test_helpers import load_fixture_keys
+
+LINES = 300
+BAD_LINES = {17, 150, 299}
+
+
+class TestBulkVerifyJob(unittest.TestCase):
+    """Test case untuk BulkVerifyJob"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.key = os.path.join(self.tmpdir, "pub.json")
+        self.archive = os.path.join(self.tmpdir, "archive.txt")
+        self.checkpoint = os.path.join(self.tmpdir, "job.ckpt")
+
+        ds = DigitalSignature(**load_fixture_keys(256))
+        save_keys(self.key, ds, include_private=False)
+        with open(self.archive, "w") as f:
+            for m, (s1, s2, _) in enumerate(ds.sign_batch(range(LINES))):
+                f.write(f"{m + 1 if m in BAD_LINES else m} {s1} {s2}\n")
+            f.write("not a signature\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_ranges_cover_file_on_line_boundaries(self):
+        """Test range bersambung, menutupi seluruh file, dan mulai di awal baris"""
+        ranges = plan_ranges(self.archive, 1000)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.archive))
+        with open(self.archive, "rb") as f:
+            data = f.read()
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 1:start], b"\n")
+
+    def test_full_run(self):
+        """Test satu kali jalan menghitung semua tanda tangan"""
+        summary = BulkVerifyJob(self.archive, self.key, self.checkpoint, range_size=2000).run()
+        self.assertTrue(summary["complete"])
+        self.assertEqual(summary["ok"], LINES - len(BAD_LINES))
+        self.assertEqual(summary["failed"], len(BAD_LINES) + 1)
+
+    def test_resume_after_interruption(self):
+        """Test job yang berhenti dilanjutkan tanpa menghitung ulang range"""
+        first = BulkVerifyJob(self.archive, self.key, self.checkpoint, range_size=2000)
+        partial = first.run(max_ranges=3)
+        self.assertFalse(partial["complete"])
+        self.assertEqual(partial["ranges_done"], 3)
+
+        with open(self.checkpoint) as f:
+            state = json.load(f)
+        self.assertEqual(len(state["done"]), 3)
+        self.assertGreater(state["offset"], 0)
+
+        resumed = BulkVerifyJob(self.archive, self.key, self.checkpoint, range_size=2000, jobs=2)
+        summary = resumed.run()
+        self.assertTrue(summary["complete"])
+        self.assertEqual(summary["ok"] + summary["failed"], LINES + 1)
+        self.assertEqual(len(resumed.state["failures"]), len(BAD_LINES) + 1)
+
+    def test_mismatched_checkpoint_rejected(self):
+        """Test checkpoint dari konfigurasi lain ditolak"""
+        BulkVerifyJob(self.archive, self.key, self.checkpoint, range_size=2000).run(max_ranges=1)
+        with self.assertRaises(ValueError):
+            BulkVerifyJob(self.archive, self.key, self.checkpoint, range_size=4000)
+
+    def test_cli_exit_codes(self):
+        """Test exit code 3 saat belum selesai dan 1 saat ada kegagalan"""
+        args = [self.archive, "--key", self.key, "--checkpoint", self.checkpoint,
+                "--range-size", "2000"]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(args + ["--max-ranges", "1"]), 3)
+            self.assertEqual(main(args), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk kalibrasi otomatis dan cache tuning (calibrate.py)
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+import ong_schnorr_shamir
+from calibrate import calibrate, save_tuning, main
+from ong_schnorr_shamir import (
+    DigitalSignature, DEFAULT_TUNING, TUNING_FILE_ENV, TUNING_VERSION,
+    load_tuning, set_tuning, tuned_value, _sieve_table, np,
+)
+from test_helpers import load_fixture_keys
+
+
+class TestCalibrate(unittest.TestCase):
+    """Test case untuk calibrate, cache tuning dan pemakaiannya di library"""
+
+    def setUp(self):
+        """Cache tuning di direktori sementara, terisolasi dari cache pengguna"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "tuning.json")
+        self.old_env = os.environ.get(TUNING_FILE_ENV)
+        os.environ[TUNING_FILE_ENV] = self.path
+        set_tuning(None)
+
+    def tearDown(self):
+        if self.old_env is None:
+            del os.environ[TUNING_FILE_ENV]
+        else:
+            os.environ[TUNING_FILE_ENV] = self.old_env
+        set_tuning(None)
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, data):
+        with open(self.path, "w") as f:
+            json.dump(data, f)
+
+    def test_calibrate_picks_candidates(self):
+        """Test setiap parameter dipilih dari kandidat yang diukur"""
+        data = calibrate([128], batch_sizes=(4, 32), items=64, repeat=1, prime_count=1)
+        self.assertEqual(data["version"], TUNING_VERSION)
+        profile = data["profiles"]["128"]
+        for name in ("sign_chunk_size", "verify_chunk_size", "receive_chunk_size"):
+            self.assertIn(profile[name], (4, 32))
+            self.assertEqual(set(profile["timings"][name]), {"4", "32"})
+        self.assertIn(profile["sieve_backend"],
+                      ("bytearray", "numpy") if np is not None else ("bytearray",))
+
+    def test_save_roundtrip_and_activate(self):
+        """Test save_tuning menulis cache yang terbaca dan langsung aktif"""
+        data = {"version": TUNING_VERSION, "profiles": {"512": {"sign_chunk_size": 64}}}
+        save_tuning(data)
+        self.assertEqual(load_tuning(), {512: {"sign_chunk_size": 64}})
+        self.assertEqual(tuned_value(512, "sign_chunk_size"), 64)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_library_reads_cache_at_first_use(self):
+        """Test sign_iter/verify_iter memakai ukuran chunk dari cache"""
+        self.write({"version": TUNING_VERSION, "profiles": {
+            "256": {"sign_chunk_size": 7, "verify_chunk_size": 5},
+            "2048": {"sign_chunk_size": 1000},
+        }})
+        ds = DigitalSignature(**load_fixture_keys(256))
+        chunks = []
+        sign_batch = ds.sign_batch
+        ds.sign_batch = lambda messages: chunks.append(len(messages)) or sign_batch(messages)
+        signatures = list(ds.sign_iter(range(1, 16)))
+
+        self.assertEqual(chunks, [7, 7, 1])
+        self.assertTrue(all(ds.verify_iter((m, s1, s2) for m, (s1, s2, _) in
+                                           zip(range(1, 16), signatures))))
+        self.assertEqual(tuned_value(300, "verify_chunk_size"), 5)
+        self.assertEqual(tuned_value(300, "receive_chunk_size"), DEFAULT_TUNING["receive_chunk_size"])
+
+    def test_invalid_cache_falls_back_to_defaults(self):
+        """Test cache rusak atau berversi lain diabaikan"""
+        self.write({"version": TUNING_VERSION + 1, "profiles": {"256": {"sign_chunk_size": 3}}})
+        self.assertEqual(load_tuning(), {})
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(load_tuning(), {})
+        self.assertEqual(tuned_value(256, "sign_chunk_size"), DEFAULT_TUNING["sign_chunk_size"])
+        self.assertEqual(load_tuning(os.path.join(self.tmpdir, "missing.json")), {})
+
+    def test_invalid_values_fall_back_to_defaults(self):
+        """Test nilai tidak valid di profil dibuang dan diganti nilai bawaan"""
+        self.write({"version": TUNING_VERSION, "profiles": {"256": {
+            "sign_chunk_size": 0, "verify_chunk_size": "64", "receive_chunk_size": True,
+            "sieve_backend": "gpu", "unknown": 1,
+        }, "512": {"sign_chunk_size": -3, "verify_chunk_size": 32}}})
+        self.assertEqual(load_tuning(), {256: {}, 512: {"verify_chunk_size": 32}})
+        for name in ("sign_chunk_size", "receive_chunk_size", "sieve_backend"):
+            self.assertEqual(tuned_value(256, name), DEFAULT_TUNING[name])
+
+        ds = DigitalSignature(**load_fixture_keys(256))
+        self.assertEqual(len(list(ds.sign_iter(range(1, 4)))), 3)
+
+        set_tuning({256: {"sign_chunk_size": 0}})
+        self.assertEqual(tuned_value(256, "sign_chunk_size"), DEFAULT_TUNING["sign_chunk_size"])
+
+    def test_sieve_backend_from_cache(self):
+        """Test backend saringan mengikuti cache jika use_numpy tidak diberikan"""
+        set_tuning({96: {"sieve_backend": "bytearray"}})
+        ong_schnorr_shamir._sieve_tables.clear()
+        self.assertFalse(_sieve_table(96).use_numpy)
+        self.assertEqual(_sieve_table(96, use_numpy=True).use_numpy, np is not None)
+
+    def test_cli_dry_run(self):
+        """Test CLI --dry-run tidak menulis cache"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["--bits", "128", "--batch-sizes", "8", "--items", "16",
+                                   "--repeat", "1", "--dry-run"]), 0)
+        self.assertIn("128", output.getvalue())
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk command-line interface (cli.py)
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+import cli
+import test_helpers  # noqa: F401  (nonaktifkan cache tuning)
+
+
+def run_cli(*argv):
+    """Jalankan cli.main dan kembalikan (exit_code, output JSON)"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        code = cli.main([str(arg) for arg in argv])
+    output = buffer.getvalue().strip()
+    return code, json.loads(output) if output else None
+
+
+class TestCli(unittest.TestCase):
+    """Test case untuk subcommand CLI"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.key = os.path.join(cls.tmpdir, "keys.json")
+        cls.pub = os.path.join(cls.tmpdir, "pub.json")
+        run_cli("keygen", "--bits", 256, "--composite", "--out", cls.key, "--public-out", cls.pub)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def test_keygen_public_file_has_no_private_key(self):
+        """Test file kunci publik tidak berisi k maupun faktor"""
+        with open(self.pub) as f:
+            public = json.load(f)
+        self.assertEqual(set(public), {"n", "h"})
+
+    @unittest.skipUnless(os.name == "posix", "mode file POSIX")
+    def test_keygen_private_file_mode(self):
+        """Test file kunci privat hanya bisa dibaca pemilik, file publik tidak dibatasi"""
+        self.assertEqual(os.stat(self.key).st_mode & 0o777, 0o600)
+
+        existing = os.path.join(self.tmpdir, "existing.json")
+        with open(existing, "w"):
+            pass
+        os.chmod(existing, 0o644)
+        run_cli("keygen", "--bits", 128, "--out", existing)
+        self.assertEqual(os.stat(existing).st_mode & 0o777, 0o600)
+
+    def test_sign_and_verify(self):
+        """Test sign dengan kunci privat dan verify dengan kunci publik"""
+        code, signed = run_cli("sign", "--key", self.key, 12345)
+        self.assertEqual(code, 0)
+
+        code, result = run_cli("verify", "--key", self.pub, 12345, signed["s1"], signed["s2"])
+        self.assertEqual(code, 0)
+        self.assertTrue(result["valid"])
+
+        code, result = run_cli("verify", "--key", self.pub, 12346, signed["s1"], signed["s2"])
+        self.assertEqual(code, 1)
+        self.assertFalse(result["valid"])
+
+    def test_encode_and_decode(self):
+        """Test roundtrip saluran subliminal"""
+        code, encoded = run_cli("encode", "--key", self.key, 9876, 5432)
+        self.assertEqual(code, 0)
+
+        code, decoded = run_cli("decode", "--key", self.key, encoded["s1"], encoded["s2"])
+        self.assertEqual(code, 0)
+        self.assertEqual(decoded["original"], 9876)
+
+    def test_sign_with_public_key_fails(self):
+        """Test sign dengan file kunci publik menghasilkan error"""
+        with redirect_stdout(io.StringIO()):
+            code = cli.main(["sign", "--key", self.pub, "1"])
+        self.assertEqual(code, 2)
+
+    def test_bulk_sign_and_verify(self):
+        """Test bulk-sign lalu bulk-verify dengan format TSV"""
+        messages = os.path.join(self.tmpdir, "messages.txt")
+        with open(messages, "w") as f:
+            f.write("\n".join(str(m) for m in range(1, 26)) + "\n\n")
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            code = cli.main(["bulk-sign", "--key", self.key, "--chunk-size", "7", messages])
+        self.assertEqual(code, 0)
+        signed_lines = buffer.getvalue().splitlines()
+        self.assertEqual([int(line.split("\t")[0]) for line in signed_lines], list(range(1, 26)))
+
+        signed = os.path.join(self.tmpdir, "signed.tsv")
+        with open(signed, "w") as f:
+            f.write("\n".join(signed_lines[:-1]) + "\n")
+            message, s1, s2 = signed_lines[-1].split("\t")
+            f.write(f"{message} {s1} {int(s2) + 1}\n")
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            code = cli.main(["bulk-verify", "--key", self.pub, "--chunk-size", "4", signed])
+        self.assertEqual(code, 1)
+        statuses = [line.split("\t")[1] for line in buffer.getvalue().splitlines()]
+        self.assertEqual(statuses, ["OK"] * 24 + ["FAIL"])
+
+    def test_bulk_chunk_reports_bad_line(self):
+        """Test error bulk-sign menyebut nomor dan isi baris yang salah"""
+        cli._init_worker(self.key, "sign")
+        with self.assertRaisesRegex(ValueError, "7 tidak valid: 'x7'"):
+            cli._sign_chunk([(5, "1"), (6, "2"), (7, "x7")])
+
+    def test_bulk_verify_malformed_line_continues(self):
+        """Test baris rusak di bulk-verify menjadi FAIL dengan nomor baris, stream berlanjut"""
+        from ong_schnorr_shamir import DigitalSignature
+
+        ds = DigitalSignature.from_key_file(self.key)
+        lines = [f"{m} {s1} {s2}" for m, (s1, s2, _) in zip((1, 2), ds.sign_batch([1, 2]))]
+        signed = os.path.join(self.tmpdir, "malformed.tsv")
+        with open(signed, "w") as f:
+            f.write(f"{lines[0]}\n\n3 4\n{lines[1]}\nx y z\n")
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            code = cli.main(["bulk-verify", "--key", self.pub, "--chunk-size", "2", signed])
+        self.assertEqual(code, 1)
+        self.assertEqual(buffer.getvalue().splitlines(), [
+            "1\tOK", "baris 3: '3 4'\tFAIL", "2\tOK", "baris 5: 'x y z'\tFAIL",
+        ])
+
+    def test_bulk_verify_with_jobs(self):
+        """Test bulk-verify multi-proses dari stdin menjaga urutan output"""
+        from ong_schnorr_shamir import DigitalSignature
+
+        ds = DigitalSignature.from_key_file(self.key)
+        lines = []
+        for message, (s1, s2, _) in zip(range(100, 140), ds.sign_batch(range(100, 140))):
+            lines.append(f"{message} {s1} {s2}")
+
+        output = subprocess.check_output(
+            [sys.executable, "cli.py", "bulk-verify", "--key", self.pub,
+             "--jobs", "2", "--chunk-size", "5"],
+            input="\n".join(lines).encode(),
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        self.assertEqual(
+            output.decode().splitlines(), [f"{m}\tOK" for m in range(100, 140)]
+        )
+
+    def test_profile(self):
+        """Test subcommand profile dengan file kunci"""
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            code = cli.main(["profile", "--key", self.key, "--count", "5", "--ops", "verify",
+                             "--mode", "cpu"])
+        self.assertEqual(code, 0)
+        self.assertIn("=== verify (5 item) ===", buffer.getvalue())
+
+    def test_import_is_lazy(self):
+        """Test import cli tidak ikut meng-import library"""
+        script = "import sys, cli; print('ong_schnorr_shamir' in sys.modules)"
+        output = subprocess.check_output(
+            [sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        self.assertEqual(output.strip(), b"False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Helper bersama untuk test: kunci fixture yang deterministik
+
+Kunci dibaca dari test_keys.json sehingga test tidak perlu membuat kunci
+512-bit baru di setiap setUp. File fixture dibuat ulang dengan:
+
+    python test_helpers.py --regenerate
+
+Mengimpor modul ini juga menonaktifkan cache tuning (OSS_TUNING_FILE
+kosong), sehingga semua test memakai DEFAULT_TUNING dan tidak bergantung
+pada hasil calibrate.py di mesin developer. Subprocess test mewarisi
+environment yang sama.
+"""
+
+import sys
+import os
+import json
+import random
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import OngSchnorrShamir, TUNING_FILE_ENV, set_tuning
+
+os.environ[TUNING_FILE_ENV] = ""
+set_tuning(None)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_keys.json")
+FIXTURE_SEED = 20250804
+FIXTURE_SIZES = (128, 256, 512, 1024)
+
+_fixtures = None
+
+
+def fixture_name(bits: int, composite: bool = False) -> str:
+    """Nama entri fixture, mis. 'prime-512' atau 'composite-256'"""
+    return f"{'composite' if composite else 'prime'}-{bits}"
+
+
+def load_fixture_keys(bits: int = 512, composite: bool = False) -> dict:
+    """
+    Ambil kunci fixture untuk ukuran dan mode tertentu
+
+    Returns:
+        Dict argumen konstruktor: n, k dan (untuk komposit) factors
+    """
+    global _fixtures
+    if _fixtures is None:
+        with open(FIXTURE_PATH) as f:
+            _fixtures = json.load(f)
+
+    keys = _fixtures[fixture_name(bits, composite)]
+    kwargs = {"n": int(keys["n"]), "k": int(keys["k"])}
+    if "p" in keys:
+        kwargs["factors"] = (int(keys["p"]), int(keys["q"]))
+    return kwargs
+
+
+def fixture_sizes(composite: bool = False) -> tuple:
+    """Ukuran bit yang tersedia untuk mode tertentu"""
+    return FIXTURE_SIZES[1:] if composite else FIXTURE_SIZES
+
+
+def regenerate_fixtures() -> None:
+    """Buat ulang test_keys.json dari seed tetap"""
+    random.seed(FIXTURE_SEED)
+    fixtures = {}
+    for composite in (False, True):
+        for bits in fixture_sizes(composite):
+            oss = OngSchnorrShamir(composite=composite, bits=bits)
+            entry = {"n": str(oss.n), "k": str(oss.k), "h": str(oss.h)}
+            if composite:
+                entry["p"] = str(oss._p)
+                entry["q"] = str(oss._q)
+            fixtures[fixture_name(bits, composite)] = entry
+
+    with open(FIXTURE_PATH, "w") as f:
+        json.dump(fixtures, f, indent=2)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    if "--regenerate" in sys.argv:
+        regenerate_fixtures()
+        print(f"✅ Fixture ditulis ke {FIXTURE_PATH}")
+    else:
+        print(__doc__)
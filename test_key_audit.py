@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk audit faktor bersama (key_audit.py)
+"""
+
+import sys
+import os
+import io
+import math
+import random
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from key_audit import batch_gcd, audit_moduli, read_moduli, main
+from ong_schnorr_shamir import OngSchnorrShamir, save_keys
+from test_helpers import FIXTURE_SEED
+
+
+def brute_force_gcds(moduli):
+    """gcd(n_i, produk modulus lain) dihitung secara naif"""
+    results = []
+    for i, n in enumerate(moduli):
+        others = math.prod(m for j, m in enumerate(moduli) if j != i)
+        results.append(math.gcd(n, others))
+    return results
+
+
+class TestBatchGcd(unittest.TestCase):
+    """Test case untuk product/remainder tree batch GCD"""
+
+    def setUp(self):
+        """Modulus kecil dengan faktor bersama yang diketahui"""
+        oss = OngSchnorrShamir(n=7, k=3, rng=random.Random(FIXTURE_SEED))
+        primes = [oss._generate_factor_prime(64) for _ in range(12)]
+        p = primes
+        self.moduli = [
+            p[0] * p[1], p[2] * p[3], p[0] * p[4],     # p0 dipakai dua kali
+            p[5] * p[6], p[2] * p[3],                  # duplikat
+            p[7] * p[8], p[9] * p[10], p[10] * p[11],  # p10 dipakai dua kali
+        ]
+        self.primes = primes
+
+    def test_matches_brute_force(self):
+        """Test hasil batch GCD sama dengan perhitungan pairwise"""
+        self.assertEqual(batch_gcd(self.moduli), brute_force_gcds(self.moduli))
+
+    def test_findings(self):
+        """Test modulus bermasalah terdeteksi beserta faktornya"""
+        findings = audit_moduli((f"n{i}", n) for i, n in enumerate(self.moduli))
+        by_index = {finding.index: finding.divisor for finding in findings}
+
+        self.assertEqual(set(by_index), {0, 1, 2, 4, 6, 7})
+        self.assertEqual(by_index[0], self.primes[0])
+        self.assertEqual(by_index[1], self.moduli[1])
+        self.assertEqual(by_index[7], self.primes[10])
+
+    def test_parallel_matches_serial(self):
+        """Test hasil multi-proses sama dengan serial"""
+        self.assertEqual(batch_gcd(self.moduli, jobs=3), batch_gcd(self.moduli))
+
+    def test_edge_cases(self):
+        """Test input kecil dan tidak valid"""
+        self.assertEqual(batch_gcd([]), [])
+        self.assertEqual(batch_gcd([15]), [1])
+        with self.assertRaises(ValueError):
+            batch_gcd([15, 1])
+
+
+class TestAuditInput(unittest.TestCase):
+    """Test case untuk pembacaan modulus dari disk"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_reads_key_files_and_lists(self):
+        """Test file kunci JSON dan file daftar modulus dibaca bersama"""
+        save_keys(os.path.join(self.tmpdir, "a.json"), OngSchnorrShamir(n=15, k=2))
+        with open(os.path.join(self.tmpdir, "list.txt"), "w") as f:
+            f.write("# modulus\n21\n0x23\n\n")
+
+        entries = list(read_moduli([self.tmpdir]))
+        self.assertEqual([n for _, n in entries], [15, 21, 35])
+        self.assertTrue(entries[1][0].endswith("list.txt:2"))
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            code = main([self.tmpdir])
+        self.assertEqual(code, 1)
+        self.assertEqual(len(buffer.getvalue().splitlines()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
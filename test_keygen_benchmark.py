@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk benchmark pembangkitan prima (keygen_benchmark.py)
+"""
+
+import sys
+import os
+import io
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from keygen_benchmark import benchmark_primes, main
+from ong_schnorr_shamir import np
+import test_helpers  # noqa: F401  (nonaktifkan cache tuning)
+
+
+class TestKeygenBenchmark(unittest.TestCase):
+    """Test case untuk benchmark_primes"""
+
+    def test_reports_every_backend(self):
+        """Test setiap backend yang tersedia dilaporkan dengan speedup relatif naive"""
+        rows = benchmark_primes([64], count=2)
+        backends = [row["backend"] for row in rows]
+        self.assertEqual(backends, ["naive", "bytearray"] + (["numpy"] if np is not None else []))
+        self.assertEqual(rows[0]["speedup"], 1.0)
+        for row in rows:
+            self.assertGreater(row["seconds_per_prime"], 0)
+
+    def test_cli(self):
+        """Test output tabel CLI"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["--bits", "32", "--count", "1", "--backend", "naive", "bytearray"]), 0)
+        self.assertIn("bytearray", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+Memory-regression test tier untuk jalur sign single, batch, streaming dan
+kolumnar
+
+Memori diukur dengan tracemalloc (lihat memory_benchmark.py) dan budget
+dinyatakan sebagai a * lebar + b byte per item, dengan lebar = byte_length(n),
+sehingga satu tabel berlaku untuk semua ukuran kunci. Budget retained
+mengunci ukuran hasil (mis. SignatureArray harus tetap ~2 * lebar per
+tanda tangan); budget peak streaming memastikan memori sign_iter dibatasi
+chunk, bukan panjang input.
+
+Tier ini tidak dijalankan secara default (sama seperti test_performance):
+    OSS_PERF_TESTS=1 python -m unittest test_memory -v
+
+OSS_PERF_TOLERANCE mengalikan semua budget (default 1.0).
+"""
+
+import sys
+import os
+import random
+import unittest
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from memory_benchmark import PATHS, RssSampler, benchmark_memory, measure_path
+from ong_schnorr_shamir import DigitalSignature
+from test_helpers import load_fixture_keys, FIXTURE_SEED
+
+PERF_ENABLED = os.environ.get("OSS_PERF_TESTS") == "1"
+TOLERANCE = float(os.environ.get("OSS_PERF_TOLERANCE", "1.0"))
+MEMORY_SIZES = (512, 1024)
+MEMORY_BATCH_SIZES = (64, 1024)
+MEMORY_ITEMS = 2048
+
+# Budget (a, b): paling banyak a * lebar + b byte per item
+BUDGETS = {
+    ("single", "retained_per_item"): (3.5, 160),
+    ("single", "peak_per_item"): (3.5, 160),
+    ("batch", "retained_per_item"): (3.5, 160),
+    ("batch", "peak_per_item"): (4.0, 200),
+    ("streaming", "retained_per_item"): (0.0, 16),
+    ("streaming", "peak_per_item"): (6.0, 300),
+    ("columnar", "retained_per_item"): (2.25, 16),
+    ("columnar", "peak_per_item"): (4.5, 100),
+}
+
+
+class TestMemoryBenchmark(unittest.TestCase):
+    """Pengukuran memory_benchmark pada kunci kecil (selalu dijalankan)"""
+
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.rng = random.Random(FIXTURE_SEED)
+        self.ds = DigitalSignature(**load_fixture_keys(256), rng=self.rng)
+        self.messages = [self.rng.randrange(2, self.ds.n) for _ in range(256)]
+
+    def test_columnar_retains_less_than_tuples(self):
+        """Test SignatureArray memegang jauh lebih sedikit memori daripada list tuple"""
+        batch = measure_path("batch", self.ds, self.messages, 64)
+        columnar = measure_path("columnar", self.ds, self.messages, 64)
+        self.assertLess(columnar["retained_per_item"], batch["retained_per_item"] / 1.5)
+        self.assertGreaterEqual(columnar["retained_per_item"], 2 * 32)
+
+    def test_streaming_retains_nothing(self):
+        """Test sign_iter yang dikonsumsi tidak menyisakan alokasi per item"""
+        result = measure_path("streaming", self.ds, self.messages, 32)
+        self.assertLess(result["retained_per_item"], 8)
+        self.assertGreater(result["peak_per_item"], 0)
+
+    def test_rss_sampler(self):
+        """Test RssSampler mengisi peak_delta (None jika /proc tidak tersedia)"""
+        with RssSampler() as sampler:
+            data = bytearray(4 << 20)
+            data[::4096] = b"x" * len(data[::4096])
+        if os.path.exists("/proc/self/statm"):
+            self.assertGreaterEqual(sampler.peak_delta, 0)
+        else:
+            self.assertIsNone(sampler.peak_delta)
+
+    def test_unknown_path(self):
+        """Test jalur yang tidak dikenal ditolak"""
+        with self.assertRaises(ValueError):
+            measure_path("mystery", self.ds, self.messages, 8)
+
+
+@unittest.skipUnless(PERF_ENABLED, "set OSS_PERF_TESTS=1 untuk menjalankan tier memori")
+class TestMemoryBudgets(unittest.TestCase):
+    """Memori per item tidak boleh melewati budget"""
+
+    def test_budgets(self):
+        """Semua jalur pada semua ukuran kunci dan batch berada di bawah budget"""
+        rows = benchmark_memory(MEMORY_SIZES, MEMORY_BATCH_SIZES, MEMORY_ITEMS, PATHS,
+                                seed=FIXTURE_SEED)
+        for row in rows:
+            width = (row["bits"] + 7) // 8
+            for metric in ("retained_per_item", "peak_per_item"):
+                a, b = BUDGETS[(row["path"], metric)]
+                budget = (a * width + b) * TOLERANCE
+                with self.subTest(path=row["path"], bits=row["bits"],
+                                  batch_size=row["batch_size"], metric=metric):
+                    self.assertLessEqual(
+                        row[metric], budget,
+                        f"{row['path']} {metric} @ {row['bits']}-bit/batch {row['batch_size']}: "
+                        f"{row[metric]:.0f} B > budget {budget:.0f} B"
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
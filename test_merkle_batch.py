@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk Merkle-batched signing (merkle_batch.py)
+"""
+
+import sys
+import os
+import random
+import unittest
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature
+from merkle_batch import MerkleVerifier, InclusionProof, sign_merkle_batch, root_from_proof
+from test_helpers import load_fixture_keys, FIXTURE_SEED
+
+
+class TestMerkleBatch(unittest.TestCase):
+    """Test case untuk satu tanda tangan atas banyak pesan"""
+
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.ds = DigitalSignature(**load_fixture_keys(512), rng=random.Random(FIXTURE_SEED))
+        self.verifier = MerkleVerifier(self.ds.n, self.ds.h)
+
+    def test_every_message_verifies(self):
+        """Test semua pesan dari berbagai ukuran batch lolos verifikasi"""
+        for size in (1, 2, 3, 7, 8, 33):
+            messages = [b"event-%d" % i for i in range(size - 1)] + [size * 1000]
+            batch, proofs = sign_merkle_batch(self.ds, messages)
+            with self.subTest(size=size):
+                self.assertEqual(batch.size, size)
+                self.assertTrue(self.ds.verify_signature(
+                    int.from_bytes(batch.root, "big"), batch.s1, batch.s2))
+                for message, proof in zip(messages, proofs):
+                    self.assertTrue(self.verifier.verify(message, proof, batch))
+                    self.assertLessEqual(len(proof.siblings), (size - 1).bit_length())
+
+    def test_root_verified_once(self):
+        """Test tanda tangan root hanya diverifikasi sekali per batch"""
+        messages = [b"a", b"b", b"c", b"d"]
+        batch, proofs = sign_merkle_batch(self.ds, messages)
+        for message, proof in zip(messages, proofs):
+            self.verifier.verify(message, proof, batch)
+        self.assertEqual(self.verifier.root_cache.misses, 1)
+        self.assertEqual(self.verifier.root_cache.hits, 3)
+
+    def test_tampering_rejected(self):
+        """Test pesan, posisi, proof, dan tanda tangan palsu ditolak"""
+        messages = [b"a", b"b", b"c", 4, 5]
+        batch, proofs = sign_merkle_batch(self.ds, messages)
+
+        self.assertFalse(self.verifier.verify(b"x", proofs[0], batch))
+        self.assertFalse(self.verifier.verify(b"4", proofs[3], batch))
+        self.assertFalse(self.verifier.verify(b"a", proofs[1], batch))
+        self.assertFalse(self.verifier.verify(b"a", InclusionProof(1, proofs[0].siblings), batch))
+        self.assertFalse(self.verifier.verify(b"a", InclusionProof(0, proofs[0].siblings[1:]), batch))
+        self.assertFalse(self.verifier.verify(b"a", InclusionProof(9, proofs[0].siblings), batch))
+        self.assertFalse(self.verifier.verify(b"a", proofs[0], batch._replace(s2=batch.s2 + 1)))
+
+    def test_int_and_bytes_are_distinct(self):
+        """Test int dan bytes dengan nilai serupa menghasilkan daun berbeda"""
+        batch, proofs = sign_merkle_batch(self.ds, [1, b"\x01"])
+        self.assertNotEqual(
+            root_from_proof(1, proofs[0], 2), root_from_proof(b"\x01", proofs[0], 2))
+
+    def test_small_modulus_rejected(self):
+        """Test n <= 256 bit ditolak"""
+        with self.assertRaises(ValueError):
+            sign_merkle_batch(DigitalSignature(**load_fixture_keys(256)), [b"a"])
+        with self.assertRaises(ValueError):
+            sign_merkle_batch(self.ds, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,9 @@ import os
 import unittest
 import random
 import math
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Tambahkan path untuk import module
 sys.path.insert(0, os.path.dirname(__file__))
@@ -24,8 +27,29 @@ from ong_schnorr_shamir import (
     OngSchnorrShamir, 
     DigitalSignature, 
     SubliminalChannel, 
-    generate_keys
+    Verifier,
+    VerificationCache,
+    SelfCheck,
+    SignatureFault,
+    ReceiveResult,
+    ThreadLocalRandom,
+    KeygenControl,
+    KeygenTimeout,
+    KeygenCancelled,
+    generate_keys,
+    generate_primes,
+    generate_safe_primes,
+    generate_strong_prime,
+    small_primes,
+    verify_mixed,
+    _batch_inverse,
+    _gordon_strong_prime,
+    _sieve_segment,
+    _sieve_table,
+    _SieveTable,
+    np
 )
+from test_helpers import load_fixture_keys, FIXTURE_SEED
 
 
 class TestOngSchnorrShamir(unittest.TestCase):
@@ -66,8 +90,9 @@ class TestDigitalSignature(unittest.TestCase):
     """
     
     def setUp(self):
-        """Setup untuk setiap test"""
-        self.ds = DigitalSignature()
+        """Setup untuk setiap test - kunci fixture, nonce deterministik"""
+        random.seed(FIXTURE_SEED)
+        self.ds = DigitalSignature(**load_fixture_keys(512))
     
     def test_sign_and_verify_basic(self):
         """Test dasar pembuatan dan verifikasi tanda tangan digital"""
@@ -140,8 +165,8 @@ class TestSubliminalChannel(unittest.TestCase):
     """
     
     def setUp(self):
-        """Setup untuk setiap test"""
-        self.sc = SubliminalChannel()
+        """Setup untuk setiap test - kunci fixture"""
+        self.sc = SubliminalChannel(**load_fixture_keys(512))
     
     def test_subliminal_communication_basic(self):
         """Test dasar komunikasi saluran tersembunyi"""
@@ -235,6 +260,41 @@ class TestSubliminalChannel(unittest.TestCase):
         
         # Setidaknya beberapa skenario harus berhasil
         self.assertGreater(success_count, 0, "At least some scenarios should work")
+    
+    def test_receive_fused(self):
+        """Test receive memverifikasi dan mengekstrak dalam satu langkah"""
+        s1, s2, cover = self.sc.create_subliminal_message(9876, 5432)
+        result = self.sc.receive(cover, s1, s2)
+        
+        self.assertTrue(result)
+        self.assertEqual(result, ReceiveResult(True, 9876))
+        self.assertFalse(hasattr(result, "__dict__"))
+        
+        forged = self.sc.receive(cover + 1, s1, s2)
+        self.assertFalse(forged.valid)
+        self.assertIsNone(forged.original_message)
+    
+    def test_receive_batch_matches_two_pass(self):
+        """Test receive_batch sama dengan verify_cover_message + decrypt_original_message"""
+        items = []
+        for original, cover in [(11, 13), (1234, 4321), (98765, 56789)]:
+            s1, s2, c = self.sc.create_subliminal_message(original, cover)
+            items.append((c, s1, s2))
+        items.append((items[0][0], items[0][1], items[0][2] + 1))
+        
+        expected = [
+            ReceiveResult(True, self.sc.decrypt_original_message(s1, s2))
+            if self.sc.verify_cover_message(c, s1, s2) else ReceiveResult(False, None)
+            for c, s1, s2 in items
+        ]
+        self.assertEqual(self.sc.receive_batch(items), expected)
+        self.assertEqual([r.valid for r in expected], [True, True, True, False])
+    
+    def test_receive_composite(self):
+        """Test receive pada modulus komposit"""
+        sc = SubliminalChannel(**load_fixture_keys(256, composite=True))
+        s1, s2, cover = sc.create_subliminal_message(777, 333)
+        self.assertEqual(sc.receive(cover, s1, s2), ReceiveResult(True, 777))
 
 
 class TestMathematicalProperties(unittest.TestCase):
@@ -245,9 +305,10 @@ class TestMathematicalProperties(unittest.TestCase):
     """
     
     def setUp(self):
-        """Setup untuk setiap test"""
-        self.ds = DigitalSignature()
-        self.sc = SubliminalChannel()
+        """Setup untuk setiap test - kunci fixture, nonce deterministik"""
+        random.seed(FIXTURE_SEED)
+        self.ds = DigitalSignature(**load_fixture_keys(512))
+        self.sc = SubliminalChannel(**load_fixture_keys(1024))
     
     def test_signature_mathematical_correctness(self):
         """Test apakah formula matematis signature benar"""
@@ -294,6 +355,572 @@ class TestMathematicalProperties(unittest.TestCase):
         self.assertEqual(self.ds.h, expected_h, "h should be calculated correctly")
 
 
+class TestCompositeModulus(unittest.TestCase):
+    """
+    Test case untuk mode modulus komposit n = p * q dengan CRT
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test - kunci fixture komposit"""
+        random.seed(FIXTURE_SEED)
+        self.ds = DigitalSignature(**load_fixture_keys(256, composite=True))
+        self.sc = SubliminalChannel(**load_fixture_keys(256, composite=True))
+    
+    def test_composite_generation(self):
+        """Test pembuatan n = p * q baru dengan panjang bit penuh"""
+        ds = DigitalSignature(composite=True, bits=128)
+        self.assertTrue(ds.is_composite)
+        self.assertEqual(ds.n.bit_length(), 128)
+    
+    def test_composite_key_properties(self):
+        """Test n = p * q dengan panjang bit penuh"""
+        self.assertTrue(self.ds.is_composite)
+        self.assertEqual(self.ds.n, self.ds._p * self.ds._q)
+        self.assertNotEqual(self.ds._p, self.ds._q)
+        self.assertEqual(self.ds.n.bit_length(), 256)
+        self.assertEqual(math.gcd(self.ds.n, self.ds.k), 1)
+    
+    def test_crt_sign_matches_formula(self):
+        """Test hasil CRT sama dengan perhitungan langsung modulo n"""
+        message = 12345
+        s1, s2, r = self.ds.sign_message(message)
+        
+        n = self.ds.n
+        inv_2 = pow(2, -1, n)
+        inv_r = pow(r, -1, n)
+        self.assertEqual(s1, (inv_2 * (message * inv_r + r)) % n)
+        self.assertEqual(s2, (self.ds.k * inv_2 * (message * inv_r - r)) % n)
+        self.assertTrue(self.ds.verify_signature(message, s1, s2))
+    
+    def test_crt_subliminal_roundtrip(self):
+        """Test saluran subliminal dengan dekripsi CRT"""
+        s1, s2, cover = self.sc.create_subliminal_message(9876, 5432)
+        self.assertTrue(self.sc.verify_cover_message(cover, s1, s2))
+        self.assertEqual(self.sc.decrypt_original_message(s1, s2), 9876)
+    
+    def test_invalid_factors(self):
+        """Test validasi faktor"""
+        with self.assertRaises(ValueError):
+            DigitalSignature(factors=(4, 7))
+        with self.assertRaises(ValueError):
+            DigitalSignature(n=35, factors=(3, 7))
+    
+    def test_prime_mode_default(self):
+        """Test mode default tetap menggunakan n prima tanpa CRT"""
+        ds = DigitalSignature(bits=256)
+        self.assertFalse(ds.is_composite)
+
+
+class TestBatchOperations(unittest.TestCase):
+    """
+    Test case untuk sign_batch / verify_batch
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.ds = DigitalSignature(**load_fixture_keys(256))
+    
+    def test_batch_inverse(self):
+        """Test invers batch sama dengan invers satu per satu"""
+        values = [3, 5, 7, 11, 12345]
+        self.assertEqual(
+            _batch_inverse(values, self.ds.n),
+            [pow(v, -1, self.ds.n) for v in values]
+        )
+        self.assertEqual(_batch_inverse([], self.ds.n), [])
+    
+    def test_sign_batch_verifies(self):
+        """Test semua tanda tangan batch valid"""
+        messages = list(range(1000, 1050))
+        signatures = self.ds.sign_batch(messages)
+        
+        self.assertEqual(len(signatures), len(messages))
+        for message, (s1, s2, r) in zip(messages, signatures):
+            self.assertTrue(self.ds.verify_signature(message, s1, s2))
+    
+    def test_verify_batch_detects_tampering(self):
+        """Test verify_batch mengembalikan hasil per item sesuai urutan"""
+        items = [(m, s1, s2) for m, (s1, s2, _) in zip([1, 2, 3], self.ds.sign_batch([1, 2, 3]))]
+        items[1] = (items[1][0] + 1, items[1][1], items[1][2])
+        
+        self.assertEqual(self.ds.verify_batch(items), [True, False, True])
+        self.assertEqual(Verifier(self.ds.n, self.ds.h).verify_batch(items), [True, False, True])
+
+    
+    def test_verify_batch_invalid_items(self):
+        """Test M, S1 atau S2 yang bukan int menghasilkan False, seperti verify_signature"""
+        s1, s2, _ = self.ds.sign_message(5)
+        items = [(5, "x", s2), (5, s1, s2), (None, s1, s2), (5, s1, float(s2)), (5, s1, [s2])]
+        expected = [False, True, False, False, False]
+        self.assertEqual(self.ds.verify_batch(items), expected)
+        self.assertEqual(Verifier(self.ds.n, self.ds.h).verify_batch(items), expected)
+        self.assertEqual([self.ds.verify_signature(*item) for item in items], expected)
+
+class TestVerificationCache(unittest.TestCase):
+    """
+    Test case untuk VerificationCache di depan verify_signature
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.cache = VerificationCache(maxsize=2)
+        self.ds = DigitalSignature(**load_fixture_keys(256), verification_cache=self.cache)
+    
+    def test_positive_results_are_cached(self):
+        """Test verifikasi ulang memakai hasil dari cache"""
+        s1, s2, r = self.ds.sign_message(12345)
+        
+        self.assertTrue(self.ds.verify_signature(12345, s1, s2))
+        self.assertTrue(self.ds.verify_signature(12345, s1, s2))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hit_rate, 0.5)
+    
+    def test_negative_results_not_cached_by_default(self):
+        """Test tanda tangan palsu tidak mengisi cache"""
+        s1, s2, r = self.ds.sign_message(12345)
+        
+        self.assertFalse(self.ds.verify_signature(12346, s1, s2))
+        self.assertFalse(self.ds.verify_signature(12346, s1, s2))
+        self.assertEqual(self.cache.stats()["size"], 0)
+        
+        negative_cache = VerificationCache(cache_negative=True)
+        verifier = Verifier(self.ds.n, self.ds.h, verification_cache=negative_cache)
+        self.assertFalse(verifier.verify(12346, s1, s2))
+        self.assertFalse(verifier.verify(12346, s1, s2))
+        self.assertEqual(negative_cache.hits, 1)
+    
+    def test_lru_eviction(self):
+        """Test entri terlama dibuang ketika maxsize terlampaui"""
+        signatures = [(m,) + self.ds.sign_message(m)[:2] for m in (1, 2, 3)]
+        for m, s1, s2 in signatures:
+            self.ds.verify_signature(m, s1, s2)
+        
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertIsNone(self.cache.get(VerificationCache.make_key(self.ds.n, self.ds.h, *signatures[0])))
+        self.assertTrue(self.cache.get(VerificationCache.make_key(self.ds.n, self.ds.h, *signatures[2])))
+    
+    def test_ttl_expiry(self):
+        """Test entri kedaluwarsa setelah TTL"""
+        cache = VerificationCache(ttl=0.0)
+        key = VerificationCache.make_key(self.ds.n, self.ds.h, 1, 2, 3)
+        cache.put(key, True)
+        self.assertIsNone(cache.get(key))
+    
+    def test_shared_cache_separates_keys_with_same_n(self):
+        """Test hasil positif satu kunci tidak bocor ke kunci lain dengan n sama"""
+        other = DigitalSignature(self.ds.n, self.ds.k + 2, verification_cache=self.cache)
+        self.assertNotEqual(other.h, self.ds.h)
+        s1, s2, _ = self.ds.sign_message(4242)
+        
+        self.assertTrue(self.ds.verify_signature(4242, s1, s2))
+        self.assertFalse(other.verify_signature(4242, s1, s2))
+        self.assertFalse(Verifier(other.n, other.h, verification_cache=self.cache)
+                         .verify(4242, s1, s2))
+        self.assertEqual(self.cache.hits, 0)
+    
+    def test_subliminal_cover_cached(self):
+        """Test verify_cover_message juga memakai cache"""
+        sc = SubliminalChannel(self.ds.n, self.ds.k, verification_cache=self.cache)
+        s1, s2, cover = sc.create_subliminal_message(111, 222)
+        self.assertTrue(sc.verify_cover_message(cover, s1, s2))
+        self.assertTrue(sc.verify_cover_message(cover, s1, s2))
+        self.assertEqual(self.cache.hits, 1)
+
+
+class TestInjectableRng(unittest.TestCase):
+    """
+    Test case untuk RNG yang bisa di-inject dan pemakaian multi-thread
+    """
+    
+    def test_per_instance_rng_is_reproducible(self):
+        """Test dua instance dengan seed sama menghasilkan kunci dan tanda tangan sama"""
+        first = DigitalSignature(bits=128, rng=random.Random(42))
+        second = DigitalSignature(bits=128, rng=random.Random(42))
+        
+        self.assertEqual((first.n, first.k), (second.n, second.k))
+        self.assertEqual(first.sign_message(12345), second.sign_message(12345))
+    
+    def test_global_random_untouched(self):
+        """Test RNG per instance tidak mengonsumsi state modul random global"""
+        ds = DigitalSignature(**load_fixture_keys(256), rng=random.Random(7))
+        random.seed(FIXTURE_SEED)
+        expected = random.random()
+        random.seed(FIXTURE_SEED)
+        ds.sign_message(12345)
+        self.assertEqual(random.random(), expected)
+    
+    def test_thread_local_rng_seeded_per_thread(self):
+        """Test ThreadLocalRandom memberi stream berbeda per thread, di-seed dari (seed, i)"""
+        rng = ThreadLocalRandom(seed=1)
+        barrier = threading.Barrier(2)
+        streams = []
+        
+        def draw():
+            barrier.wait()
+            streams.append(tuple(rng.getrandbits(64) for _ in range(4)))
+        
+        threads = [threading.Thread(target=draw) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        generators = [random.Random(f"1:{i}") for i in range(2)]
+        expected = {tuple(generator.getrandbits(64) for _ in range(4)) for generator in generators}
+        self.assertEqual(len(set(streams)), 2)
+        self.assertEqual(set(streams), expected)
+        self.assertNotIn(tuple(rng.getrandbits(64) for _ in range(4)), expected)
+        self.assertIsInstance(rng.randrange(10), int)
+        self.assertTrue(2 <= rng.randint(2, 5) <= 5)
+    
+    def test_concurrent_signing(self):
+        """Test satu signer dipakai bersamaan dari ThreadPoolExecutor tanpa lock"""
+        keys = load_fixture_keys(256, composite=True)
+        ds = DigitalSignature(**keys, rng=ThreadLocalRandom())
+        sc = SubliminalChannel(**keys, rng=ThreadLocalRandom())
+        messages = list(range(1, 201))
+        
+        def sign_and_check(message):
+            s1, s2, r = ds.sign_message(message)
+            c1, c2, cover = sc.create_subliminal_message(message + 1, message + 2)
+            return (ds.verify_signature(message, s1, s2)
+                    and sc.decrypt_original_message(c1, c2) == message + 1)
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(sign_and_check, messages))
+        self.assertTrue(all(results))
+
+
+class TestVerifyMixed(unittest.TestCase):
+    """
+    Test case untuk verify_mixed atas banyak kunci
+    """
+    
+    def test_interleaved_tenants(self):
+        """Test hasil per item sesuai urutan input untuk kunci yang tercampur"""
+        signers = [
+            DigitalSignature(**load_fixture_keys(256)),
+            DigitalSignature(**load_fixture_keys(512)),
+            DigitalSignature(**load_fixture_keys(256, composite=True)),
+        ]
+        items, expected = [], []
+        for i in range(30):
+            ds = signers[i % len(signers)]
+            s1, s2, _ = ds.sign_message(i)
+            valid = i % 4 != 0
+            items.append((ds.n, ds.h, i if valid else i + 1, s1, s2))
+            expected.append(valid)
+        
+        verifiers = {}
+        self.assertEqual(verify_mixed(items, verifiers), expected)
+        self.assertEqual(len(verifiers), len(signers))
+        self.assertEqual(verify_mixed(iter(items), verifiers), expected)
+    
+    def test_invalid_items(self):
+        """Test kunci atau nilai tidak valid menghasilkan False"""
+        ds = DigitalSignature(**load_fixture_keys(256))
+        s1, s2, _ = ds.sign_message(5)
+        items = [(0, 1, 5, s1, s2), (ds.n, ds.h, 5, "x", s2), (ds.n, ds.h, 5, s1, s2),
+                 (ds.n, str(ds.h), 5, s1, s2), (ds.n, [ds.h], 5, s1, s2), (ds.n, None, 5, s1, s2)]
+        self.assertEqual(verify_mixed(items), [False, False, True, False, False, False])
+        self.assertEqual(verify_mixed([]), [])
+
+
+class TestIteratorApi(unittest.TestCase):
+    """
+    Test case untuk sign_iter / verify_iter
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.ds = DigitalSignature(**load_fixture_keys(256))
+    
+    def test_lazy_consumption(self):
+        """Test input dikonsumsi per chunk, bukan sekaligus"""
+        consumed = []
+        
+        def messages():
+            for m in itertools.count(1):
+                consumed.append(m)
+                yield m
+        
+        signatures = self.ds.sign_iter(messages(), chunk_size=10)
+        first = list(itertools.islice(signatures, 15))
+        
+        self.assertEqual(len(first), 15)
+        self.assertEqual(len(consumed), 20)
+    
+    def test_roundtrip(self):
+        """Test sign_iter lalu verify_iter pada input yang panjangnya bukan kelipatan chunk"""
+        messages = range(1, 58)
+        items = ((m, s1, s2) for m, (s1, s2, _) in zip(messages, self.ds.sign_iter(messages, 8)))
+        results = list(self.ds.verify_iter(items, chunk_size=5))
+        
+        self.assertEqual(results, [True] * 57)
+        verifier = Verifier(self.ds.n, self.ds.h)
+        self.assertEqual(list(verifier.verify_iter([(1, 0, 0)])), [False])
+    
+    def test_invalid_chunk_size(self):
+        """Test chunk_size < 1 ditolak"""
+        with self.assertRaises(ValueError):
+            list(self.ds.sign_iter([1], chunk_size=0))
+
+class TestPrimeGeneration(unittest.TestCase):
+    """
+    Test case untuk generate_primes dan saringan bersegmen
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.rng = random.Random(FIXTURE_SEED)
+    
+    def test_small_primes_table(self):
+        """Test tabel prima kecil sesuai trial division"""
+        table = small_primes(1000)
+        expected = [p for p in range(3, 1000, 2) if all(p % d for d in range(3, math.isqrt(p) + 1, 2))]
+        self.assertEqual(table, expected)
+        self.assertIs(small_primes(1000), table)
+    
+    def test_sieve_segment_matches_trial_division(self):
+        """Test saringan hanya meloloskan kandidat tanpa faktor prima kecil"""
+        primes = small_primes(200)
+        base = 1_000_001
+        marks = _sieve_segment(500, primes, [base % p for p in primes])
+        for i, mark in enumerate(marks):
+            candidate = base + 2 * i
+            self.assertEqual(bool(mark), all(candidate % p for p in primes))
+    
+    def test_generates_primes_of_exact_size(self):
+        """Test setiap hasil adalah prima dengan panjang bit yang diminta"""
+        oss = OngSchnorrShamir(**load_fixture_keys(128))
+        for bits in (16, 64, 256):
+            primes = list(generate_primes(bits, 5, rng=self.rng))
+            self.assertEqual(len(primes), 5)
+            for p in primes:
+                self.assertEqual(p.bit_length(), bits)
+                self.assertTrue(oss._is_prime(p, 20))
+    
+    def test_lazy_and_reproducible(self):
+        """Test hasil di-yield lazy dan dapat direproduksi dengan seed"""
+        huge = generate_primes(64, 10 ** 9, rng=random.Random(1))
+        first = list(itertools.islice(huge, 3))
+        again = list(generate_primes(64, 3, rng=random.Random(1)))
+        self.assertEqual(first, again)
+    
+    def test_bytearray_backend_without_numpy(self):
+        """Test backend bytearray bisa dipaksa dan tetap menghasilkan prima"""
+        oss = OngSchnorrShamir(**load_fixture_keys(128))
+        for p in generate_primes(128, 3, rng=self.rng, use_numpy=False):
+            self.assertTrue(oss._is_prime(p, 20))
+    
+    @unittest.skipIf(np is None, "NumPy tidak terpasang")
+    def test_numpy_backend_matches_bytearray(self):
+        """Test residu dan kandidat lolos saringan NumPy sama dengan bytearray"""
+        numpy_table = _sieve_table(1024, use_numpy=True)
+        python_table = _SieveTable(1024, use_numpy=False)
+        python_table.primes = list(numpy_table.primes)
+        for _ in range(3):
+            base = self.rng.getrandbits(1024) | (1 << 1023) | 1
+            numpy_residues = numpy_table.residues(base)
+            python_residues = python_table.residues(base)
+            self.assertEqual(numpy_residues.tolist(), python_residues)
+            self.assertEqual(numpy_table.survivors(2048, numpy_table.shift(numpy_residues, 4096)),
+                             python_table.survivors(2048, python_table.shift(python_residues, 4096)))
+    
+    def test_invalid_arguments(self):
+        """Test argumen tidak valid ditolak"""
+        with self.assertRaises(ValueError):
+            next(generate_primes(8, 1))
+        with self.assertRaises(ValueError):
+            next(generate_primes(64, -1))
+
+
+class TestHardenedPrimes(unittest.TestCase):
+    """
+    Test case untuk safe prime dan strong prime
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.rng = random.Random(FIXTURE_SEED)
+        self.checker = OngSchnorrShamir(**load_fixture_keys(128))
+    
+    def test_safe_primes(self):
+        """Test p dan (p - 1) / 2 keduanya prima dan laporan kandidat terisi"""
+        report = generate_safe_primes(96, count=6, rng=self.rng)
+        self.assertEqual(len(report.primes), 6)
+        for p in report.primes:
+            self.assertEqual(p.bit_length(), 96)
+            self.assertTrue(self.checker._is_prime(p, 20))
+            self.assertTrue(self.checker._is_prime((p - 1) // 2, 20))
+        self.assertGreaterEqual(report.candidates, 6)
+        self.assertGreaterEqual(report.mr_rounds, report.candidates)
+        # Heuristik kepadatan harus berada di orde yang sama dengan hasil nyata
+        ratio = report.candidates / report.expected_candidates
+        self.assertTrue(0.2 < ratio < 5, ratio)
+    
+    def test_double_sieve_rejects_both_sides(self):
+        """Test saringan ganda membuang q dan 2q + 1 yang punya faktor kecil"""
+        primes = small_primes(200)
+        base = 1_000_003
+        marks = _sieve_segment(500, primes, [base % p for p in primes], safe=True)
+        for i, mark in enumerate(marks):
+            q = base + 2 * i
+            self.assertEqual(bool(mark), all(q % p and (2 * q + 1) % p for p in primes))
+    
+    def test_process_pool_matches_serial(self):
+        """Test hasil jobs > 1 sama dengan serial untuk seed yang sama"""
+        serial = generate_safe_primes(64, count=4, rng=random.Random(7))
+        pooled = generate_safe_primes(64, count=4, jobs=2, rng=random.Random(7))
+        self.assertEqual(serial, pooled)
+    
+    def test_strong_prime_structure(self):
+        """Test p - 1, p + 1 dan r - 1 punya faktor prima besar"""
+        p, r, s, t = _gordon_strong_prime(256, self.rng)
+        self.assertEqual(p.bit_length(), 256)
+        self.assertTrue(self.checker._is_prime(p, 20))
+        self.assertEqual((p - 1) % r, 0)
+        self.assertEqual((p + 1) % s, 0)
+        self.assertEqual((r - 1) % t, 0)
+        self.assertGreater(min(r, s, t).bit_length(), 100)
+        self.assertEqual(generate_strong_prime(128, rng=self.rng).bit_length(), 128)
+    
+    def test_keygen_prime_kinds(self):
+        """Test faktor kunci composite mengikuti prime_kind"""
+        safe = DigitalSignature(composite=True, bits=128, rng=self.rng, prime_kind="safe")
+        self.assertEqual(safe.n.bit_length(), 128)
+        for factor in (safe._p, safe._q):
+            self.assertTrue(self.checker._is_prime((factor - 1) // 2, 20))
+        strong = DigitalSignature(bits=128, rng=self.rng, prime_kind="strong")
+        s1, s2, _ = strong.sign_message(42)
+        self.assertTrue(strong.verify_signature(42, s1, s2))
+        with self.assertRaises(ValueError):
+            OngSchnorrShamir(bits=128, prime_kind="weak")
+
+
+class TestKeygenControl(unittest.TestCase):
+    """
+    Test case untuk deadline, cancel token dan progress key generation
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.rng = random.Random(FIXTURE_SEED)
+    
+    def test_progress_reports_candidates_and_rounds(self):
+        """Test callback progress menerima penghitung yang terus naik"""
+        seen = []
+        control = KeygenControl(progress=lambda c: seen.append((c.candidates, c.mr_rounds)))
+        ds = DigitalSignature(bits=256, composite=True, rng=self.rng, keygen=control)
+        
+        self.assertEqual(len(seen), control.candidates)
+        self.assertEqual([c for c, _ in seen], list(range(1, len(seen) + 1)))
+        self.assertGreater(control.mr_rounds, 0)
+        self.assertIsNone(ds._keygen)
+        s1, s2, _ = ds.sign_message(7)
+        self.assertTrue(ds.verify_signature(7, s1, s2))
+    
+    def test_deadline_raises_typed_timeout(self):
+        """Test deadline yang sudah lewat menghasilkan KeygenTimeout"""
+        with self.assertRaises(KeygenTimeout):
+            generate_keys(1024, rng=self.rng, keygen=KeygenControl(timeout=0))
+        with self.assertRaises(TimeoutError):
+            list(generate_primes(512, 3, rng=self.rng, control=KeygenControl(timeout=0)))
+    
+    def test_cancel_token(self):
+        """Test cancel token menghentikan pencarian pada kandidat berikutnya"""
+        cancel = threading.Event()
+        
+        def progress(control):
+            if control.candidates == 5:
+                cancel.set()
+        
+        control = KeygenControl(cancel=cancel, progress=progress)
+        with self.assertRaises(KeygenCancelled):
+            OngSchnorrShamir(bits=2048, prime_kind="safe", rng=self.rng, keygen=control)
+        self.assertEqual(control.candidates, 5)
+    
+    def test_generous_deadline_succeeds(self):
+        """Test deadline yang longgar tidak mengganggu pembuatan kunci"""
+        control = KeygenControl(timeout=60)
+        n, k, h = generate_keys(128, rng=self.rng, keygen=control)
+        self.assertEqual(n.bit_length(), 128)
+        self.assertLess(control.elapsed, 60)
+
+
+class TestSelfCheck(unittest.TestCase):
+    """
+    Test case untuk self-check tanda tangan dengan sampling
+    """
+    
+    def setUp(self):
+        """Setup untuk setiap test"""
+        self.rng = random.Random(FIXTURE_SEED)
+    
+    def test_full_rate_checks_every_signature(self):
+        """Test rate 1.0 memeriksa semua tanda tangan (single dan batch)"""
+        check = SelfCheck()
+        ds = DigitalSignature(**load_fixture_keys(256), rng=self.rng, self_check=check)
+        for message in range(10, 20):
+            ds.sign_message(message)
+        ds.sign_batch(list(range(100, 130)))
+        self.assertEqual(check.stats(), {"signed": 40, "checked": 40, "failures": 0, "rate": 1.0})
+    
+    def test_zero_rate_checks_nothing(self):
+        """Test rate 0 tidak memeriksa apa pun tetapi tetap menghitung signed"""
+        check = SelfCheck(rate=0.0)
+        ds = DigitalSignature(**load_fixture_keys(256), rng=self.rng, self_check=check)
+        ds.sign_batch(list(range(1, 51)))
+        self.assertEqual((check.signed, check.checked), (50, 0))
+    
+    def test_sampling_rate(self):
+        """Test rate parsial memeriksa kira-kira fraksi yang diminta"""
+        check = SelfCheck(rate=0.25, rng=random.Random(1))
+        ds = DigitalSignature(**load_fixture_keys(256), rng=self.rng, self_check=check)
+        ds.sign_batch(list(range(1, 2001)))
+        self.assertEqual(check.signed, 2000)
+        self.assertTrue(400 < check.checked < 600, check.checked)
+        self.assertEqual(check.failures, 0)
+    
+    def test_fused_check_matches_verification(self):
+        """Test pemeriksaan gabungan setara dengan verifikasi biasa"""
+        ds = DigitalSignature(**load_fixture_keys(256, composite=True), rng=self.rng)
+        s1, s2, r = ds.sign_message(4242)
+        self.assertTrue(ds._fused_check(4242, s1, s2, r))
+        self.assertFalse(ds._fused_check(4243, s1, s2, r))
+        self.assertFalse(ds._fused_check(4242, s1 ^ 1, s2, r))
+        self.assertFalse(ds._fused_check(4242, s1, s2, r + 1))
+    
+    def test_injected_fault_is_caught(self):
+        """Test fault pada setengah CRT terdeteksi dan tidak dikeluarkan"""
+        check = SelfCheck()
+        ds = DigitalSignature(**load_fixture_keys(256, composite=True), rng=self.rng,
+                              self_check=check)
+        crt_sign = ds._crt_sign_residues
+        ds._crt_sign_residues = lambda message, r_p, r_q: (
+            crt_sign(message, r_p, r_q)[0] ^ 4, crt_sign(message, r_p, r_q)[1])
+        
+        with self.assertRaises(SignatureFault):
+            ds.sign_message(99)
+        self.assertEqual(check.failures, 1)
+    
+    def test_failure_counted_without_raising(self):
+        """Test raise_on_failure=False hanya mencatat kegagalan"""
+        check = SelfCheck(raise_on_failure=False)
+        ds = DigitalSignature(**load_fixture_keys(256, composite=True), rng=self.rng,
+                              self_check=check)
+        ds._crt_sign_residues = lambda message, r_p, r_q: (1, 2)
+        ds.sign_message(99)
+        ds.sign_message(100)
+        self.assertEqual((check.checked, check.failures), (2, 2))
+    
+    def test_invalid_rate(self):
+        """Test rate di luar [0, 1] ditolak"""
+        with self.assertRaises(ValueError):
+            SelfCheck(rate=1.5)
+
+
 def run_tests():
     """Fungsi untuk menjalankan semua test yang sudah diperbaiki"""
     print("=" * 70)
@@ -314,7 +941,17 @@ def run_tests():
         TestOngSchnorrShamir,
         TestDigitalSignature,
         TestSubliminalChannel,
-        TestMathematicalProperties
+        TestMathematicalProperties,
+        TestCompositeModulus,
+        TestBatchOperations,
+        TestVerificationCache,
+        TestInjectableRng,
+        TestVerifyMixed,
+        TestIteratorApi,
+        TestPrimeGeneration,
+        TestHardenedPrimes,
+        TestKeygenControl,
+        TestSelfCheck
     ]
     
     for test_class in test_classes:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+"""
+Performance-regression test tier untuk hot path algoritma
+
+Waktu setiap operasi dinyatakan dalam satuan "biaya satu invers modular"
+pow(x, -1, n) pada ukuran kunci yang sama, diukur di mesin yang sama
+sesaat sebelumnya. Dengan normalisasi ini budget tidak bergantung pada
+kecepatan mesin CI, tetapi tetap gagal jika sebuah hot path menjadi
+jauh lebih lambat (mis. invers yang tidak lagi di-cache).
+
+Tier ini tidak dijalankan secara default:
+    OSS_PERF_TESTS=1 python -m unittest test_performance -v
+
+OSS_PERF_TOLERANCE mengalikan semua budget (default 1.0) untuk mesin
+yang sangat berisik.
+"""
+
+import sys
+import os
+import random
+import timeit
+import unittest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, SubliminalChannel
+from test_helpers import load_fixture_keys, FIXTURE_SEED
+
+PERF_ENABLED = os.environ.get("OSS_PERF_TESTS") == "1"
+TOLERANCE = float(os.environ.get("OSS_PERF_TOLERANCE", "1.0"))
+PERF_SIZES = (512, 1024)
+BATCH_SIZE = 100
+
+# Budget per operasi, dalam kelipatan biaya pow(x, -1, n)
+BUDGETS = {
+    "sign_message": 3.0,
+    "sign_batch (per item)": 0.8,
+    "verify_signature": 0.4,
+    "create_subliminal_message": 3.0,
+    "decrypt_original_message": 0.25,
+    "decrypt_original_message [crt]": 0.25,
+    "receive": 0.4,
+}
+
+
+def best_time(func, number: int) -> float:
+    """Waktu terbaik per panggilan dari beberapa pengulangan"""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+@unittest.skipUnless(PERF_ENABLED, "set OSS_PERF_TESTS=1 untuk menjalankan tier performa")
+class TestHotPathBudgets(unittest.TestCase):
+    """Hot path tidak boleh melewati budget relatifnya"""
+
+    def measure(self, bits: int, composite: bool) -> dict:
+        """Ukur semua operasi untuk satu konfigurasi kunci"""
+        rng = random.Random(FIXTURE_SEED)
+        keys = load_fixture_keys(bits, composite)
+        ds = DigitalSignature(**keys)
+        sc = SubliminalChannel(**keys)
+
+        x = rng.randrange(2, ds.n)
+        reference = best_time(lambda: pow(x, -1, ds.n), 200)
+
+        message = rng.randrange(ds.n)
+        s1, s2, _ = ds.sign_message(message)
+        messages = [rng.randrange(ds.n) for _ in range(BATCH_SIZE)]
+        original, cover = rng.randrange(2, ds.n), rng.randrange(2, ds.n)
+        c1, c2, _ = sc.create_subliminal_message(original, cover)
+
+        decrypt = "decrypt_original_message [crt]" if composite else "decrypt_original_message"
+        timings = {
+            "sign_message": best_time(lambda: ds.sign_message(message), 100),
+            "sign_batch (per item)": best_time(lambda: ds.sign_batch(messages), 5) / BATCH_SIZE,
+            "verify_signature": best_time(lambda: ds.verify_signature(message, s1, s2), 200),
+            "create_subliminal_message": best_time(
+                lambda: sc.create_subliminal_message(original, cover), 100
+            ),
+            decrypt: best_time(lambda: sc.decrypt_original_message(c1, c2), 200),
+            "receive": best_time(lambda: sc.receive(cover, c1, c2), 200),
+        }
+        return {name: elapsed / reference for name, elapsed in timings.items()}
+
+    def test_budgets(self):
+        """Semua operasi pada semua ukuran kunci berada di bawah budget"""
+        for composite in (False, True):
+            for bits in PERF_SIZES:
+                for name, ratio in self.measure(bits, composite).items():
+                    budget = BUDGETS[name] * TOLERANCE
+                    with self.subTest(bits=bits, composite=composite, operation=name):
+                        self.assertLessEqual(
+                            ratio, budget,
+                            f"{name} @ {bits}-bit: {ratio:.2f}x invers > budget {budget:.2f}x"
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()
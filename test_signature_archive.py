@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk arsip tanda tangan berindeks (signature_archive.py)
+"""
+
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, Verifier, save_keys
+from signature_archive import ArchiveWriter, SignatureArchive, build_index, main
+from test_helpers import load_fixture_keys
+
+
+class TestSignatureArchive(unittest.TestCase):
+    """Test case untuk ArchiveWriter, build_index, dan SignatureArchive"""
+
+    def setUp(self):
+        self.ds = DigitalSignature(**load_fixture_keys(256))
+        self.verifier = Verifier(self.ds.n, self.ds.h)
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "sigs.ossarc")
+        self.messages = [m * 7919 + 3 for m in range(200)]
+        with ArchiveWriter(self.path, self.ds.n) as writer:
+            for message, (s1, s2, _) in zip(self.messages, self.ds.sign_batch(self.messages)):
+                writer.append(message, s1, s2)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_lookup_uses_index(self):
+        """Test setiap pesan ditemukan lewat indeks dan pesan asing tidak"""
+        self.assertEqual(build_index(self.path), 200)
+        with SignatureArchive(self.path) as archive:
+            self.assertFalse(archive.stale)
+            for message in self.messages[::13]:
+                self.assertTrue(archive.verify(self.verifier, message))
+            self.assertIsNone(archive.lookup(5))
+            self.assertFalse(archive.verify(self.verifier, 5))
+
+    def test_external_sort_matches_single_run(self):
+        """Test indeks dari banyak run (merge bertahap) identik dengan satu run"""
+        single = os.path.join(self.tmpdir, "single.idx")
+        merged = os.path.join(self.tmpdir, "merged.idx")
+        self.assertEqual(build_index(self.path, single), 200)
+        self.assertEqual(build_index(self.path, merged, run_size=7, fan_in=3), 200)
+        with open(single, "rb") as a, open(merged, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+        leftovers = [name for name in os.listdir(self.tmpdir) if name.endswith((".run", ".tmp"))]
+        self.assertEqual(leftovers, [])
+        with self.assertRaises(ValueError):
+            build_index(self.path, merged, run_size=0)
+
+    def test_lookup_without_index(self):
+        """Test lookup tanpa indeks mengembalikan None, scan tetap jalan"""
+        with SignatureArchive(self.path) as archive:
+            self.assertIsNone(archive.lookup(self.messages[0]))
+            self.assertEqual(len(list(archive.scan())), 200)
+
+    def test_append_marks_index_stale(self):
+        """Test record baru setelah indeks dibangun membuat indeks stale"""
+        build_index(self.path)
+        message = 424242
+        s1, s2, _ = self.ds.sign_message(message)
+        with ArchiveWriter(self.path, self.ds.n) as writer:
+            writer.append(message, s1, s2)
+        with SignatureArchive(self.path) as archive:
+            self.assertTrue(archive.stale)
+            self.assertEqual(len(archive), 201)
+            self.assertIsNone(archive.lookup(message))
+        build_index(self.path)
+        with SignatureArchive(self.path) as archive:
+            self.assertEqual(archive.lookup(message), (s1, s2))
+
+    def test_range_scan_feeds_batch_verifier(self):
+        """Test verifikasi range record"""
+        with SignatureArchive(self.path) as archive:
+            self.assertEqual(archive.record(10)[0], self.messages[10])
+            self.assertEqual(archive.verify_range(self.verifier, 50, 120, chunk_size=16),
+                             [True] * 70)
+            self.assertEqual(len(archive.verify_range(self.verifier)), 200)
+            other = DigitalSignature(**load_fixture_keys(512))
+            with self.assertRaises(ValueError):
+                archive.verify_range(Verifier(other.n, other.h))
+
+    def test_writer_rejects_other_key(self):
+        """Test arsip tidak bisa di-append dengan kunci lain"""
+        other = DigitalSignature(**load_fixture_keys(512))
+        with self.assertRaises(ValueError):
+            ArchiveWriter(self.path, other.n)
+
+    def test_cli(self):
+        """Test subcommand index, lookup, dan verify"""
+        key = os.path.join(self.tmpdir, "pub.json")
+        save_keys(key, self.ds, include_private=False)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["index", self.path]), 0)
+            self.assertEqual(main(["lookup", self.path, "--key", key, str(self.messages[3])]), 0)
+            self.assertEqual(main(["lookup", self.path, "--key", key, "5"]), 1)
+            self.assertEqual(main(["verify", self.path, "--key", key, "--stop", "20"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk SignatureArray (signature_array.py)
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, Verifier
+from signature_array import SignatureArray
+from test_helpers import load_fixture_keys
+
+
+class TestSignatureArray(unittest.TestCase):
+    """Test case untuk SignatureArray"""
+
+    def setUp(self):
+        self.ds = DigitalSignature(**load_fixture_keys(256))
+        self.messages = list(range(50))
+        self.signatures = [sig[:2] for sig in self.ds.sign_batch(self.messages)]
+        self.array = SignatureArray.from_signatures(self.ds.n, self.signatures)
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_fixed_width_storage(self):
+        """Test buffer berisi record lebar tetap tanpa objek per item"""
+        self.assertEqual(len(self.array), 50)
+        self.assertEqual(len(self.array.memoryview()), 50 * 2 * 32)
+        record = self.array.record(7)
+        s1, s2 = self.signatures[7]
+        self.assertEqual(bytes(record), s1.to_bytes(32, "big") + s2.to_bytes(32, "big"))
+
+    def test_indexing_iteration_and_slicing(self):
+        """Test indexing, iterasi, dan slicing mengembalikan nilai asli"""
+        self.assertEqual(self.array[0], self.signatures[0])
+        self.assertEqual(self.array[-1], self.signatures[-1])
+        self.assertEqual(list(self.array), self.signatures)
+        self.assertEqual(list(self.array[10:20]), self.signatures[10:20])
+        self.assertEqual(list(self.array[::7]), self.signatures[::7])
+        self.assertEqual(len(self.array[40:10]), 0)
+        with self.assertRaises(IndexError):
+            self.array[50]
+
+    def test_append_rejects_out_of_range(self):
+        """Test komponen di luar [0, n) ditolak"""
+        with self.assertRaises(ValueError):
+            self.array.append(self.ds.n, 1)
+        with self.assertRaises(ValueError):
+            self.array.append(-1, 1)
+        self.assertEqual(len(self.array), 50)
+
+    def test_verify_decodes_on_the_fly(self):
+        """Test verifikasi batch dari array, termasuk pesan yang salah"""
+        verifier = Verifier(self.ds.n, self.ds.h)
+        results = self.array.verify(verifier, [m + (m == 5) for m in self.messages])
+        self.assertEqual(results.count(False), 1)
+        self.assertFalse(results[5])
+        other = DigitalSignature(**load_fixture_keys(512))
+        with self.assertRaises(ValueError):
+            self.array.verify(other, self.messages)
+
+    def test_save_and_load(self):
+        """Test persistensi dengan dan tanpa mmap"""
+        path = os.path.join(self.tmpdir, "sigs.ossa")
+        self.array.save(path)
+
+        with SignatureArray.load(path, self.ds.n) as mapped:
+            self.assertEqual(list(mapped), self.signatures)
+            self.assertTrue(all(mapped.verify(self.ds, self.messages)))
+            with self.assertRaises(TypeError):
+                mapped.append(1, 2)
+
+        copied = SignatureArray.load(path, self.ds.n, use_mmap=False)
+        copied.append(*self.signatures[0])
+        self.assertEqual(len(copied), 51)
+
+        with self.assertRaises(ValueError):
+            SignatureArray.load(path, DigitalSignature(**load_fixture_keys(512)).n)
+
+    def test_empty_file_roundtrip(self):
+        """Test array kosong bisa disimpan dan dibuka"""
+        path = os.path.join(self.tmpdir, "empty.ossa")
+        SignatureArray(self.ds.n).save(path)
+        with SignatureArray.load(path, self.ds.n) as loaded:
+            self.assertEqual(len(loaded), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
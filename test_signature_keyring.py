@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk keyring dan codec tanda tangan terkemas
+"""
+
+import sys
+import os
+import unittest
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import (
+    DigitalSignature,
+    Verifier,
+    key_fingerprint,
+    pack_signature,
+    packed_signature_size,
+    unpack_signature,
+)
+from signature_keyring import KeyRing
+from test_helpers import load_fixture_keys
+
+
+class TestSignatureCodec(unittest.TestCase):
+    """Test case untuk pack_signature / unpack_signature"""
+
+    def setUp(self):
+        self.ds = DigitalSignature(**load_fixture_keys(512))
+
+    def test_roundtrip_fixed_width(self):
+        """Test kemas-buka tanda tangan dengan lebar tetap"""
+        s1, s2, _ = self.ds.sign_message(12345)
+        packed = pack_signature(s1, s2, self.ds.n)
+
+        self.assertEqual(len(packed), packed_signature_size(self.ds.n))
+        self.assertEqual(unpack_signature(packed), (self.ds.key_id, s1, s2))
+        self.assertEqual(len(self.ds.sign_packed(1)), len(packed))
+
+    def test_invalid_input(self):
+        """Test data rusak dan nilai di luar rentang ditolak"""
+        s1, s2, _ = self.ds.sign_message(12345)
+        packed = pack_signature(s1, s2, self.ds.n)
+
+        with self.assertRaises(ValueError):
+            unpack_signature(packed[:-1])
+        with self.assertRaises(ValueError):
+            unpack_signature(b"\x02" + packed[1:])
+        with self.assertRaises(ValueError):
+            pack_signature(self.ds.n, s2, self.ds.n)
+
+    def test_fingerprint_depends_on_n(self):
+        """Test key ID berbeda untuk kunci berbeda"""
+        other = load_fixture_keys(1024)["n"]
+        self.assertEqual(len(key_fingerprint(self.ds.n)), 8)
+        self.assertNotEqual(key_fingerprint(self.ds.n), key_fingerprint(other))
+
+
+class TestKeyRing(unittest.TestCase):
+    """Test case untuk KeyRing"""
+
+    def setUp(self):
+        self.old = DigitalSignature(**load_fixture_keys(512))
+        self.new = DigitalSignature(**load_fixture_keys(1024))
+        self.ring = KeyRing()
+        self.old_id = self.ring.add(self.old)
+        self.new_id = self.ring.add(self.new)
+
+    def test_dispatch_by_key_id(self):
+        """Test verifikasi memilih kunci yang benar dari header"""
+        from_old = self.ring.sign(111, self.old_id)
+        from_new = self.ring.sign(222, self.new_id)
+
+        self.assertTrue(self.ring.verify(111, from_old))
+        self.assertTrue(self.ring.verify(222, from_new))
+        self.assertFalse(self.ring.verify(112, from_old))
+
+    def test_rotation_without_restart(self):
+        """Test aktivasi kunci baru dan retire kunci lama"""
+        self.assertEqual(self.ring.active_key_id, self.old_id)
+        self.ring.activate(self.new_id)
+        packed = self.ring.sign(333)
+        self.assertEqual(unpack_signature(packed)[0], self.new_id)
+
+        legacy = self.ring.sign(444, self.old_id)
+        self.ring.retire(self.old_id)
+        self.assertNotIn(self.old_id, self.ring)
+        self.assertFalse(self.ring.verify(444, legacy))
+        self.assertTrue(self.ring.verify(333, packed))
+
+    def test_public_only_key(self):
+        """Test kunci publik bisa memverifikasi tapi tidak menandatangani"""
+        ring = KeyRing()
+        key_id = ring.add(Verifier(self.old.n, self.old.h))
+        self.assertTrue(ring.verify(555, self.old.sign_packed(555)))
+        with self.assertRaises(KeyError):
+            ring.sign(555, key_id)
+
+    def test_activate_public_key_leaves_ring_unchanged(self):
+        """Test add(Verifier, activate=True) ditolak tanpa mendaftarkan kunci"""
+        other = DigitalSignature(**load_fixture_keys(256))
+        before = self.ring.key_ids()
+        with self.assertRaises(ValueError):
+            self.ring.add(Verifier(other.n, other.h), activate=True)
+        self.assertEqual(self.ring.key_ids(), before)
+        self.assertEqual(self.ring.active_key_id, self.old_id)
+        self.assertFalse(self.ring.verify(5, other.sign_packed(5)))
+
+    def test_same_n_different_h_rejected(self):
+        """Test kunci lain dengan n sama tidak bisa menggantikan kunci yang ada"""
+        packed = self.ring.sign(777, self.old_id)
+        clash = DigitalSignature(self.old.n, self.old.k + 2)
+        with self.assertRaises(ValueError):
+            self.ring.add(clash)
+        self.assertTrue(self.ring.verify(777, packed))
+        self.assertEqual(self.ring.add(self.old), self.old_id)
+
+    def test_garbage_rejected(self):
+        """Test tanda tangan rusak atau key ID tak dikenal ditolak"""
+        self.assertFalse(self.ring.verify(1, b"garbage"))
+        s1, s2, _ = self.old.sign_message(1)
+        self.assertFalse(self.ring.verify(1, pack_signature(s1, s2, self.old.n, b"\x00" * 8)))
+
+
+if __name__ == "__main__":
+    unittest.main()
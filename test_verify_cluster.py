@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk verifikasi terdistribusi coordinator/worker (verify_cluster.py)
+"""
+
+import sys
+import os
+import json
+import socket
+import time
+import threading
+import unittest
+from unittest import mock
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature
+import verify_cluster
+from verify_cluster import Coordinator, run_worker, spawn_local_workers
+from test_helpers import load_fixture_keys
+
+
+def make_items(bits, count, bad=()):
+    ds = DigitalSignature(**load_fixture_keys(bits))
+    items = []
+    for m, (s1, s2, _) in enumerate(ds.sign_batch(range(count))):
+        items.append((ds.n, ds.h, m + 1 if m in bad else m, s1, s2))
+    return items
+
+
+def start_thread_worker(coordinator, name):
+    thread = threading.Thread(target=run_worker, args=(*coordinator.address, name),
+                              kwargs={"heartbeat_interval": 0.05}, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestCoordinator(unittest.TestCase):
+    """Test case untuk Coordinator dan worker"""
+
+    def test_mixed_keys_in_order(self):
+        """Test hasil dari beberapa kunci diagregasi sesuai urutan input"""
+        items = make_items(256, 40, bad={3}) + make_items(512, 40, bad={39})
+        with Coordinator() as coordinator:
+            workers = [start_thread_worker(coordinator, f"w{i}") for i in range(3)]
+            results = coordinator.verify(items, chunk_size=8, timeout=30)
+        for worker in workers:
+            worker.join(5)
+
+        expected = [True] * 80
+        expected[3] = expected[79] = False
+        self.assertEqual(results, expected)
+        self.assertEqual(sum(coordinator.worker_tasks.values()), 10)
+
+    def test_keys_sharing_n(self):
+        """Test dua kunci dengan n sama tetapi h berbeda diverifikasi terpisah"""
+        first = DigitalSignature(**load_fixture_keys(256))
+        second = DigitalSignature(first.n, first.k + 2)
+        items = []
+        for ds in (first, second):
+            for m in range(1, 6):
+                s1, s2, _ = ds.sign_message(m)
+                items.append((ds.n, ds.h, m, s1, s2))
+        items.append((second.n, second.h) + items[0][2:])
+        with Coordinator() as coordinator:
+            worker = start_thread_worker(coordinator, "w0")
+            results = coordinator.verify(items, chunk_size=4, timeout=30)
+        worker.join(5)
+        self.assertEqual(results, [True] * 10 + [False])
+
+    def test_malformed_item_does_not_kill_worker(self):
+        """Test item rusak menjadi False tanpa mematikan worker"""
+        items = make_items(256, 6)
+        items[2] = items[2][:4] + (None,)
+        items[4] = items[4][:3] + ("x", items[4][4])
+        with Coordinator(max_retries=0) as coordinator:
+            worker = start_thread_worker(coordinator, "w0")
+            results = coordinator.verify(items, chunk_size=3, timeout=30)
+        worker.join(5)
+        self.assertEqual(results, [True, True, False, True, False, True])
+        self.assertEqual(coordinator.retries, 0)
+
+    def test_crashed_worker_task_is_retried(self):
+        """Test task dari worker yang putus dikirim ulang ke worker lain"""
+        items = make_items(256, 20)
+        with Coordinator() as coordinator:
+            crashed = threading.Event()
+
+            def crashing_worker():
+                with socket.create_connection(coordinator.address) as sock:
+                    sock.sendall(json.dumps({"type": "hello", "worker": "crash"}).encode() + b"\n")
+                    reader = sock.makefile("rb")
+                    while json.loads(reader.readline())["type"] != "task":
+                        pass
+                    reader.close()
+                crashed.set()
+
+            threading.Thread(target=crashing_worker, daemon=True).start()
+            verifying = threading.Thread(
+                target=lambda: setattr(self, "results", coordinator.verify(items, 5, timeout=30))
+            )
+            verifying.start()
+            self.assertTrue(crashed.wait(10))
+            start_thread_worker(coordinator, "healthy")
+            verifying.join(30)
+
+        self.assertEqual(self.results, [True] * 20)
+        self.assertGreaterEqual(coordinator.retries, 1)
+
+    def test_malformed_reply_is_retried(self):
+        """Test balasan berbentuk salah membuat task dikirim ulang, bukan hilang"""
+        items = make_items(256, 4)
+        replies = [{"type": "result", "task_id": 0, "results": 5}, [1, 2], "result"]
+        with Coordinator(max_retries=len(replies)) as coordinator:
+
+            def bad_worker(reply):
+                with socket.create_connection(coordinator.address) as sock:
+                    sock.sendall(json.dumps({"type": "hello", "worker": "bad"}).encode() + b"\n")
+                    reader = sock.makefile("rb")
+                    while json.loads(reader.readline())["type"] != "task":
+                        pass
+                    sock.sendall(json.dumps(reply).encode() + b"\n")
+                    reader.readline()
+                    reader.close()
+
+            verifying = threading.Thread(
+                target=lambda: setattr(self, "results", coordinator.verify(items, 4, timeout=30))
+            )
+            verifying.start()
+            for reply in replies:
+                bad_worker(reply)
+            worker = start_thread_worker(coordinator, "healthy")
+            verifying.join(30)
+        worker.join(5)
+        self.assertEqual(self.results, [True] * 4)
+        self.assertEqual(coordinator.retries, len(replies))
+        self.assertEqual(coordinator.worker_tasks, {"healthy": 1})
+
+    def test_silent_worker_times_out(self):
+        """Test worker tanpa heartbeat dianggap mati setelah heartbeat_timeout"""
+        items = make_items(256, 4)
+        with Coordinator(heartbeat_timeout=0.3) as coordinator:
+            silent = socket.create_connection(coordinator.address)
+            silent.sendall(json.dumps({"type": "hello", "worker": "silent"}).encode() + b"\n")
+            threading.Timer(0.1, start_thread_worker, (coordinator, "healthy")).start()
+            results = coordinator.verify(items, chunk_size=4, timeout=30)
+            silent.close()
+
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(coordinator.worker_tasks, {"healthy": 1})
+
+    def test_timed_out_call_does_not_leak_into_next(self):
+        """Test task dari verify() yang timeout tidak mengisi hasil pemanggilan berikutnya"""
+        stale = make_items(256, 20, bad=set(range(20)))
+        items = make_items(256, 4, bad={1})
+        with Coordinator() as coordinator:
+            with self.assertRaises(TimeoutError):
+                coordinator.verify(stale, chunk_size=5, timeout=0.2)
+            worker = start_thread_worker(coordinator, "w0")
+            results = coordinator.verify(items, chunk_size=4, timeout=30)
+            second = coordinator.verify(items, chunk_size=2, timeout=30)
+        worker.join(5)
+        self.assertEqual(results, [True, False, True, True])
+        self.assertEqual(second, results)
+        self.assertEqual(coordinator.worker_tasks, {"w0": 3})
+
+    def test_worker_leaves_silent_coordinator(self):
+        """Test worker berhenti jika coordinator diam tanpa menutup koneksi"""
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            start = time.monotonic()
+            completed = run_worker(*server.getsockname()[:2], "w0", heartbeat_interval=0.05,
+                                   coordinator_timeout=0.3)
+        self.assertEqual(completed, 0)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_keepalive_holds_idle_worker(self):
+        """Test heartbeat coordinator menjaga worker yang menganggur tetap terhubung"""
+        items = make_items(256, 4)
+        with mock.patch.object(verify_cluster, "KEEPALIVE_INTERVAL", 0.05):
+            with Coordinator() as coordinator:
+                worker = threading.Thread(target=run_worker, args=(*coordinator.address, "w0"),
+                                          kwargs={"heartbeat_interval": 0.05,
+                                                  "coordinator_timeout": 0.4},
+                                          daemon=True)
+                worker.start()
+                time.sleep(1.0)
+                self.assertTrue(worker.is_alive())
+                results = coordinator.verify(items, chunk_size=4, timeout=30)
+            worker.join(5)
+        self.assertEqual(results, [True] * 4)
+        self.assertEqual(coordinator.worker_tasks, {"w0": 1})
+
+    def test_gives_up_after_max_retries(self):
+        """Test task yang selalu gagal menghasilkan RuntimeError"""
+        items = make_items(256, 2)
+        with Coordinator(heartbeat_timeout=0.2, max_retries=1) as coordinator:
+            sockets = []
+            for _ in range(2):
+                sock = socket.create_connection(coordinator.address)
+                sock.sendall(json.dumps({"type": "hello", "worker": "silent"}).encode() + b"\n")
+                sockets.append(sock)
+            with self.assertRaises(RuntimeError):
+                coordinator.verify(items, timeout=30)
+            for sock in sockets:
+                sock.close()
+
+    def test_local_worker_processes(self):
+        """Test beberapa proses worker lokal sebagai pengganti node"""
+        items = make_items(256, 60, bad={10, 20})
+        with Coordinator() as coordinator:
+            processes = spawn_local_workers(coordinator.address, 2)
+            results = coordinator.verify(items, chunk_size=10, timeout=60)
+        for process in processes:
+            process.join(10)
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(results.count(False), 2)
+        self.assertFalse(results[10] or results[20])
+
+
+if __name__ == "__main__":
+    unittest.main()
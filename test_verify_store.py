@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk indeks persisten tanda tangan terverifikasi (verify_store.py)
+"""
+
+import sys
+import os
+import io
+import time
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, Verifier
+from verify_store import VerificationStore, measure_cold_start, main
+from test_helpers import load_fixture_keys
+
+
+class TestVerificationStore(unittest.TestCase):
+    """Test case untuk VerificationStore"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "verified.db")
+        self.ds = DigitalSignature(**load_fixture_keys(256))
+        self.verifier = Verifier(self.ds.n, self.ds.h)
+        self.signed = [(m,) + self.ds.sign_message(m)[:2] for m in range(1, 11)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_survives_restart(self):
+        """Test hasil verifikasi tetap ada setelah store dibuka ulang"""
+        with VerificationStore(self.path, batch_size=4) as store:
+            for item in self.signed:
+                self.assertTrue(store.verify(self.verifier, *item))
+            self.assertEqual(store.misses, 10)
+
+        with VerificationStore(self.path) as store:
+            self.assertEqual(len(store), 10)
+            for item in self.signed:
+                self.assertTrue(store.verify(self.ds, *item))
+            self.assertEqual(store.hits, 10)
+
+    def test_keys_sharing_n_are_separate(self):
+        """Test entri milik satu kunci tidak diterima untuk kunci lain dengan n sama"""
+        other = DigitalSignature(self.ds.n, self.ds.k + 2)
+        with VerificationStore(self.path) as store:
+            for item in self.signed:
+                self.assertTrue(store.verify(self.verifier, *item))
+            store.flush()
+            for item in self.signed:
+                self.assertFalse(store.verify(other, *item))
+            self.assertEqual(store.hits, 0)
+
+    def test_wal_mode(self):
+        """Test database memakai WAL journal mode"""
+        with VerificationStore(self.path) as store:
+            mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+
+    def test_invalid_not_stored(self):
+        """Test tanda tangan tidak valid tidak dicatat"""
+        message, s1, s2 = self.signed[0]
+        with VerificationStore(self.path) as store:
+            self.assertFalse(store.verify(self.verifier, message + 1, s1, s2))
+            self.assertFalse(store.verify(self.verifier, message, "x", s2))
+            self.assertEqual(len(store), 0)
+
+    def test_expiry_and_compaction(self):
+        """Test entri kedaluwarsa diabaikan lalu dihapus oleh compact"""
+        with VerificationStore(self.path, ttl=60) as store:
+            for item in self.signed:
+                store.verify(self.verifier, *item)
+            store.flush()
+            with store._conn:
+                store._conn.execute("UPDATE verified SET verified_at = ?", (time.time() - 3600,))
+
+            key = store.make_key(self.ds.n, self.ds.h, *self.signed[0])
+            self.assertFalse(store.contains(*key))
+            self.assertEqual(store.compact(), 10)
+            self.assertEqual(len(store), 0)
+
+    def test_cold_start_measurement(self):
+        """Test pengukuran cold start dan entry point CLI"""
+        with VerificationStore(self.path) as store:
+            for item in self.signed:
+                store.verify(self.verifier, *item)
+
+        result = measure_cold_start(self.path, lookups=20)
+        self.assertEqual(result["lookups"], 20)
+        self.assertGreater(result["lookups_per_second"], 0)
+
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["compact", self.path, "--max-age", "3600"]), 0)
+            self.assertEqual(main(["bench", self.path, "--lookups", "5"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
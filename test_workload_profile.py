@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+Test untuk profiling workload (workload_profile.py)
+"""
+
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Tambahkan path untuk import module
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ong_schnorr_shamir import DigitalSignature, SubliminalChannel
+from test_helpers import load_fixture_keys
+from workload_profile import (
+    OPERATIONS, build_workload, collapsed_stacks, hot_functions, main,
+    profile_cpu, profile_memory, profile_workload, write_outputs,
+)
+
+
+class TestWorkloadProfile(unittest.TestCase):
+    """Test case untuk tabel fungsi terpanas, collapsed stack dan laporan memori"""
+
+    @classmethod
+    def setUpClass(cls):
+        keys = load_fixture_keys(256, composite=True)
+        cls.ds = DigitalSignature(**keys)
+        cls.sc = SubliminalChannel(**keys)
+
+    def test_workload_results_are_correct(self):
+        """Test workload verify/receive benar-benar memakai tanda tangan valid"""
+        workload = build_workload(self.ds, self.sc, ["verify_batch", "receive"], count=20,
+                                  batch_size=8)
+        self.assertEqual(workload["verify_batch"](), [True] * 20)
+        self.assertTrue(all(workload["receive"]()))
+        with self.assertRaises(ValueError):
+            build_workload(self.ds, self.sc, ["mine"])
+
+    def test_hot_functions_include_builtins(self):
+        """Test builtin seperti pow muncul di tabel dan tabel terurut"""
+        workload = build_workload(self.ds, self.sc, ["sign"], count=50)
+        stats, seconds = profile_cpu(workload["sign"])
+        self.assertGreater(seconds, 0)
+
+        rows = hot_functions(stats, "calls", limit=50)
+        self.assertTrue(any("pow" in row["function"] for row in rows))
+        self.assertEqual([row["calls"] for row in rows],
+                         sorted((row["calls"] for row in rows), reverse=True))
+        with self.assertRaises(ValueError):
+            hot_functions(stats, "name")
+
+    def test_collapsed_stacks_format(self):
+        """Test collapsed stack berformat 'a;b;c <angka>' dan memuat sign_message"""
+        stats, _ = profile_cpu(build_workload(self.ds, self.sc, ["sign"], count=50)["sign"])
+        lines = collapsed_stacks(stats)
+        self.assertTrue(lines)
+        for line in lines:
+            stack, weight = line.rsplit(" ", 1)
+            self.assertGreater(int(weight), 0)
+            self.assertTrue(all(stack.split(";")))
+        self.assertTrue(any("sign_message" in line for line in lines))
+        self.assertFalse(any("_lsprof" in line for line in lines))
+
+    def test_memory_report(self):
+        """Test peak memori mencakup hasil operasi yang masih hidup"""
+        report = profile_memory(lambda: [bytes(1000) for _ in range(100)])
+        self.assertGreaterEqual(report["peak_bytes"], 100 * 1000)
+        self.assertGreaterEqual(report["net_bytes"], 100 * 1000)
+        self.assertTrue(report["top_allocations"])
+
+    def test_profile_workload_and_outputs(self):
+        """Test profile_workload untuk semua operasi dan file output"""
+        results = profile_workload(self.ds, self.sc, OPERATIONS, count=10, batch_size=4)
+        self.assertEqual(list(results), list(OPERATIONS))
+        for result in results.values():
+            self.assertIsNotNone(result["stats"])
+            self.assertIn("peak_bytes", result)
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            written = write_outputs(results, tmpdir)
+            self.assertEqual(len(written), 2 * len(OPERATIONS))
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "sign.collapsed")))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_cli(self):
+        """Test CLI mencetak tabel dan laporan memori"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(main(["--bits", "128", "--count", "5", "--ops", "sign", "receive",
+                                   "--top", "3"]), 0)
+        text = output.getvalue()
+        self.assertIn("=== sign (5 item) ===", text)
+        self.assertIn("B/item", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
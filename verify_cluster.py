@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+
+"""
+Fan-out verifikasi ke banyak node: satu coordinator, banyak worker (TCP)
+
+Coordinator membagi item (n, h, M, S1, S2) menjadi task per kunci dan
+membagikannya ke worker yang terhubung. Protokolnya JSON per baris:
+
+    worker -> coordinator   {"type": "hello", "worker": nama}
+    coordinator -> worker   {"type": "key", "key_id": hex, "n": n, "h": h}
+    coordinator -> worker   {"type": "task", "task_id": i, "key_id": hex, "items": [[M, S1, S2], ...]}
+    worker -> coordinator   {"type": "heartbeat"}
+    coordinator -> worker   {"type": "heartbeat"}
+    worker -> coordinator   {"type": "result", "task_id": i, "results": [true, ...]}
+    coordinator -> worker   {"type": "shutdown"}
+
+Pesan "key" dikirim sekali per kunci per koneksi; worker membuat Verifier
+untuk kunci itu sekali dan memakainya untuk semua task berikutnya. Worker
+mengirim heartbeat berkala; koneksi yang diam lebih lama dari
+heartbeat_timeout atau terputus dianggap mati dan task-nya dikembalikan
+ke antrean (maksimum max_retries kali). Sebaliknya coordinator mengirim
+heartbeat ke worker yang menganggur paling lambat setiap KEEPALIVE_INTERVAL
+detik, dan worker memutus koneksi jika tidak menerima apa pun selama
+coordinator_timeout (coordinator hilang tanpa menutup koneksi).
+
+Ini fan-out di memori: coordinator membaca seluruh item ke memori dan
+mengirim (M, S1, S2) lewat JSON, sehingga ukuran arsip dibatasi memori
+coordinator. Worker tidak membaca arsip sendiri; untuk arsip besar di satu
+mesin gunakan bulk_verify.py, yang membagi file per rentang byte.
+
+Contoh (semua di localhost):
+    python verify_cluster.py coordinate archive.txt --key pub.json --port 7000 --local-workers 4
+    python verify_cluster.py worker --connect 10.0.0.5:7000
+"""
+
+import sys
+import os
+import json
+import time
+import queue
+import socket
+import argparse
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ong_schnorr_shamir import Verifier, load_keys, public_key_id
+
+MixedItem = Tuple[int, int, int, int, int]
+
+# Coordinator mengirim heartbeat ke worker yang menganggur paling lambat
+# setiap sekian detik; harus jauh di bawah coordinator_timeout worker
+KEEPALIVE_INTERVAL = 1.0
+
+
+def _send(sock: socket.socket, lock: threading.Lock, message: dict) -> None:
+    data = json.dumps(message).encode() + b"\n"
+    with lock:
+        sock.sendall(data)
+
+
+def _recv(reader) -> dict:
+    line = reader.readline()
+    if not line:
+        raise ConnectionError("Koneksi ditutup")
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Pesan harus berupa objek JSON")
+    return message
+
+
+class _Task:
+    __slots__ = ("generation", "task_id", "key_id", "indices", "items", "attempts")
+
+    def __init__(self, generation: int, task_id: int, key_id: str, indices: List[int],
+                 items: List[list]):
+        self.generation = generation
+        self.task_id = task_id
+        self.key_id = key_id
+        self.indices = indices
+        self.items = items
+        self.attempts = 0
+
+
+class Coordinator:
+    """
+    Coordinator yang membagikan task verifikasi ke worker TCP
+
+    Gunakan sebagai context manager; verify() bisa dipanggil berkali-kali
+    selama coordinator berjalan.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 heartbeat_timeout: float = 10.0, max_retries: int = 3):
+        """
+        Args:
+            host, port: Alamat listen (port 0 = pilih otomatis)
+            heartbeat_timeout: Detik tanpa pesan sebelum worker dianggap mati
+            max_retries: Berapa kali satu task boleh dikirim ulang
+        """
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_retries = max_retries
+        self.retries = 0
+        self.worker_tasks: Dict[str, int] = {}
+
+        self._keys: Dict[str, Tuple[int, int]] = {}
+        self._queue: "queue.Queue[_Task]" = queue.Queue()
+        self._results: List[Optional[bool]] = []
+        self._outstanding = 0
+        self._generation = 0
+        self._abandoned: List[_Task] = []
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._closed = threading.Event()
+        self._handlers: List[threading.Thread] = []
+
+        self._server = socket.create_server((host, port))
+        self._server.settimeout(0.2)
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) tempat coordinator listen"""
+        return self._server.getsockname()[:2]
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            handler = threading.Thread(target=self._serve_worker, args=(conn,), daemon=True)
+            handler.start()
+            self._handlers.append(handler)
+
+    def _serve_worker(self, conn: socket.socket) -> None:
+        conn.settimeout(self.heartbeat_timeout)
+        send_lock = threading.Lock()
+        reader = conn.makefile("rb")
+        sent_keys = set()
+        task = None
+        try:
+            name = _recv(reader).get("worker", "?")
+            last_sent = time.monotonic()
+            while not self._closed.is_set():
+                try:
+                    task = self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    if time.monotonic() - last_sent >= KEEPALIVE_INTERVAL:
+                        _send(conn, send_lock, {"type": "heartbeat"})
+                        last_sent = time.monotonic()
+                    continue
+                if self._stale(task):
+                    task = None
+                    continue
+                if task.key_id not in sent_keys:
+                    n, h = self._keys[task.key_id]
+                    _send(conn, send_lock, {"type": "key", "key_id": task.key_id, "n": n, "h": h})
+                    sent_keys.add(task.key_id)
+                _send(conn, send_lock, {"type": "task", "task_id": task.task_id,
+                                        "key_id": task.key_id, "items": task.items})
+                while True:
+                    message = _recv(reader)
+                    if message.get("type") == "result" and message.get("task_id") == task.task_id:
+                        break
+                results = message.get("results")
+                if not isinstance(results, list) or len(results) != len(task.indices):
+                    raise ValueError("Hasil bukan list sepanjang task")
+                self._complete(task, results, name)
+                task = None
+                last_sent = time.monotonic()
+            _send(conn, send_lock, {"type": "shutdown"})
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Timeout heartbeat, koneksi putus, atau pesan rusak
+            if task is not None:
+                self._retry(task)
+        finally:
+            reader.close()
+            conn.close()
+
+    def _stale(self, task: _Task) -> bool:
+        """Task milik pemanggilan verify() sebelumnya (mis. yang timeout)"""
+        with self._lock:
+            return task.generation != self._generation
+
+    def _complete(self, task: _Task, results: Sequence[bool], worker: str) -> None:
+        with self._lock:
+            if task.generation != self._generation:
+                return
+            for index, valid in zip(task.indices, results):
+                self._results[index] = bool(valid)
+            self.worker_tasks[worker] = self.worker_tasks.get(worker, 0) + 1
+            self._outstanding -= 1
+            self._done.notify_all()
+
+    def _retry(self, task: _Task) -> None:
+        with self._lock:
+            if task.generation != self._generation:
+                return
+            task.attempts += 1
+            if task.attempts > self.max_retries:
+                self._abandoned.append(task)
+                self._outstanding -= 1
+                self._done.notify_all()
+                return
+            self.retries += 1
+        self._queue.put(task)
+
+    def verify(self, items: Iterable[MixedItem], chunk_size: int = 256,
+               timeout: Optional[float] = None) -> List[bool]:
+        """
+        Verifikasi item (n, h, M, S1, S2) di worker yang terhubung
+
+        Args:
+            items: Item campuran seperti verify_mixed
+            chunk_size: Jumlah item maksimum per task
+            timeout: Batas waktu total dalam detik (None = tunggu terus)
+
+        Returns:
+            List bool sesuai urutan input
+
+        Raises:
+            RuntimeError: Jika ada task yang gagal setelah max_retries
+            TimeoutError: Jika timeout terlewati
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size harus >= 1")
+
+        groups: Dict[str, Tuple[List[int], List[list]]] = {}
+        count = 0
+        for index, (n, h, message, s1, s2) in enumerate(items):
+            key_id = public_key_id(n, h).hex()
+            self._keys.setdefault(key_id, (n, h % n))
+            if self._keys[key_id] != (n, h % n):
+                raise ValueError("Dua kunci berbeda dengan key_id yang sama")
+            indices, payload = groups.setdefault(key_id, ([], []))
+            indices.append(index)
+            payload.append([message, s1, s2])
+            count = index + 1
+
+        with self._lock:
+            # Generasi baru: hasil dan retry task dari pemanggilan sebelumnya
+            # (yang timeout) diabaikan
+            self._generation += 1
+            self._results = [None] * count
+            self._abandoned = []
+            tasks = []
+            for key_id, (indices, payload) in groups.items():
+                for start in range(0, len(indices), chunk_size):
+                    tasks.append(_Task(self._generation, len(tasks), key_id, indices[start:start + chunk_size],
+                                       payload[start:start + chunk_size]))
+            self._outstanding = len(tasks)
+        for task in tasks:
+            self._queue.put(task)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._outstanding:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("Verifikasi cluster melewati batas waktu")
+                self._done.wait(remaining)
+            if self._abandoned:
+                raise RuntimeError(
+                    f"{len(self._abandoned)} task gagal setelah {self.max_retries} percobaan ulang"
+                )
+            return list(self._results)
+
+    def close(self) -> None:
+        """Hentikan coordinator; worker menerima pesan shutdown"""
+        self._closed.set()
+        self._server.close()
+        self._accept_thread.join()
+        for handler in self._handlers:
+            handler.join(self.heartbeat_timeout)
+
+    def __enter__(self) -> "Coordinator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def run_worker(host: str, port: int, name: Optional[str] = None,
+               heartbeat_interval: float = 1.0, coordinator_timeout: float = 30.0) -> int:
+    """
+    Jalankan worker sampai coordinator mengirim shutdown, koneksi putus, atau
+    coordinator diam lebih lama dari coordinator_timeout detik
+
+    Returns:
+        Jumlah task yang diselesaikan
+    """
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    verifiers: Dict[str, Verifier] = {}
+    completed = 0
+    stop = threading.Event()
+    send_lock = threading.Lock()
+
+    with socket.create_connection((host, port)) as sock:
+        sock.settimeout(coordinator_timeout)
+        reader = sock.makefile("rb")
+
+        def heartbeat():
+            while not stop.wait(heartbeat_interval):
+                try:
+                    _send(sock, send_lock, {"type": "heartbeat"})
+                except OSError:
+                    return
+
+        _send(sock, send_lock, {"type": "hello", "worker": name})
+        beater = threading.Thread(target=heartbeat, daemon=True)
+        beater.start()
+        try:
+            while True:
+                try:
+                    message = _recv(reader)
+                except (OSError, ValueError):
+                    break
+                kind = message.get("type")
+                if kind == "key":
+                    verifiers[message["key_id"]] = Verifier(message["n"], message["h"])
+                elif kind == "task":
+                    results = _verify_items(verifiers[message["key_id"]], message["items"])
+                    _send(sock, send_lock, {"type": "result", "task_id": message["task_id"],
+                                            "results": results})
+                    completed += 1
+                elif kind == "shutdown":
+                    break
+        finally:
+            stop.set()
+            beater.join()
+            reader.close()
+    return completed
+
+
+def _verify_items(verifier: Verifier, items: List[list]) -> List[bool]:
+    """
+    verify_batch untuk satu task; jika ada item rusak (mis. S2 bernilai null),
+    verifikasi diulang per item dan item rusak menjadi False, seperti
+    verify_mixed, agar satu item tidak mematikan worker
+    """
+    try:
+        return verifier.verify_batch([tuple(item) for item in items])
+    except (TypeError, ValueError):
+        results = []
+        for item in items:
+            try:
+                results.append(verifier.verify(*item))
+            except (TypeError, ValueError):
+                results.append(False)
+        return results
+
+
+def _worker_process(host: str, port: int, name: str) -> None:
+    try:
+        run_worker(host, port, name)
+    except ConnectionError:
+        # Coordinator sudah selesai sebelum worker sempat terhubung
+        pass
+
+
+def spawn_local_workers(address: Tuple[str, int], count: int) -> list:
+    """
+    Jalankan worker sebagai proses lokal (pengganti node untuk test/dev)
+
+    Memakai start method "spawn" karena coordinator sudah menjalankan
+    thread; fork dari proses multi-thread bisa mewarisi lock yang terkunci.
+
+    Returns:
+        List multiprocessing.Process yang sudah di-start
+    """
+    import multiprocessing
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_worker_process, args=(*address, f"local-{i}"), daemon=True)
+        for i in range(count)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def _read_archive(path: str, n: int, h: int) -> List[MixedItem]:
+    items = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if fields:
+                message, s1, s2 = (int(field) for field in fields)
+                items.append((n, h, message, s1, s2))
+    return items
+
+
+def main(argv=None) -> int:
+    """Entry point; exit code 1 jika ada tanda tangan yang tidak valid"""
+    parser = argparse.ArgumentParser(description="Verifikasi terdistribusi coordinator/worker")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    coordinate = subparsers.add_parser("coordinate", help="bagikan arsip ke worker")
+    coordinate.add_argument("archive", help='file "M S1 S2" per baris')
+    coordinate.add_argument("--key", required=True, help="file kunci (publik cukup)")
+    coordinate.add_argument("--host", default="127.0.0.1")
+    coordinate.add_argument("--port", type=int, default=0)
+    coordinate.add_argument("--chunk-size", type=int, default=256)
+    coordinate.add_argument("--local-workers", type=int, default=0,
+                            help="jalankan N worker lokal")
+    coordinate.add_argument("--heartbeat-timeout", type=float, default=10.0)
+
+    worker = subparsers.add_parser("worker", help="ambil task dari coordinator")
+    worker.add_argument("--connect", required=True, help="host:port coordinator")
+    worker.add_argument("--coordinator-timeout", type=float, default=30.0,
+                        help="detik tanpa pesan sebelum coordinator dianggap hilang")
+
+    args = parser.parse_args(argv)
+    if args.command == "worker":
+        host, port = args.connect.rsplit(":", 1)
+        run_worker(host, int(port), coordinator_timeout=args.coordinator_timeout)
+        return 0
+
+    keys = load_keys(args.key)
+    items = _read_archive(args.archive, keys["n"], keys["h"])
+    with Coordinator(args.host, args.port, heartbeat_timeout=args.heartbeat_timeout) as coordinator:
+        print(f"📡 Coordinator listen di {coordinator.address[0]}:{coordinator.address[1]}",
+              file=sys.stderr)
+        processes = spawn_local_workers(coordinator.address, args.local_workers)
+        results = coordinator.verify(items, args.chunk_size)
+    for process in processes:
+        process.join()
+
+    failed = results.count(False)
+    print(json.dumps({"ok": len(results) - failed, "failed": failed,
+                      "retries": coordinator.retries, "workers": coordinator.worker_tasks}))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+"""
+Indeks persisten tanda tangan yang sudah terverifikasi (SQLite)
+
+Melengkapi VerificationCache (in-process) dengan penyimpanan yang bertahan
+setelah restart. Setiap tanda tangan yang lolos verifikasi dicatat dengan
+kunci (public_key_id(n, h), digest 16 byte dari (n, h, M, S1, S2)); verifikasi
+ulang atas tanda tangan arsip cukup satu lookup indeks.
+
+Database memakai WAL mode sehingga banyak proses pembaca bisa berjalan
+bersamaan dengan satu penulis, dan insert dikumpulkan per batch.
+
+Contoh:
+    python verify_store.py compact verified.db --max-age 2592000
+    python verify_store.py bench verified.db --lookups 10000
+"""
+
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import threading
+from typing import List, Optional, Tuple
+
+from ong_schnorr_shamir import VerificationCache, public_key_id
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verified (
+    key_id BLOB NOT NULL,
+    digest BLOB NOT NULL,
+    verified_at REAL NOT NULL,
+    PRIMARY KEY (key_id, digest)
+) WITHOUT ROWID
+"""
+
+
+class VerificationStore:
+    """
+    Penyimpanan persisten hasil verifikasi positif
+
+    Hanya tanda tangan yang valid yang disimpan. Entri yang lebih tua dari
+    ttl diabaikan saat dibaca dan dihapus oleh compact().
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None, batch_size: int = 256):
+        """
+        Args:
+            path: Path file database SQLite
+            ttl: Umur entri dalam detik (None = tidak kedaluwarsa)
+            batch_size: Jumlah insert yang dikumpulkan sebelum commit
+        """
+        self.path = path
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._pending: List[Tuple[bytes, bytes, float]] = []
+        self._pending_keys = set()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(n: int, h: int, message: int, s1: int, s2: int) -> Tuple[bytes, bytes]:
+        """
+        Kunci indeks (ID kunci publik (n, h), digest tanda tangan)
+
+        h ikut menentukan baris karena kunci berbeda bisa memakai n yang sama.
+        """
+        return public_key_id(n, h), VerificationCache.make_key(n, h, message, s1, s2)
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    def contains(self, key_id: bytes, digest: bytes) -> bool:
+        """True jika tanda tangan sudah tercatat valid dan belum kedaluwarsa"""
+        with self._lock:
+            if (key_id, digest) in self._pending_keys:
+                return True
+            row = self._conn.execute(
+                "SELECT verified_at FROM verified WHERE key_id = ? AND digest = ?",
+                (key_id, digest),
+            ).fetchone()
+        return row is not None and row[0] >= self._cutoff()
+
+    def add(self, key_id: bytes, digest: bytes) -> None:
+        """Catat tanda tangan valid; ditulis ke disk per batch_size entri"""
+        with self._lock:
+            if (key_id, digest) in self._pending_keys:
+                return
+            self._pending.append((key_id, digest, time.time()))
+            self._pending_keys.add((key_id, digest))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Tulis semua entri yang masih di buffer"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verified (key_id, digest, verified_at) VALUES (?, ?, ?)",
+                self._pending,
+            )
+        self._pending.clear()
+        self._pending_keys.clear()
+
+    def verify(self, verifier, message: int, s1: int, s2: int) -> bool:
+        """
+        Verifikasi dengan memeriksa indeks terlebih dahulu
+
+        Args:
+            verifier: Objek dengan atribut n, h dan method verify (Verifier) atau
+                verify_signature (DigitalSignature)
+            message, s1, s2: Pesan dan tanda tangan
+
+        Returns:
+            True jika tercatat di indeks atau lolos verifikasi aritmetika
+        """
+        try:
+            key_id, digest = self.make_key(verifier.n, verifier.h, message, s1, s2)
+        except (TypeError, AttributeError, OverflowError):
+            return False
+
+        if self.contains(key_id, digest):
+            self.hits += 1
+            return True
+        self.misses += 1
+
+        check = getattr(verifier, "verify", None) or verifier.verify_signature
+        result = check(message, s1, s2)
+        if result:
+            self.add(key_id, digest)
+        return result
+
+    def compact(self, max_age: Optional[float] = None) -> int:
+        """
+        Hapus entri kedaluwarsa dan kecilkan file WAL
+
+        Args:
+            max_age: Umur maksimum dalam detik (default: ttl store)
+
+        Returns:
+            Jumlah entri yang dihapus
+        """
+        max_age = max_age if max_age is not None else self.ttl
+        with self._lock:
+            self._flush_locked()
+            deleted = 0
+            if max_age is not None:
+                with self._conn:
+                    cursor = self._conn.execute(
+                        "DELETE FROM verified WHERE verified_at < ?", (time.time() - max_age,)
+                    )
+                deleted = cursor.rowcount
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute("SELECT COUNT(*) FROM verified").fetchone()[0]
+
+    def close(self) -> None:
+        """Flush buffer lalu tutup koneksi"""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def __enter__(self) -> "VerificationStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def measure_cold_start(path: str, lookups: int = 1000) -> dict:
+    """
+    Ukur performa baca dari koneksi baru (cold start)
+
+    Membuka database, mengambil sampel kunci yang ada, lalu mengukur waktu
+    lookup acak (campuran hit dan miss).
+
+    Returns:
+        Dict berisi open_seconds, first_lookup_seconds, lookups, lookups_per_second
+    """
+    start = time.perf_counter()
+    store = VerificationStore(path)
+    open_seconds = time.perf_counter() - start
+
+    with store._lock:
+        rows = store._conn.execute(
+            "SELECT key_id, digest FROM verified LIMIT ?", (lookups,)
+        ).fetchall()
+    rng = random.Random(0)
+    keys = [rows[rng.randrange(len(rows))] if rows and i % 2 == 0
+            else (bytes(8), rng.getrandbits(128).to_bytes(16, "big"))
+            for i in range(lookups)]
+
+    first_start = time.perf_counter()
+    if keys:
+        store.contains(*keys[0])
+    first_lookup = time.perf_counter() - first_start
+
+    start = time.perf_counter()
+    for key_id, digest in keys:
+        store.contains(key_id, digest)
+    elapsed = time.perf_counter() - start
+    store.close()
+
+    return {
+        "open_seconds": open_seconds,
+        "first_lookup_seconds": first_lookup,
+        "lookups": len(keys),
+        "lookups_per_second": len(keys) / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def main(argv=None) -> int:
+    """Entry point untuk job compaction dan pengukuran cold start"""
+    parser = argparse.ArgumentParser(description="Indeks persisten tanda tangan terverifikasi")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compact = subparsers.add_parser("compact", help="hapus entri kedaluwarsa")
+    compact.add_argument("db")
+    compact.add_argument("--max-age", type=float, required=True, help="umur maksimum (detik)")
+
+    bench = subparsers.add_parser("bench", help="ukur performa baca cold start")
+    bench.add_argument("db")
+    bench.add_argument("--lookups", type=int, default=1000)
+
+    args = parser.parse_args(argv)
+    if args.command == "compact":
+        with VerificationStore(args.db) as store:
+            deleted = store.compact(args.max_age)
+            print(f"🧹 {deleted} entri dihapus, {len(store)} tersisa")
+    else:
+        result = measure_cold_start(args.db, args.lookups)
+        print(f"⏱️  Open: {result['open_seconds']:.6f} detik")
+        print(f"⏱️  Lookup pertama: {result['first_lookup_seconds']:.6f} detik")
+        print(f"🚀 Throughput lookup: {result['lookups_per_second']:.0f} ops/detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+
+"""
+Profiling workload DigitalSignature / SubliminalChannel
+
+Menjalankan workload yang bisa dikonfigurasi di bawah cProfile (waktu per
+fungsi, termasuk builtin seperti pow, math.gcd dan random.randint) dan/atau
+tracemalloc (memori puncak per operasi). Dua mode dijalankan sebagai pass
+terpisah karena tracemalloc memperlambat alokasi dan akan mengacaukan
+angka waktu.
+
+Output:
+    - tabel fungsi terpanas per operasi (urut tottime/cumulative/calls)
+    - collapsed stack ("a;b;c <mikrodetik>") per operasi untuk flamegraph.pl
+      atau speedscope, diturunkan dari graf caller/callee cProfile
+    - memori puncak, memori bersih dan lokasi alokasi terbesar per operasi
+
+Contoh:
+    python workload_profile.py --bits 2048 --count 2000 --ops sign sign_batch
+    python cli.py profile --key keys.json --mode memory --output-dir prof/
+
+Seperti cli.py, library dan modul profiler baru di-import saat dipakai,
+sehingga cli.py bisa mendaftarkan argumen dari modul ini tanpa menambah
+waktu startup subcommand lain.
+"""
+
+import sys
+import os
+import time
+import argparse
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import pstats
+
+    from ong_schnorr_shamir import DigitalSignature, SubliminalChannel
+
+OPERATIONS = ("sign", "sign_batch", "verify", "verify_batch", "subliminal", "receive")
+SORT_KEYS = ("tottime", "cumulative", "calls")
+MAX_STACK_DEPTH = 64
+
+
+def build_workload(ds: "DigitalSignature", sc: "SubliminalChannel", operations: Sequence[str],
+                   count: int = 1000, batch_size: int = 256,
+                   seed: int = 0) -> Dict[str, Callable[[], object]]:
+    """
+    Siapkan input dan kembalikan callable per operasi
+
+    Input (pesan, tanda tangan) dibuat di sini, di luar pengukuran, sehingga
+    profil hanya berisi pekerjaan operasi itu sendiri.
+
+    Args:
+        ds, sc: Objek dengan kunci yang sama
+        operations: Subset OPERATIONS
+        count: Jumlah item per operasi
+        batch_size: Ukuran chunk untuk sign_batch/verify_batch/receive
+    """
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"Operasi tidak dikenal: {', '.join(sorted(unknown))}")
+
+    import random
+
+    rng = random.Random(seed)
+    n = ds.n
+    messages = [rng.randrange(2, n) for _ in range(count)]
+    signed = [(m, s1, s2) for m, (s1, s2, _) in zip(messages, ds.sign_batch(messages))]
+    originals = [rng.randrange(2, n) for _ in range(count)]
+    covers = [(m, *sc.create_subliminal_message(w, m)[:2]) for w, m in zip(originals, messages)]
+
+    workload = {
+        "sign": lambda: [ds.sign_message(m) for m in messages],
+        "sign_batch": lambda: list(ds.sign_iter(messages, batch_size)),
+        "verify": lambda: [ds.verify_signature(m, s1, s2) for m, s1, s2 in signed],
+        "verify_batch": lambda: list(ds.verify_iter(signed, batch_size)),
+        "subliminal": lambda: [sc.create_subliminal_message(w, m)
+                               for w, m in zip(originals, messages)],
+        "receive": lambda: list(sc.receive_iter(covers, batch_size)),
+    }
+    return {name: workload[name] for name in operations}
+
+
+def _label(func: Tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = f"{os.path.basename(filename)}:{lineno}({name})"
+    return label.replace(";", ",")
+
+
+def hot_functions(stats: "pstats.Stats", sort: str = "tottime", limit: int = 15) -> List[dict]:
+    """
+    Fungsi terpanas dari hasil cProfile
+
+    Returns:
+        List dict function, calls, tottime, cumtime, diurutkan menurut `sort`
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"sort harus salah satu dari {', '.join(SORT_KEYS)}")
+    rows = [
+        {"function": _label(func), "calls": nc, "tottime": tt, "cumtime": ct}
+        for func, (cc, nc, tt, ct, callers) in stats.stats.items()
+    ]
+    field = {"cumulative": "cumtime"}.get(sort, sort)
+    rows.sort(key=lambda row: row[field], reverse=True)
+    return rows[:limit]
+
+
+def collapsed_stacks(stats: "pstats.Stats") -> List[str]:
+    """
+    Turunkan collapsed stack dari graf caller/callee cProfile
+
+    cProfile hanya menyimpan waktu per pasangan (caller, callee), bukan
+    stack lengkap, sehingga waktu sebuah fungsi dibagi ke setiap jalur
+    secara proporsional terhadap waktu kumulatif edge yang dilalui. Hasilnya
+    akurat untuk graf berbentuk pohon dan berupa estimasi jika satu fungsi
+    dipanggil dari banyak tempat.
+
+    Returns:
+        Baris "frame;frame;... <mikrodetik>" yang siap untuk flamegraph.pl
+    """
+    raw = stats.stats
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+
+    weights: Dict[Tuple[str, ...], float] = defaultdict(float)
+
+    def walk(func, path, seen, scale):
+        _, _, tt, _, _ = raw[func]
+        path = path + (_label(func),)
+        weights[path] += tt * scale
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for child, edge in callees.get(func, {}).items():
+            child_ct = raw[child][3]
+            if child in seen or child_ct <= 0:
+                continue
+            walk(child, path, seen | {child}, scale * edge[3] / child_ct)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            walk(func, (), frozenset([func]), 1.0)
+
+    return [f"{';'.join(path)} {round(seconds * 1e6)}"
+            for path, seconds in sorted(weights.items()) if round(seconds * 1e6) > 0]
+
+
+def profile_cpu(run: Callable[[], object]) -> Tuple["pstats.Stats", float]:
+    """Jalankan `run` di bawah cProfile; kembalikan (stats, detik)"""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.runcall(run)
+    elapsed = time.perf_counter() - start
+    return pstats.Stats(profiler), elapsed
+
+
+def profile_memory(run: Callable[[], object], top: int = 5) -> dict:
+    """
+    Jalankan `run` di bawah tracemalloc
+
+    Hasil `run` tetap hidup sampai pengukuran selesai, sehingga net_bytes
+    mencakup output operasi (mis. list tanda tangan). Di Python 3.8
+    (tanpa tracemalloc.reset_peak) puncak hanya akurat jika tracemalloc
+    belum aktif sebelumnya, karena puncak lama tidak bisa di-reset.
+
+    Returns:
+        Dict peak_bytes, net_bytes dan top_allocations [(lokasi, byte), ...]
+    """
+    import tracemalloc
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        before_snapshot = tracemalloc.take_snapshot()
+        before, _ = tracemalloc.get_traced_memory()
+        result = run()
+        current, peak = tracemalloc.get_traced_memory()
+        after_snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+    del result
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after_snapshot.filter_traces(filters).compare_to(
+        before_snapshot.filter_traces(filters), "lineno")
+    top_allocations = [
+        (f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+         stat.size_diff)
+        for stat in diff[:top] if stat.size_diff > 0
+    ]
+    return {
+        "peak_bytes": peak - before,
+        "net_bytes": current - before,
+        "top_allocations": top_allocations,
+    }
+
+
+def profile_workload(ds: "DigitalSignature", sc: "SubliminalChannel",
+                     operations: Sequence[str] = OPERATIONS, count: int = 1000,
+                     batch_size: int = 256, seed: int = 0, cpu: bool = True,
+                     memory: bool = True) -> Dict[str, dict]:
+    """
+    Profil setiap operasi workload
+
+    Returns:
+        Dict operasi -> {"items", "seconds", "stats" (pstats.Stats atau None),
+        "peak_bytes", "net_bytes", "top_allocations"} (kunci memori hanya
+        jika memory=True)
+    """
+    workload = build_workload(ds, sc, operations, count, batch_size, seed)
+    results = {}
+    for name, run in workload.items():
+        result = {"items": count, "seconds": None, "stats": None}
+        if cpu:
+            result["stats"], result["seconds"] = profile_cpu(run)
+        if memory:
+            result.update(profile_memory(run))
+        results[name] = result
+    return results
+
+
+def format_report(results: Dict[str, dict], sort: str = "tottime", limit: int = 15) -> str:
+    """Format hasil profile_workload sebagai teks"""
+    lines = []
+    for name, result in results.items():
+        items = result["items"]
+        lines.append(f"=== {name} ({items} item) ===")
+        if result["stats"] is not None:
+            per_item = result["seconds"] / items * 1e6
+            lines.append(f"⏱️  {result['seconds']:.3f} detik ({per_item:.1f} µs/item, dengan overhead profiler)")
+            lines.append(f"{'calls':>10} {'tottime':>9} {'cumtime':>9}  function")
+            for row in hot_functions(result["stats"], sort, limit):
+                lines.append(f"{row['calls']:>10} {row['tottime']:>9.4f} {row['cumtime']:>9.4f}  "
+                             f"{row['function']}")
+        if "peak_bytes" in result:
+            lines.append(f"💾 peak {result['peak_bytes']:,} B ({result['peak_bytes'] / items:,.0f} B/item), "
+                         f"net {result['net_bytes']:,} B")
+            for location, size in result["top_allocations"]:
+                lines.append(f"{size:>12,} B  {location}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_outputs(results: Dict[str, dict], output_dir: str) -> List[str]:
+    """
+    Tulis <operasi>.collapsed dan <operasi>.pstats (untuk snakeviz/pstats)
+
+    Returns:
+        Daftar file yang ditulis
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for name, result in results.items():
+        if result["stats"] is None:
+            continue
+        collapsed = os.path.join(output_dir, f"{name}.collapsed")
+        with open(collapsed, "w") as f:
+            f.write("\n".join(collapsed_stacks(result["stats"])) + "\n")
+        dump = os.path.join(output_dir, f"{name}.pstats")
+        result["stats"].dump_stats(dump)
+        written += [collapsed, dump]
+    return written
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Argumen bersama untuk script ini dan `cli.py profile`"""
+    parser.add_argument("--key", help="file kunci privat (default: buat kunci baru)")
+    parser.add_argument("--bits", type=int, default=1024, help="panjang kunci baru")
+    parser.add_argument("--composite", action="store_true", help="kunci baru n = p * q")
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--count", type=int, default=1000, help="item per operasi")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=("cpu", "memory", "both"), default="both")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="tottime")
+    parser.add_argument("--top", type=int, default=15, help="baris tabel fungsi terpanas")
+    parser.add_argument("--output-dir", help="tulis collapsed stack dan file .pstats")
+
+
+def run(args) -> int:
+    """Jalankan profiling dari argumen hasil add_arguments"""
+    import random
+    from ong_schnorr_shamir import DigitalSignature, SubliminalChannel
+
+    if args.key:
+        ds = DigitalSignature.from_key_file(args.key)
+        sc = SubliminalChannel.from_key_file(args.key)
+    else:
+        ds = DigitalSignature(composite=args.composite, bits=args.bits,
+                              rng=random.Random(args.seed))
+        factors = (ds._p, ds._q) if ds.is_composite else None
+        sc = SubliminalChannel(n=ds.n, k=ds.k, factors=factors)
+    results = profile_workload(ds, sc, args.ops, args.count, args.batch_size, args.seed,
+                               cpu=args.mode in ("cpu", "both"),
+                               memory=args.mode in ("memory", "both"))
+    print(format_report(results, args.sort, args.top))
+    if args.output_dir:
+        for path in write_outputs(results, args.output_dir):
+            print(f"📄 {path}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profiling workload Ong-Schnorr-Shamir")
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())